@@ -41,6 +41,7 @@ __all__ = (
     'loggers',
     'objects',
     'Field',
+    'FrozenObject',
     'Object'
     )
 
@@ -53,4 +54,4 @@ from . import loggers
 from . import objects
 
 from . loggers import log
-from . objects import Field, Object
+from . objects import Field, FrozenObject, Object
@@ -32,9 +32,33 @@ class Constants:
 
     """
 
+    COMPACT_REPR = lib.os.getenv('COMPACT_REPR', 'false').lower() == 'true'
+    """
+    Default, package-wide serialization mode.
+
+    ---
+
+    If `True`, `__repr__`, log messages, etc. are serialized without \
+    indentation or key sorting, and strings are not wrapped. Values \
+    of sensitive keys, and any string that looks sensitive itself \
+    (i.e. an access token), are redacted either way.
+
+    """
+
     UNDEFINED = f'[[{PACAKGE.upper()}_DEFAULT_PLACEHOLDER]]'
     """Placeholder for undefined values that should not be `None`."""
 
+    MAX_CACHED_TYPES = 4096
+    """
+    Maximum number of entries in caches keyed by type hint.
+
+    ---
+
+    Caches are cleared once full, so hints of classes created at \
+    runtime are not held indefinitely.
+
+    """
+
     ENV = lib.os.getenv('ENV', 'local').lower()
     """The lowered name of our runtime environment."""
 
@@ -59,8 +83,12 @@ class Constants:
     __DATACLASS_FIELDS__: 'typ.string[typ.snake_case]' = '__dataclass_fields__'
     __DICT__: 'typ.string[typ.snake_case]' = '__dict__'
     __HERITAGE__: 'typ.string[typ.snake_case]' = '__heritage__'
+    __LINEAGE__: 'typ.string[typ.snake_case]' = '__lineage__'
     __SLOTS__: 'typ.string[typ.snake_case]' = '__slots__'
     __MODULE__: 'typ.string[typ.snake_case]' = '__module__'
+    __CACHE__: 'typ.string[typ.snake_case]' = '__cache__'
+    __MEMO__: 'typ.string[typ.snake_case]' = '__memo__'
+    __HASH__: 'typ.string[typ.snake_case]' = '__hash__'
 
     FIELDS: 'typ.string[typ.snake_case]' = 'fields'
     ENUMERATIONS: 'typ.string[typ.snake_case]' = 'enumerations'
@@ -4,6 +4,7 @@ __all__ = (
     'cfg',
     'enm',
     'lib',
+    'obj',
     'typ',
     'utl',
     )
@@ -11,5 +12,6 @@ __all__ = (
 from . import cfg
 from . import enm
 from . import lib
+from . import obj
 from . import typ
 from . import utl
@@ -2,6 +2,7 @@
 
 __all__ = (
     'Constants',
+    'Encoders',
     )
 
 from .. import cfg
@@ -16,13 +17,72 @@ def _isoformat_encoder(
     return o.isoformat()
 
 
+class Encoders(lib.collections.UserDict[type[lib.t.Any], typ.Encoder]):
+    """
+    Encoders keyed by type, alongside the encoders resolved from them \
+    per type, which are cleared whenever encoders are modified.
+
+    """
+
+    def __init__(
+        self,
+        __encoders: lib.t.Mapping[type[lib.t.Any], typ.Encoder]
+        ):
+        self.resolved: (
+            'lib.weakref.WeakKeyDictionary[type, typ.Encoder | None]'
+            ) = lib.weakref.WeakKeyDictionary()
+        super().__init__(__encoders)
+
+    def __setitem__(self, key: type[lib.t.Any], item: typ.Encoder) -> None:
+        self.data[key] = item
+        self.resolved.clear()
+        return None
+
+    def __delitem__(self, key: type[lib.t.Any]) -> None:
+        del self.data[key]
+        self.resolved.clear()
+        return None
+
+    def __ior__(  # type: ignore[misc, override]
+        self,
+        other: lib.t.Mapping[type[lib.t.Any], typ.Encoder]
+        ) -> lib.Self:
+        self.update(other)
+        return self
+
+
 class Constants(cfg.Constants):
     """Constant values shared across core codecs modules."""
 
-    ENCODERS: dict[
-        type[lib.t.Any],
-        lib.t.Callable[[lib.t.Any], typ.Serial]
-        ] = {
+    BINARY_FIXED_KINDS: dict[type[lib.t.Any], str] = {
+        bool: '?',
+        float: 'd',
+        int: 'q',
+        }
+    """`struct` formats for fields stored inline in binary rows."""
+    BINARY_OFFSET = 'I'
+    """`struct` format for offsets and lengths in binary rows."""
+
+    STREAM_CHUNK_SIZE = 1 << 16
+    """Number of characters buffered by stream encoders between writes."""
+
+    ASYNC_BATCH_SIZE = 1024
+    """Number of values parsed per batch by async stream decoders."""
+
+    LAZY_DECODING = lib.os.getenv('LAZY_DECODING', 'false').lower() == 'true'
+    """
+    Default, package-wide decoding mode for nested `Object` fields.
+
+    ---
+
+    If `True`, `utl.parse()` leaves `Object`, array and mapping \
+    fields of parsed `Objects` as raw, decoded JSON, which is only \
+    parsed and validated on first access of the field.
+
+    """
+
+    ENCODERS = Encoders(
+        {
             bytes: lambda o: getattr(o, 'decode')(),
             lib.datetime.date: _isoformat_encoder,
             lib.datetime.datetime: _isoformat_encoder,
@@ -44,3 +104,13 @@ class Constants(cfg.Constants):
             set: list,
             lib.uuid.UUID: str,
             }
+        )
+    """
+    Encoders per type, used by `utl.encode()`.
+
+    ---
+
+    Modify with `utl.register_encoder()` (or as a `dict`); encoders \
+    resolved from these are cleared on any modification.
+
+    """
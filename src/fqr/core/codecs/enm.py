@@ -19,6 +19,9 @@ class ParseErrorRef(lib.enum.Enum):
 
     """
 
+    binary_decode         = typ.ErrorRef(
+        'Could not decode binary row: `invalid schema fingerprint`.'
+        )
     bool_decode           = typ.ErrorRef(
         'Could not decode valid JSON string to python `bool`.'
         )
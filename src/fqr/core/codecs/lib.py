@@ -3,18 +3,34 @@
 from .. import lib
 
 __all__ = (
+    'asyncio',
+    'codecs',
     'collections',
+    'concurrent',
+    'inspect',
+    'io',
     'ipaddress',
     'numbers',
     'pathlib',
+    'struct',
     'uuid',
+    'weakref',
+    'zlib',
     *lib.__all__
     )
 
+import asyncio
+import codecs
 import collections.abc
+import concurrent.futures
+import inspect
+import io
 import ipaddress
 import numbers
 import pathlib
+import struct
 import uuid
+import weakref
+import zlib
 
 from .. lib import *
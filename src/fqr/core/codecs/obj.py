@@ -0,0 +1,891 @@
+"""Codecs objects."""
+
+__all__ = (
+    'AsyncStreamDecoder',
+    'AsyncStreamEncoder',
+    'BinaryLayout',
+    'BinaryRecord',
+    'JsonBackend',
+    'LazyValue',
+    'StreamEncoder',
+    )
+
+from . import cfg
+from . import enm
+from . import lib
+from . import typ
+from . import utl
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    MEMO_LAYOUT = 'layout'
+    """Key of binary row layouts in the memo of an `Object` class."""
+
+    BINARY_OFFSET_KINDS = frozenset(('j', 'o', 's'))
+    """Kinds of fields stored as offsets to length-prefixed values."""
+
+    OFFSET = lib.struct.Struct(f'<{cfg.Constants.BINARY_OFFSET}')
+    """`struct` for offsets, lengths and fingerprints in binary rows."""
+
+    NULLS_OFFSET = OFFSET.size
+    """Position of the null bitmap in binary rows."""
+
+    JSON_NESTING = lib.re.compile(r'[\[\]{}"]')
+    """Characters opening or closing nested JSON values (or strings)."""
+
+    JSON_NON_WHITESPACE = lib.re.compile(r'[^ \t\n\r]')
+    """Any character but whitespace allowed between JSON tokens."""
+
+    JSON_SCALAR_END = lib.re.compile(r'[ \t\n\r,\]}]')
+    """Characters ending JSON numbers and literals."""
+
+    JSON_STRING_END = lib.re.compile(r'(?:[^"\\]|\\.)*"', lib.re.DOTALL)
+    """Remainder of a JSON string, following its opening quote."""
+
+
+def _json_default(o: lib.t.Any) -> typ.SnakeDict | typ.Serial:
+    if typ.utl.check.is_object(o):
+        return o.to_dict()
+    return utl.encode(o)
+
+
+def _is_packable(slot: lib.struct.Struct, value: lib.t.Any) -> bool:
+    try:
+        slot.pack(value)
+    except lib.struct.error:
+        return False
+    return True
+
+
+def _skip_json_whitespace(text: str, position: int) -> int:
+    if (match := Constants.JSON_NON_WHITESPACE.search(text, position)):
+        return match.start()
+    return len(text)
+
+
+def _find_json_end(text: str, position: int, final: bool) -> int:
+    # Returns the end of the JSON value starting at `position`, or -1
+    # if it may continue past the end of `text`. Values are delimited
+    # only; they are validated once decoded.
+    if (char := text[position]) == '"':
+        match = Constants.JSON_STRING_END.match(text, position + 1)
+        return -1 if match is None else match.end()
+    elif char not in '[{':
+        if (match := Constants.JSON_SCALAR_END.search(text, position)):
+            return match.start()
+        return len(text) if final else -1
+
+    depth = 0
+    while (match := Constants.JSON_NESTING.search(text, position)):
+        if (char := match.group()) == '"':
+            if (
+                string := Constants.JSON_STRING_END.match(text, match.end())
+                ) is None:
+                return -1
+            position = string.end()
+            continue
+        depth += 1 if char in '[{' else -1
+        position = match.end()
+        if depth == 0:
+            return position
+    return -1
+
+
+class BinaryLayout:
+    """
+    Binary row layout for an `Object` class.
+
+    ---
+
+    Rows are little-endian and laid out as follows:
+
+    * A 4-byte schema fingerprint.
+    * A null bitmap, with one bit per field.
+    * A fixed-width slot per field, in `fields` order, holding \
+    `bool` (1 byte), `int` (8 bytes) and `float` (8 bytes) values \
+    inline, and a 4-byte offset for all other values.
+    * Length-prefixed values for offset fields: `str` as UTF-8, \
+    nested `Objects` as binary rows and all else as JSON.
+
+    """
+
+    __slots__ = (
+        'cls',
+        'fields',
+        'fingerprint',
+        'index',
+        'kinds',
+        'slots',
+        'struct',
+        'types',
+        )
+
+    def __init__(self, cls: type[typ.Object]):
+        self.cls = cls
+        self.fields: typ.FieldsTuple = cls.fields
+        self.fingerprint = utl.get_schema_fingerprint(cls)
+        self.index: dict[str, int] = {
+            field: i
+            for i, field
+            in enumerate(self.fields)
+            }
+        kinds: list[str] = []
+        types: list[lib.t.Any] = []
+        for field in self.fields:
+            tp = cls.__dataclass_fields__[field]['type']
+            tps = [
+                t
+                for t
+                in typ.utl.check.get_checkable_types(tp)
+                if t is not typ.NoneType
+                ]
+            if lib.t.Any in tps:
+                kinds.append('j')
+                types.append(None)
+            elif len(tps) == 1 and tps[0] in Constants.BINARY_FIXED_KINDS:
+                kinds.append(Constants.BINARY_FIXED_KINDS[tps[0]])
+                types.append(tps[0])
+            elif len(tps) == 1 and tps[0] is str:
+                kinds.append('s')
+                types.append(str)
+            elif len(tps) == 1 and typ.utl.check.is_object(tps[0]):
+                kinds.append('o')
+                types.append(tps[0])
+            else:
+                kinds.append('j')
+                types.append(tp)
+        self.kinds = tuple(kinds)
+        self.types = tuple(types)
+        self.struct = lib.struct.Struct(
+            ''.join(
+                (
+                    '<',
+                    Constants.BINARY_OFFSET,
+                    f'{(len(self.fields) + 7) // 8}s',
+                    *(
+                        kind
+                        if kind in Constants.BINARY_FIXED_KINDS.values()
+                        else Constants.BINARY_OFFSET
+                        for kind
+                        in self.kinds
+                        )
+                    )
+                )
+            )
+        self.slots: list[tuple[lib.struct.Struct, int]] = []
+        offset = Constants.NULLS_OFFSET + (len(self.fields) + 7) // 8
+        for kind in self.kinds:
+            slot = lib.struct.Struct(
+                '<' + (
+                    kind
+                    if kind in Constants.BINARY_FIXED_KINDS.values()
+                    else Constants.BINARY_OFFSET
+                    )
+                )
+            self.slots.append((slot, offset))
+            offset += slot.size
+
+    @classmethod
+    def get(cls, __cls: type[typ.Object]) -> 'BinaryLayout':
+        """Return cached layout for `Object` class."""
+
+        memo = utl.get_memo(__cls)
+        if (layout := memo.get(Constants.MEMO_LAYOUT)) is None:
+            layout = memo[Constants.MEMO_LAYOUT] = cls(__cls)
+
+        return layout
+
+    def pack(self, __object: typ.Object) -> bytes:
+        """
+        Encode `Object` as a binary row.
+
+        ---
+
+        Raises `BinaryEncodingError` naming the field if a value cannot \
+        be packed in its fixed-size slot (e.g. an `int` that does not \
+        fit in 8 bytes, or a `str` in a `float` field).
+
+        """
+
+        nulls = 0
+        slots: list[lib.t.Any] = []
+        chunks: list[bytes] = []
+        offset = self.struct.size
+        for i, (field, kind, tp) in enumerate(
+            zip(self.fields, self.kinds, self.types)
+            ):
+            if (value := getattr(__object, field)) is None:
+                nulls |= 1 << i
+                slots.append(0)
+                continue
+            elif kind == 's':
+                payload = value.encode()
+            elif kind == 'o':
+                payload = self.get(tp).pack(value)
+            elif kind == 'j':
+                payload = utl.dumps_json(value, _json_default).encode()
+            else:
+                slots.append(value)
+                continue
+            slots.append(offset)
+            chunks.append(Constants.OFFSET.pack(len(payload)))
+            chunks.append(payload)
+            offset += Constants.OFFSET.size + len(payload)
+
+        try:
+            header = self.struct.pack(
+                self.fingerprint,
+                nulls.to_bytes((len(self.fields) + 7) // 8, 'little'),
+                *slots
+                )
+        except lib.struct.error as exception:
+            from ... import objects
+            field, value = next(
+                (field, value)
+                for field, (slot, _), value
+                in zip(self.fields, self.slots, slots)
+                if not _is_packable(slot, value)
+                )
+            raise objects.exc.BinaryEncodingError(
+                field,
+                value
+                ) from exception
+
+        return b''.join((header, *chunks))
+
+    def read(self, __buffer: memoryview, __index: int) -> lib.t.Any:
+        """Decode only the field at `index` from binary row `buffer`."""
+
+        if (
+            __buffer[Constants.NULLS_OFFSET + (__index >> 3)]
+            >> (__index & 7)
+            & 1
+            ):
+            return None
+
+        slot, offset = self.slots[__index]
+        return self._read_value(
+            __buffer,
+            __index,
+            slot.unpack_from(__buffer, offset)[0]
+            )
+
+    def unpack(self, __buffer: memoryview) -> dict[str, lib.t.Any]:
+        """Decode all fields from binary row `buffer`."""
+
+        _, nulls_bytes, *slots = self.struct.unpack_from(__buffer)
+        nulls = int.from_bytes(nulls_bytes, 'little')
+        return {
+            field: (
+                None
+                if nulls >> i & 1
+                else self._read_value(__buffer, i, value)
+                )
+            for i, (field, value)
+            in enumerate(zip(self.fields, slots))
+            }
+
+    def _read_value(
+        self,
+        __buffer: memoryview,
+        __index: int,
+        __slot: lib.t.Any
+        ) -> lib.t.Any:
+        """Decode non-null value from its slot in binary row `buffer`."""
+
+        if (kind := self.kinds[__index]) not in Constants.BINARY_OFFSET_KINDS:
+            return __slot
+
+        start = __slot + Constants.OFFSET.size
+        payload = __buffer[
+            start
+            :
+            start + Constants.OFFSET.unpack_from(__buffer, __slot)[0]
+            ]
+        if kind == 's':
+            return str(payload, 'utf-8')
+        elif kind == 'o':
+            return BinaryRecord.from_buffer(self.types[__index], payload)
+        elif (tp := self.types[__index]) is None:
+            return utl.loads_json(payload)
+        else:
+            return utl.parse(utl.loads_json(payload), tp)
+
+
+class BinaryRecord(lib.collections.abc.Mapping[str, lib.t.Any]):
+    """
+    Read-only, lazy view of a binary row.
+
+    ---
+
+    Fields are decoded from the underlying `memoryview` only when \
+    accessed; nested `Objects` are returned as `BinaryRecords`.
+
+    """
+
+    __slots__ = ('buffer', 'layout')
+
+    def __init__(self, layout: BinaryLayout, buffer: memoryview):
+        self.buffer = buffer
+        self.layout = layout
+
+    def __getitem__(self, __key: str) -> lib.t.Any:
+        return self.layout.read(self.buffer, self.layout.index[__key])
+
+    def __iter__(self) -> lib.t.Iterator[str]:
+        return iter(self.layout.fields)
+
+    def __len__(self) -> int:
+        return len(self.layout.fields)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}[{self.layout.cls.__name__}]'
+
+    @classmethod
+    def from_buffer(
+        cls,
+        __cls: type[typ.Object],
+        __buffer: memoryview
+        ) -> 'BinaryRecord | enm.ParseErrorRef':
+        """
+        Return a view of binary row `buffer` for `Object` class, \
+        returning `enm.ParseErrorRef` if its fingerprint differs.
+
+        """
+
+        layout = BinaryLayout.get(__cls)
+        if (
+            len(__buffer) < layout.struct.size
+            or Constants.OFFSET.unpack_from(__buffer)[0] != layout.fingerprint
+            ):
+            return enm.ParseErrorRef.binary_decode
+
+        return cls(layout, __buffer)
+
+    def to_object(self) -> typ.Object:
+        """Decode all fields, returning an instance of the `Object` class."""
+
+        return self.layout.cls(
+            **{
+                field: (
+                    value.to_object()
+                    if isinstance(value, BinaryRecord)
+                    else value
+                    )
+                for field, value
+                in self.layout.unpack(self.buffer).items()
+                }
+            )
+
+
+class JsonBackend:
+    """
+    JSON encoder and decoder used for all fqr JSON I/O.
+
+    ---
+
+    `dumps(value, default, indent, sort_keys)` must return the same \
+    `str` as `json.dumps()` given the same arguments, with separators \
+    `(',', ':')` if `indent` is `None` and `(',', ': ')` otherwise. \
+    `loads(str | bytes)` must return the same value as `json.loads()`.
+
+    Either may raise an `Exception` for any input it does not \
+    support, in which case the stdlib is used for that call instead.
+
+    ---
+
+    Usage
+    -----
+
+    ```py
+    import orjson
+
+    def dumps(value, default, indent, sort_keys):
+        if indent not in (None, 2):
+            raise NotImplementedError
+        ...
+        return orjson.dumps(value, default=default, option=...).decode()
+
+    fqr.core.codecs.utl.register_json_backend(
+        fqr.core.codecs.obj.JsonBackend('orjson', dumps, orjson.loads)
+        )
+
+    ```
+
+    """
+
+    __slots__ = ('dumps', 'loads', 'name')
+
+    def __init__(
+        self,
+        name: str,
+        dumps: typ.JsonDumps,
+        loads: typ.JsonLoads
+        ):
+        self.dumps = dumps
+        self.loads = loads
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}[{self.name}]'
+
+
+class LazyValue:
+    """
+    Raw, decoded JSON value of an `Object` field, parsed and \
+    validated through the type of the field on first access.
+
+    ---
+
+    Created by `utl.parse()` if `Constants.LAZY_DECODING` is `True`.
+
+    """
+
+    __slots__ = ('value', )
+
+    def __init__(self, value: typ.Serial):
+        self.value = value
+
+
+class StreamEncoder:
+    """
+    Incremental JSON encoder, writing `Objects`, arrays and mappings \
+    to a binary or text stream.
+
+    ---
+
+    Values are written as the items of a single JSON array or, if \
+    `ndjson` is `True`, one per line. Encoded chunks are buffered and \
+    written once `chunk_size` characters are pending, so memory use \
+    is bounded by the largest single value rather than the total \
+    written.
+
+    Values are encoded with `utl.dumps_json()`: `Objects` with \
+    `to_dict()` and all other non-JSON types with `utl.encode()`.
+
+    `binary` defaults to `True` unless `stream` is an `io.TextIOBase`.
+
+    When used as a context manager, the array is only terminated if \
+    the block exits without an exception; otherwise pending chunks \
+    are flushed as-is, so a failed write is not mistaken for a \
+    complete result.
+
+    ---
+
+    Usage
+    -----
+
+    ```py
+    with StreamEncoder(stream) as encoder:
+        encoder.write_all(objects)
+
+    ```
+
+    """
+
+    __slots__ = (
+        'binary',
+        'buffer',
+        'buffered',
+        'chunk_size',
+        'closed',
+        'count',
+        'ndjson',
+        'stream',
+        )
+
+    def __init__(
+        self,
+        stream: lib.t.IO[lib.t.Any],
+        ndjson: bool = False,
+        chunk_size: int = Constants.STREAM_CHUNK_SIZE,
+        binary: lib.t.Optional[bool] = None
+        ):
+        self.binary = (
+            not isinstance(stream, lib.io.TextIOBase)
+            if binary is None
+            else binary
+            )
+        self.buffer: list[str] = []
+        self.buffered = 0
+        self.chunk_size = chunk_size
+        self.closed = False
+        self.count = 0
+        self.ndjson = ndjson
+        self.stream = stream
+
+    def __enter__(self) -> 'StreamEncoder':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: lib.t.Optional[type[BaseException]],
+        *args: lib.t.Any
+        ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.closed = True
+            self.flush()
+
+    def _push(self, __chunk: str) -> None:
+        self.buffer.append(__chunk)
+        self.buffered += len(__chunk)
+        if self.buffered >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered chunks to `stream`."""
+
+        if self.buffer:
+            chunk = ''.join(self.buffer)
+            self.stream.write(chunk.encode() if self.binary else chunk)
+            self.buffer.clear()
+            self.buffered = 0
+
+    def write(self, __value: lib.t.Any) -> None:
+        """Encode and buffer a single value."""
+
+        if not self.ndjson:
+            self._push(',' if self.count else '[')
+        self._push(utl.dumps_json(__value, _json_default))
+        if self.ndjson:
+            self._push('\n')
+        self.count += 1
+
+    def write_all(self, __values: lib.t.Iterable[lib.t.Any]) -> None:
+        """Encode and buffer each value of an iterable, in order."""
+
+        for value in __values:
+            self.write(value)
+
+    def close(self) -> None:
+        """Terminate the JSON array (if any) and flush."""
+
+        if self.closed:
+            return None
+        self.closed = True
+        if not self.ndjson:
+            self._push(']' if self.count else '[]')
+        self.flush()
+
+
+class AsyncStreamEncoder:
+    """
+    Async counterpart of `StreamEncoder`, writing to an \
+    `asyncio.StreamWriter` or any stream with a `write()` method \
+    (or coroutine method).
+
+    ---
+
+    Values are encoded and buffered as with `StreamEncoder`, and each \
+    chunk is written (and awaited, along with `stream.drain()` if \
+    defined) once `chunk_size` characters are pending.
+
+    `binary` defaults to `True`.
+
+    As with `StreamEncoder`, the array is only terminated if the \
+    `async with` block exits without an exception.
+
+    ---
+
+    Usage
+    -----
+
+    ```py
+    async with AsyncStreamEncoder(writer, ndjson=True) as encoder:
+        await encoder.write_all(objects)
+
+    ```
+
+    """
+
+    __slots__ = ('buffer', 'encoder', 'stream')
+
+    def __init__(
+        self,
+        stream: lib.t.Any,
+        ndjson: bool = False,
+        chunk_size: int = Constants.STREAM_CHUNK_SIZE,
+        binary: bool = True
+        ):
+        self.buffer: lib.io.BytesIO | lib.io.StringIO = (
+            lib.io.BytesIO() if binary else lib.io.StringIO()
+            )
+        self.encoder = StreamEncoder(self.buffer, ndjson, chunk_size, binary)
+        self.stream = stream
+
+    async def __aenter__(self) -> 'AsyncStreamEncoder':
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: lib.t.Optional[type[BaseException]],
+        *args: lib.t.Any
+        ) -> None:
+        self.encoder.__exit__(exc_type, *args)
+        if self.buffer.tell():
+            await self._drain()
+
+    @property
+    def count(self) -> int:
+        """Number of values written."""
+
+        return self.encoder.count
+
+    async def _drain(self) -> None:
+        chunk = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        if lib.inspect.isawaitable(written := self.stream.write(chunk)):
+            await written
+        if (drain := getattr(self.stream, 'drain', None)) is not None:
+            await drain()
+
+    async def flush(self) -> None:
+        """Write all buffered chunks to `stream`."""
+
+        self.encoder.flush()
+        if self.buffer.tell():
+            await self._drain()
+
+    async def write(self, __value: lib.t.Any) -> None:
+        """Encode and buffer a single value."""
+
+        self.encoder.write(__value)
+        if self.buffer.tell():
+            await self._drain()
+
+    async def write_all(
+        self,
+        __values: lib.t.Iterable[lib.t.Any] | lib.t.AsyncIterable[lib.t.Any]
+        ) -> None:
+        """Encode and buffer each value of an (async) iterable, in order."""
+
+        if isinstance(__values, lib.t.AsyncIterable):
+            async for value in __values:
+                await self.write(value)
+        else:
+            for value in __values:
+                await self.write(value)
+
+    async def close(self) -> None:
+        """Terminate the JSON array (if any) and flush."""
+
+        self.encoder.close()
+        if self.buffer.tell():
+            await self._drain()
+
+
+class AsyncStreamDecoder(lib.t.Generic[typ.AnyType]):
+    """
+    Async iterator of values of `tp`, decoded from a JSON array or \
+    newline-delimited JSON read from an `asyncio.StreamReader` or \
+    any async iterable of `bytes`.
+
+    ---
+
+    `ndjson` is detected from the first character read, unless set: \
+    input starting with `[` is decoded as a JSON array. Blank lines \
+    are ignored.
+
+    Values are decoded with `utl.loads_json()` (so with any registered \
+    JSON backend) and parsed with `utl.parse()` in batches of \
+    `batch_size` values, yielding `enm.ParseErrorRef` for any value \
+    that cannot be parsed (or for the rest of the input, if not valid \
+    JSON). Anything but whitespace following a JSON array is invalid.
+
+    Batches are parsed in `executor` if provided (which may be a \
+    `concurrent.futures.ProcessPoolExecutor` if `tp` can be pickled), \
+    otherwise on the event loop, yielding control between batches.
+
+    ---
+
+    Usage
+    -----
+
+    ```py
+    async for pet in AsyncStreamDecoder(reader, Pet, executor=pool):
+        ...
+
+    ```
+
+    """
+
+    __slots__ = (
+        'batch_size',
+        'chunk_size',
+        'executor',
+        'ndjson',
+        'source',
+        'tp',
+        )
+
+    def __init__(
+        self,
+        source: lib.asyncio.StreamReader | lib.t.AsyncIterable[bytes],
+        tp: type[typ.AnyType],
+        ndjson: lib.t.Optional[bool] = None,
+        executor: lib.t.Optional[lib.concurrent.futures.Executor] = None,
+        batch_size: int = Constants.ASYNC_BATCH_SIZE,
+        chunk_size: int = Constants.STREAM_CHUNK_SIZE
+        ):
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.executor = executor
+        self.ndjson = ndjson
+        self.source = source
+        self.tp = tp
+
+    def __aiter__(
+        self
+        ) -> lib.t.AsyncIterator[typ.AnyType | enm.ParseErrorRef]:
+        return self._decode()
+
+    async def _read(self) -> lib.t.AsyncIterator[bytes]:
+        if isinstance(self.source, lib.asyncio.StreamReader):
+            while (chunk := await self.source.read(self.chunk_size)):
+                yield chunk
+        else:
+            async for chunk in self.source:
+                yield chunk
+
+    async def _decode(
+        self
+        ) -> lib.t.AsyncIterator[typ.AnyType | enm.ParseErrorRef]:
+        chunks = self._read()
+        head = b''
+        async for chunk in chunks:
+            if (head := head + chunk).strip():
+                break
+        ndjson = (
+            not head.lstrip().startswith(b'[')
+            if self.ndjson is None
+            else self.ndjson
+            )
+        values: lib.t.AsyncIterator[str | bytes | enm.ParseErrorRef] = (
+            self._split_lines(head, chunks)
+            if ndjson
+            else self._split_array(head, chunks)
+            )
+
+        loop = lib.asyncio.get_running_loop()
+        batch: list[str | bytes | enm.ParseErrorRef] = []
+        async for value in values:
+            batch.append(value)
+            if len(batch) < self.batch_size:
+                continue
+            for parsed in await self._parse(loop, batch):
+                yield parsed
+            batch = []
+        if batch:
+            for parsed in await self._parse(loop, batch):
+                yield parsed
+
+    async def _parse(
+        self,
+        __loop: lib.asyncio.AbstractEventLoop,
+        __batch: list[str | bytes | enm.ParseErrorRef]
+        ) -> list[typ.AnyType | enm.ParseErrorRef]:
+        if self.executor is not None:
+            return await __loop.run_in_executor(
+                self.executor,
+                utl._parse_rows,
+                __batch,
+                self.tp
+                )
+        await lib.asyncio.sleep(0)
+        return utl._parse_rows(__batch, self.tp)
+
+    @staticmethod
+    async def _split_lines(
+        __head: bytes,
+        __chunks: lib.t.AsyncIterator[bytes]
+        ) -> lib.t.AsyncIterator[bytes]:
+        # Yields raw lines, joining those split across chunks.
+        pending: list[bytes] = []
+        chunk: lib.t.Optional[bytes] = __head
+        while chunk is not None:
+            *lines, tail = chunk.split(b'\n')
+            if lines:
+                lines[0] = b''.join((*pending, lines[0]))
+                pending.clear()
+                for line in lines:
+                    if line and not line.isspace():
+                        yield line
+            pending.append(tail)
+            chunk = await anext(__chunks, None)
+        if (line := b''.join(pending)) and not line.isspace():
+            yield line
+
+    @staticmethod
+    async def _split_array(
+        __head: bytes,
+        __chunks: lib.t.AsyncIterator[bytes]
+        ) -> lib.t.AsyncIterator[str | enm.ParseErrorRef]:
+        # Yields the raw text of each item of a top-level JSON array.
+        # Incomplete items are retried once the pending text has
+        # doubled, so items spanning many chunks are not rescanned
+        # repeatedly.
+        decoder = lib.codecs.getincrementaldecoder('utf-8')()
+        text = decoder.decode(__head)
+        position = _skip_json_whitespace(text, 0)
+        if not text.startswith('[', position):
+            yield enm.ParseErrorRef.invalid_json
+            return
+        position += 1
+        retry_at = 0
+        items = 0
+        expect_value = True
+        final = False
+        while True:
+            while True:
+                position = _skip_json_whitespace(text, position)
+                if position == len(text):
+                    break
+                elif (char := text[position]) == ']' and not (
+                    expect_value and items
+                    ):
+                    # Only whitespace may follow the array.
+                    position += 1
+                    while (
+                        _skip_json_whitespace(text, position) == len(text)
+                        and (chunk := await anext(__chunks, None)) is not None
+                        ):
+                        text = decoder.decode(chunk)
+                        position = 0
+                    if _skip_json_whitespace(text, position) < len(text):
+                        yield enm.ParseErrorRef.invalid_json
+                    return
+                elif not expect_value:
+                    if char != ',':
+                        yield enm.ParseErrorRef.invalid_json
+                        return
+                    position += 1
+                    expect_value = True
+                    continue
+                elif len(text) < retry_at and not final:
+                    break
+                elif (end := _find_json_end(text, position, final)) == -1:
+                    if final:
+                        yield enm.ParseErrorRef.invalid_json
+                        return
+                    retry_at = 2 * (len(text) - position)
+                    break
+                yield text[position:end]
+                position = end
+                items += 1
+                expect_value = False
+                retry_at = 0
+            if final:
+                yield enm.ParseErrorRef.invalid_json
+                return
+            text = text[position:]
+            position = 0
+            if (chunk := await anext(__chunks, None)) is None:
+                final = True
+                text += decoder.decode(b'', final=True)
+            else:
+                text += decoder.decode(chunk)
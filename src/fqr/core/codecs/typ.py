@@ -3,7 +3,10 @@
 from .. import typ
 
 __all__ = (
+    'Encoder',
     'ErrorRef',
+    'JsonDumps',
+    'JsonLoads',
     *typ.__all__
     )
 
@@ -11,4 +14,15 @@ from .. typ import *
 
 from . import lib
 
+Encoder = lib.t.Callable[[lib.t.Any], Serial]
 ErrorRef = lib.t.NewType('ErrorRef', str)
+JsonDumps = lib.t.Callable[
+    [
+        lib.t.Any,
+        lib.t.Optional[lib.t.Callable[[lib.t.Any], lib.t.Any]],
+        lib.t.Optional[int],
+        bool
+        ],
+    str
+    ]
+JsonLoads = lib.t.Callable[[str | bytes], lib.t.Any]
@@ -1,8 +1,21 @@
 """Codecs utility functions."""
 
 __all__ = (
+    'decode_binary',
+    'decode_str_batch',
+    'dump_stream',
+    'dumps_json',
     'encode',
+    'encode_binary',
+    'get_encoder',
+    'get_memo',
+    'get_schema_fingerprint',
+    'get_str_decoder',
+    'loads_json',
     'parse',
+    'read_binary',
+    'register_encoder',
+    'register_json_backend',
     'serialize',
     'try_decode',
     'try_parse_json',
@@ -13,37 +26,320 @@ from .. import strings
 from . import cfg
 from . import enm
 from . import lib
+from . import obj
 from . import typ
 
 
 class Constants(cfg.Constants):
     """Constant values specific to this file."""
 
+    MEMO_FINGERPRINT = 'fingerprint'
+    """Key of schema fingerprints in the memo of an `Object` class."""
 
-def serialize(value: lib.t.Any) -> str:
-    """Convert value to string."""
+    JSON_BACKEND: lib.t.Optional['obj.JsonBackend'] = None
+    """JSON backend registered with `register_json_backend()`, if any."""
+
+    CACHED_REDACTED_KEYS: dict[str, lib.t.Optional[str]] = {}
+    """Local cache for redacted values of sensitive keys (`None` if not)."""
+
+    CACHED_EXPANDED_TYPES: dict[lib.t.Any, tuple[type[lib.t.Any], ...]] = {}
+    """Local cache for `typ.utl.check.expand_types()` per type."""
+
+    CACHED_UNION_PLANS: dict[
+        tuple[lib.t.Any, type[lib.t.Any], type[lib.t.Any]],
+        tuple[type[lib.t.Any], ...]
+        ] = {}
+    """
+    Local cache for the order in which union members are tried per \
+    union type, value type and value kind.
+
+    """
+
+    MEMO_PARSE_PLANS = 'parse_plans'
+    """
+    Key of the field name and type each key resolves to, per key set \
+    (shape) of serialized mappings, in the memo of a typed class.
+
+    """
+
+    MAX_PARSE_PLANS = 4096
+    """Maximum number of parse plans cached per typed class."""
+
+    CACHED_LAZY_TYPES: dict[lib.t.Any, bool] = {}
+    """Local cache for whether values of a type may be decoded lazily."""
+
+    NUMBER_LEADING_CHARS = frozenset('+-.0123456789')
+    """Characters number strings may begin with."""
+
+    MAX_PLAIN_NUMBER_LEN = 64
+    """Maximum length of number strings validated without regex."""
+
+    CACHED_STR_DECODERS: dict[
+        lib.t.Any,
+        lib.t.Callable[[str], lib.t.Any]
+        ] = {}
+    """Local cache for `str` decoders per type."""
+
+    MAX_CACHED_REDACTIONS = 4096
+    """Maximum number of redacted strings cached for compact output."""
+
+
+def get_memo(tp: type[lib.t.Any]) -> dict[str, lib.t.Any]:
+    """
+    Return `dict` for memoizing values derived from class `tp`.
+
+    ---
+
+    The `dict` is stored on `tp` itself, so memoized values are \
+    released along with `tp` instead of being held by a global cache.
+
+    """
+
+    try:
+        memo: dict[str, lib.t.Any] = type.__getattribute__(
+            tp,
+            Constants.__DICT__
+            )[Constants.__MEMO__]
+    except KeyError:
+        memo = {}
+        type.__setattr__(tp, Constants.__MEMO__, memo)
+
+    return memo
+
+
+def _set_cached(
+    cache: dict[lib.t.Any, typ.AnyType],
+    key: lib.t.Any,
+    value: typ.AnyType
+    ) -> typ.AnyType:
+    # Caches keyed by type hint are cleared once full.
+    if len(cache) >= Constants.MAX_CACHED_TYPES:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+@lib.functools.lru_cache(maxsize=Constants.MAX_CACHED_REDACTIONS)
+def _redact_string(__string: str) -> str:
+    return strings.utl.redact_string(__string)
+
+
+def _redact_key(__key: str) -> lib.t.Optional[str]:
+    if __key in Constants.CACHED_REDACTED_KEYS:
+        return Constants.CACHED_REDACTED_KEYS[__key]
+
+    redacted = strings.utl.redact_key_value_pair(__key, Constants.UNDEFINED)
+    Constants.CACHED_REDACTED_KEYS[__key] = v = (
+        None
+        if redacted == Constants.UNDEFINED
+        else redacted
+        )
+    return v
+
+
+def _convert_for_compact_repr(o: lib.t.Any) -> typ.Serial:
+    """
+    Recursively prepare `o` for compact `__repr__`, redacting the \
+    same keys and values as `strings.utl.convert_for_repr`, but \
+    without wrapping strings.
+
+    """
+
+    items: lib.t.Iterable[tuple[lib.t.Any, lib.t.Any]]
+    if isinstance(o, str):
+        return _redact_string(o)
+    elif o is None or typ.utl.check.is_primitive(o):
+        return o
+    elif typ.utl.check.is_field(o):
+        return strings.utl.convert_for_repr(o)
+    elif typ.utl.check.is_typed(o):
+        items = (
+            (k, getattr(o, k))
+            for k
+            in typ.utl.hint.collect_annotations(o)
+            )
+    elif typ.utl.check.is_mapping(o):
+        items = o.items()
+    elif typ.utl.check.is_array(o):
+        return [_convert_for_compact_repr(v) for v in o]
+    else:
+        return _convert_for_compact_repr(encode(o))
+
+    converted: dict[typ.Primitive, typ.Serial] = {
+        lib.t.cast(typ.Primitive, _convert_for_compact_repr(k)): (
+            redacted
+            if (
+                isinstance(k, str)
+                and isinstance(v, str)
+                and (redacted := _redact_key(k)) is not None
+                )
+            else _convert_for_compact_repr(v)
+            )
+        for k, v
+        in items
+        }
+    return converted
+
+
+def register_json_backend(
+    backend: lib.t.Optional['obj.JsonBackend']
+    ) -> None:
+    """
+    Route all fqr JSON I/O through `backend`, or back to the stdlib \
+    `json` module if `backend` is `None`.
+
+    """
+
+    Constants.JSON_BACKEND = backend
+
+
+def dumps_json(
+    value: lib.t.Any,
+    default: lib.t.Optional[lib.t.Callable[[lib.t.Any], lib.t.Any]] = None,
+    indent: lib.t.Optional[int] = None,
+    sort_keys: bool = False
+    ) -> str:
+    """
+    Serialize `value` to a JSON string using the registered JSON \
+    backend, falling back to the stdlib `json` module.
+
+    ---
+
+    Output is compact unless `indent` is specified.
+
+    """
+
+    if (backend := Constants.JSON_BACKEND) is not None:
+        try:
+            return backend.dumps(value, default, indent, sort_keys)
+        except Exception:
+            pass
 
     return lib.json.dumps(
         value,
-        indent=Constants.INDENT,
-        sort_keys=True,
-        default=strings.utl.convert_for_repr
+        default=default,
+        indent=indent,
+        separators=(',', ':') if indent is None else (',', ': '),
+        sort_keys=sort_keys
         )
 
 
+def loads_json(value: str | bytes | bytearray | memoryview) -> lib.t.Any:
+    """
+    Deserialize JSON string `value` using the registered JSON \
+    backend, falling back to the stdlib `json` module.
+
+    """
+
+    if not isinstance(value, (str, bytes)):
+        value = bytes(value)
+
+    if (backend := Constants.JSON_BACKEND) is not None:
+        try:
+            return backend.loads(value)
+        except Exception:
+            pass
+
+    return lib.json.loads(value)
+
+
+def serialize(
+    value: lib.t.Any,
+    compact: lib.t.Optional[bool] = None
+    ) -> str:
+    """
+    Convert value to string.
+
+    ---
+
+    If `compact` is `True` (defaults to `Constants.COMPACT_REPR`), \
+    output is neither indented nor sorted and strings are not \
+    wrapped. Sensitive keys and values are redacted either way.
+
+    """
+
+    if compact is None:
+        compact = Constants.COMPACT_REPR
+
+    if compact:
+        return dumps_json(_convert_for_compact_repr(value))
+    else:
+        return dumps_json(
+            value,
+            strings.utl.convert_for_repr,
+            Constants.INDENT,
+            True
+            )
+
+
+def get_encoder(
+    tp: type[typ.AnyType]
+    ) -> lib.t.Optional[lib.t.Callable[[typ.AnyType], typ.Serial]]:
+    """
+    Return encoder for values of type `tp`, if any.
+
+    ---
+
+    Encoders registered for `tp` itself take precedence, followed by \
+    those registered for its bases (most generic first).
+
+    ---
+
+    Resolved once per type and cached until `Constants.ENCODERS` \
+    is modified.
+
+    """
+
+    encoders = Constants.ENCODERS
+    try:
+        return encoders.resolved[tp]
+    except KeyError:
+        pass
+
+    encoder = encoders.data.get(tp)
+    if encoder is None:
+        encoder = next(
+            (
+                encoders.data[__base]
+                for _base
+                in reversed(tp.__bases__)
+                for __base
+                in reversed(_base.__mro__)
+                if __base in encoders.data
+                ),
+            None
+            )
+
+    encoders.resolved[tp] = encoder
+    return encoder
+
+
+def register_encoder(
+    tp: type[typ.AnyType],
+    encoder: lib.t.Callable[[typ.AnyType], typ.Serial]
+    ) -> None:
+    """
+    Register `encoder` for values of type `tp` (and, absent more \
+    specific encoders, of its subclasses), used by `encode()`.
+
+    ---
+
+    Overrides any default encoder for `tp` in `Constants.ENCODERS`.
+
+    """
+
+    Constants.ENCODERS[tp] = encoder
+    return None
+
+
 def encode(value: lib.t.Any) -> typ.Serial:
     """
     JSON encode `value` using a corresponding encoder, otherwise returns \
     `repr(value)`."""
 
-    if (encoder := Constants.ENCODERS.get(value.__class__)) is not None:
+    if (encoder := get_encoder(value.__class__)) is not None:
         return encoder(value)
 
-    for _base in reversed(value.__class__.__bases__):
-        for __base in reversed(_base.__mro__):
-            if (encoder := Constants.ENCODERS.get(__base)) is not None:
-                return encoder(value)
-
     return repr(value)
 
 
@@ -82,28 +378,14 @@ def try_decode(
                 else:
                     return enm.ParseErrorRef.bool_decode
             elif typ.utl.check.is_number_type(tp):
-                if strings.utl.is_valid_number_str(value):
-                    num_tp: type[typ.AnyType] = tp
-                    return num_tp(value)  # type: ignore[call-arg]
-                else:
-                    return enm.ParseErrorRef.number_decode
-            elif (
-                (is_datetime_tp := typ.utl.check.is_datetime_type(tp))
-                or typ.utl.check.is_date_type(tp)
-                ):
-                if strings.utl.is_valid_datetime_str(value):
-                    dt = (
-                        lib.datetime.datetime.fromisoformat(value)
-                        .replace(tzinfo=lib.datetime.timezone.utc)
-                        )
-                    if is_datetime_tp:
-                        dt_value: typ.AnyType = dt
-                        return dt_value
-                    else:
-                        date_value: typ.AnyType = dt.date()
-                        return date_value
-                else:
-                    return enm.ParseErrorRef.datetime_decode
+                number: typ.AnyType = _decode_number(tp, value)
+                return number
+            elif typ.utl.check.is_datetime_type(tp):
+                dt_value: typ.AnyType = _decode_datetime(value)
+                return dt_value
+            elif typ.utl.check.is_date_type(tp):
+                date_value: typ.AnyType = _decode_date(value)
+                return date_value
             elif typ.utl.check.is_none_type(tp):
                 if value.lower() in enm.NoneAlias._member_names_:
                     none: typ.AnyType = None
@@ -118,8 +400,229 @@ def try_decode(
         return enm.ParseErrorRef.value_decode
 
 
+def _decode_bool(value: str) -> bool | enm.ParseErrorRef:
+    if (lowered := value.lower()) in enm.Boolean._member_names_:
+        return lowered == enm.Boolean.true.name
+    else:
+        return enm.ParseErrorRef.bool_decode
+
+
+def _is_plain_number_str(value: str) -> bool:
+    # Sufficient (not necessary) for `strings.utl.is_valid_number_str`.
+    return (
+        len(value) <= Constants.MAX_PLAIN_NUMBER_LEN
+        and value.isascii()
+        and value[-1:] != '.'
+        and value.lstrip('+-').replace('.', '', 1).isdigit()
+        )
+
+
+def _decode_number(
+    tp: type[lib.t.Any],
+    value: str
+    ) -> lib.t.Any | enm.ParseErrorRef:
+    # The native constructor is tried first, the (slower) regex is
+    # only used to classify failures and validate uncommon formats.
+    if value[:1] not in Constants.NUMBER_LEADING_CHARS:
+        return enm.ParseErrorRef.number_decode
+
+    try:
+        number = tp(value)  # type: ignore[call-arg]
+    except:  # noqa: E722
+        if strings.utl.is_valid_number_str(value):
+            return enm.ParseErrorRef.value_decode
+        else:
+            return enm.ParseErrorRef.number_decode
+
+    if _is_plain_number_str(value) or strings.utl.is_valid_number_str(value):
+        return number
+    else:
+        return enm.ParseErrorRef.number_decode
+
+
+def _decode_datetime(
+    value: str
+    ) -> lib.datetime.datetime | enm.ParseErrorRef:
+    # Given `fromisoformat()` succeeds, the regex only needs to match
+    # the date separators.
+    if value[4:5] != '-' or value[7:8] != '-':
+        return enm.ParseErrorRef.datetime_decode
+
+    try:
+        dt = lib.datetime.datetime.fromisoformat(value)
+    except ValueError:
+        if strings.utl.is_valid_datetime_str(value):
+            return enm.ParseErrorRef.value_decode
+        else:
+            return enm.ParseErrorRef.datetime_decode
+
+    # Equivalent to, but much faster than, `dt.replace(tzinfo=utc)`.
+    return lib.datetime.datetime.combine(
+        dt,
+        dt.time(),
+        lib.datetime.timezone.utc
+        )
+
+
+def _decode_date(value: str) -> lib.datetime.date | enm.ParseErrorRef:
+    if isinstance(dt := _decode_datetime(value), enm.ParseErrorRef):
+        return dt
+    else:
+        return dt.date()
+
+
+def _decode_with_fallback(
+    decoder: lib.t.Callable[[str], typ.AnyType | enm.ParseErrorRef],
+    tp: type[typ.AnyType],
+    value: str
+    ) -> typ.AnyType | enm.ParseErrorRef:
+    if isinstance(decoded := decoder(value), enm.ParseErrorRef):
+        return parse(value, tp)
+    else:
+        return decoded
+
+
+def get_str_decoder(
+    tp: type[typ.AnyType] | lib.t.Any
+    ) -> lib.t.Callable[[str], typ.AnyType | enm.ParseErrorRef]:
+    """
+    Return a callable parsing python `tp` from `str` values, \
+    returning `enm.ParseErrorRef` if no valid type could be parsed.
+
+    ---
+
+    Equivalent to `parse(value, tp)` for `str` values, but resolved \
+    once per `tp`: `str` values are returned as is for `str` types, \
+    and `bool`, number, `datetime` and `date` types (optionally \
+    `None`) are decoded directly. All other types use `parse()`.
+
+    """
+
+    try:
+        return Constants.CACHED_STR_DECODERS[tp]
+    except (KeyError, TypeError):
+        pass
+
+    decoder: lib.t.Optional[lib.t.Callable[[str], lib.t.Any]] = None
+    expanded = typ.utl.check.expand_types(tp)
+    tps = [tp_ for tp_ in expanded if tp_ is not typ.NoneType]
+    if (
+        len(tps) != 1
+        or not isinstance(tps[0], type)
+        or any(
+            typ.utl.check.is_literal(tp_)
+            for tp_
+            in (lib.t.get_args(tp) if typ.utl.check.is_union(tp) else (tp, ))
+            )
+        ):
+        # `Literal` values are validated by `parse()`.
+        pass
+    elif tps[0] is str:
+        decoder = str
+    elif typ.utl.check.is_bool_type(tps[0]):
+        decoder = _decode_bool
+    elif typ.utl.check.is_number_type(tps[0]):
+        decoder = lib.functools.partial(_decode_number, tps[0])
+    elif typ.utl.check.is_datetime_type(tps[0]):
+        decoder = _decode_datetime
+    elif typ.utl.check.is_date_type(tps[0]):
+        decoder = _decode_date
+
+    if decoder is None:
+        decoder = lib.functools.partial(parse, tp=tp)
+    elif len(expanded) > 1:
+        # `None` is only tried if decoding as the other type fails.
+        decoder = lib.functools.partial(_decode_with_fallback, decoder, tp)
+
+    try:
+        _set_cached(Constants.CACHED_STR_DECODERS, tp, decoder)
+    except TypeError:  # pragma: no cover
+        pass
+
+    return decoder
+
+
+def _decode_batch(
+    values: lib.t.Sequence[str],
+    tp: type[typ.AnyType]
+    ) -> lib.t.Optional[list[lib.t.Any]]:
+    decoded: list[lib.t.Any]
+    try:
+        if typ.utl.check.is_bool_type(tp):
+            return None
+        elif typ.utl.check.is_number_type(tp):
+            if max(map(len, values)) > Constants.MAX_PLAIN_NUMBER_LEN:
+                return None
+            decoded = list(map(tp, values))
+            pattern = strings.obj.Pattern.PlainNumberLines
+        elif typ.utl.check.is_datetime_type(tp):
+            decoded = [
+                lib.datetime.datetime.combine(
+                    dt,
+                    dt.time(),
+                    lib.datetime.timezone.utc
+                    )
+                for dt
+                in map(lib.datetime.datetime.fromisoformat, values)
+                ]
+            pattern = strings.obj.Pattern.DateTimeLines
+        elif typ.utl.check.is_date_type(tp):
+            decoded = [
+                dt.date()
+                for dt
+                in map(lib.datetime.datetime.fromisoformat, values)
+                ]
+            pattern = strings.obj.Pattern.DateTimeLines
+        else:
+            return None
+    except:  # noqa: E722
+        return None
+
+    if pattern.fullmatch('\n'.join(values) + '\n') is None:
+        return None
+    else:
+        return decoded
+
+
+def decode_str_batch(
+    values: lib.t.Sequence[str],
+    tp: type[typ.AnyType] | lib.t.Any
+    ) -> list[typ.AnyType | enm.ParseErrorRef]:
+    """
+    Parse python `tp` from each of a sequence of `str` values, \
+    returning `enm.ParseErrorRef` in place of any values that could \
+    not be parsed.
+
+    ---
+
+    Equivalent to `[get_str_decoder(tp)(v) for v in values]`, but \
+    number, `datetime` and `date` types (optionally `None`) are first \
+    decoded with their native constructors and validated for the \
+    whole batch at once. Values are only decoded individually if any \
+    in the batch fail.
+
+    """
+
+    tps = [
+        tp_
+        for tp_
+        in typ.utl.check.expand_types(tp)
+        if tp_ is not typ.NoneType
+        ]
+    if (
+        values
+        and len(tps) == 1
+        and isinstance(tps[0], type)
+        and (decoded := _decode_batch(values, tps[0])) is not None
+        ):
+        return decoded
+
+    decoder = get_str_decoder(tp)
+    return [decoder(value) for value in values]
+
+
 def try_parse_json(
-    json_string: str
+    json_string: str | bytes
     ) -> typ.Serial | enm.ParseErrorRef:
     """
     Attempt to parse valid JSON string, returning \
@@ -128,12 +631,196 @@ def try_parse_json(
     """
 
     try:
-        deserialized: typ.Serial = lib.json.loads(json_string)
+        deserialized: typ.Serial = loads_json(json_string)
         return deserialized
     except:  # noqa: E722
         return enm.ParseErrorRef.invalid_json
 
 
+def _parse_rows(
+    rows: list[str | bytes | enm.ParseErrorRef],
+    tp: lib.t.Any
+    ) -> list[lib.t.Any]:
+    # Module level, so batches can be sent to a process pool.
+    parsed: list[lib.t.Any] = []
+    for row in rows:
+        value = row if isinstance(row, enm.ParseErrorRef) else (
+            try_parse_json(row)
+            )
+        parsed.append(
+            value
+            if isinstance(value, enm.ParseErrorRef)
+            else parse(value, tp)
+            )
+    return parsed
+
+
+def _expand_types(tp: lib.t.Any) -> tuple[type[lib.t.Any], ...]:
+    try:
+        return Constants.CACHED_EXPANDED_TYPES[tp]
+    except KeyError:
+        return _set_cached(
+            Constants.CACHED_EXPANDED_TYPES,
+            tp,
+            typ.utl.check.expand_types(tp)
+            )
+    except TypeError:  # pragma: no cover
+        return typ.utl.check.expand_types(tp)
+
+
+def _get_kind(tp: type[lib.t.Any]) -> type[lib.t.Any]:
+    # Representative (JSON) kind of a runtime type.
+    if tp is typ.NoneType:
+        return typ.NoneType
+    elif issubclass(tp, bool):
+        return bool
+    elif issubclass(tp, str):
+        return str
+    elif issubclass(tp, lib.numbers.Number):
+        return lib.numbers.Number
+    elif issubclass(tp, lib.datetime.date):
+        return lib.datetime.date
+    elif issubclass(tp, lib.collections.abc.Mapping) or (
+        typ.utl.check.is_typed(tp)
+        ):
+        return lib.collections.abc.Mapping
+    elif issubclass(tp, lib.collections.abc.Collection) and not (
+        issubclass(tp, (bytes, bytearray))
+        ):
+        return lib.collections.abc.Collection
+    else:
+        return object
+
+
+def _get_str_kind(value: str) -> type[lib.t.Any]:
+    # Representative (JSON) kind of the value a `str` may encode.
+    if (lowered := value[:6].lower()) in enm.NoneAlias._member_names_:
+        return typ.NoneType
+    elif lowered in enm.Boolean._member_names_:
+        return bool
+    elif value[:1] == '[':
+        return lib.collections.abc.Collection
+    elif value[:1] == '{':
+        return lib.collections.abc.Mapping
+    elif value[4:5] == '-' and value[7:8] == '-':
+        return lib.datetime.date
+    elif value[:1] in Constants.NUMBER_LEADING_CHARS:
+        return lib.numbers.Number
+    else:
+        return str
+
+
+def _is_lazy_type(tp: lib.t.Any) -> bool:
+    # Only `Object`, parameterized array and mapping types (or unions
+    # of these with `None`) need nested decoding worth deferring.
+    try:
+        return Constants.CACHED_LAZY_TYPES[tp]
+    except KeyError:
+        pass
+    except TypeError:  # pragma: no cover
+        return False
+
+    lazy = all(
+        tp_ is typ.NoneType
+        or typ.utl.check.is_object(tp_)
+        or (
+            bool(typ.utl.check.get_type_args(tp_))
+            and (
+                typ.utl.check.is_array_type(tp_)
+                or typ.utl.check.is_mapping_type(tp_)
+                )
+            )
+        for tp_
+        in _expand_types(tp)
+        )
+
+    return _set_cached(Constants.CACHED_LAZY_TYPES, tp, lazy)
+
+
+def _get_parse_plan(
+    tp: lib.t.Any,
+    value: typ.Mapping[typ.Primitive, typ.Serial]
+    ) -> tuple[lib.t.Optional[tuple[str, lib.t.Any]], ...]:
+    # Field name and type for each key of `value` (`None` if not a
+    # field of `tp`), resolved once per distinct key set, as the rows
+    # of an array almost always share the same keys.
+    plans: dict[
+        tuple[lib.t.Any, ...],
+        tuple[lib.t.Optional[tuple[str, lib.t.Any]], ...]
+        ] = get_memo(tp).setdefault(Constants.MEMO_PARSE_PLANS, {})
+    try:
+        return plans[(shape := tuple(value))]
+    except KeyError:
+        pass
+
+    if typ.utl.check.is_object(tp):
+        tp_annotations = {
+            k: typ.utl.check.get_args(v)[0]  # Expand Field[Any] --> Any
+            for k, v
+            in typ.utl.hint.collect_annotations(tp).items()
+            }
+    else:
+        tp_annotations = typ.utl.hint.collect_annotations(tp)
+    fields = tuple(tp_annotations)
+    plan = tuple(
+        (ckey, tp_annotations[ckey])
+        if isinstance(k, str) and (ckey := strings.utl.cname_for(k, fields))
+        else None
+        for k
+        in value
+        )
+
+    if len(plans) < Constants.MAX_PARSE_PLANS:
+        plans[shape] = plan
+
+    return plan
+
+
+def _get_union_plan(
+    tp: lib.t.Any,
+    valid_types: tuple[type[lib.t.Any], ...],
+    value: lib.t.Any
+    ) -> tuple[type[lib.t.Any], ...]:
+    # Members of which `value` is an exact instance are tried first,
+    # followed by those of the same (JSON) kind as `value`, and then
+    # all others, so parsing usually succeeds on the first try.
+    kind = (
+        _get_str_kind(value)
+        if isinstance(value, str)
+        else _get_kind(value.__class__)
+        )
+    key = (tp, value.__class__, kind)
+    try:
+        return Constants.CACHED_UNION_PLANS[key]
+    except (KeyError, TypeError):
+        pass
+
+    exact: list[type[lib.t.Any]] = []
+    similar: list[type[lib.t.Any]] = []
+    other: list[type[lib.t.Any]] = []
+    for dtype_candidate in valid_types:
+        tps = [
+            tp_
+            for tp_
+            in typ.utl.check.get_checkable_types(dtype_candidate)
+            if isinstance(tp_, type)
+            ]
+        if value.__class__ in tps:
+            exact.append(dtype_candidate)
+        elif any(_get_kind(tp_) is kind for tp_ in tps):
+            similar.append(dtype_candidate)
+        else:
+            other.append(dtype_candidate)
+    plan = (*exact, *similar, *other)
+
+    try:
+        _set_cached(Constants.CACHED_UNION_PLANS, key, plan)
+    except TypeError:  # pragma: no cover
+        pass
+
+    return plan
+
+
 @lib.t.overload
 def parse(
     value: lib.t.Any,
@@ -188,16 +875,19 @@ def parse(
     allowing for downstream validation instead of immediately raising \
     an exception within this function.
 
+    If `Constants.LAZY_DECODING` is `True`, `Object`, array and \
+    mapping fields of parsed `Objects` are instead set from raw JSON \
+    (see `obj.LazyValue`), and parsed on first access.
+
     """
 
-    valid_types = typ.utl.check.expand_types(tp)
+    valid_types = _expand_types(tp)
     if len(valid_types) > 1:
-        parsed_value_or_err_ref = parse(value, valid_types[0])
-        for dtype_candidate in valid_types[1:]:
+        parsed_value_or_err_ref: typ.AnyType | enm.ParseErrorRef
+        for dtype_candidate in _get_union_plan(tp, valid_types, value):
+            parsed_value_or_err_ref = parse(value, dtype_candidate)
             if not isinstance(parsed_value_or_err_ref, enm.ParseErrorRef):
                 break
-            else:  # pragma: no cover
-                parsed_value_or_err_ref = parse(value, dtype_candidate)
         return parsed_value_or_err_ref
     elif isinstance(value, str):
         if (
@@ -218,32 +908,29 @@ def parse(
         else:
             return try_decode(value, tp)
     elif typ.utl.check.is_typed(tp):
-        if typ.utl.check.is_object(tp):
-            tp_annotations = {
-                k: typ.utl.check.get_args(v)[0]  # Expand Field[Any] --> Any
-                for k, v
-                in typ.utl.hint.collect_annotations(tp).items()
-                }
-        else:
-            tp_annotations = typ.utl.hint.collect_annotations(tp)
         if typ.utl.check.is_serialized_mapping(value):
+            lazy = Constants.LAZY_DECODING and typ.utl.check.is_object(tp)
             tp_dict: dict[str, lib.t.Any] = {}
-            for k, val in value.items():
+            for field, val in zip(_get_parse_plan(tp, value), value.values()):
+                if field is None:
+                    return enm.ParseErrorRef.invalid_keys_decode
+                ckey, field_tp = field
                 if (
-                    isinstance(k, str)
-                    and (
-                        ckey := strings.utl.cname_for(
-                            k,
-                            tuple(tp_annotations)
-                            )
-                        )
+                    lazy
+                    and isinstance(val, (dict, list))
+                    and _is_lazy_type(field_tp)
                     ):
-                    tp_val = parse(val, tp_annotations[ckey])
-                    if isinstance(tp_val, enm.ParseErrorRef):
-                        return enm.ParseErrorRef.invalid_map_decode
-                    tp_dict[ckey] = tp_val
-                else:
-                    return enm.ParseErrorRef.invalid_keys_decode
+                    tp_dict[ckey] = obj.LazyValue(val)
+                    continue
+                tp_val = parse(val, field_tp)
+                if isinstance(tp_val, enm.ParseErrorRef):
+                    return enm.ParseErrorRef.invalid_map_decode
+                tp_dict[ckey] = tp_val
+            if lazy:
+                return lib.t.cast(
+                    type[typ.obj.ObjectLike],
+                    tp
+                    ).from_trusted(lib.t.cast(typ.SnakeDict, tp_dict))
             return tp(**tp_dict)
         else:  # pragma: no cover
             return try_decode(value, tp)
@@ -350,3 +1037,97 @@ def parse(
             return try_decode(value, tp)
     else:
         return try_decode(value, tp)
+
+
+def get_schema_fingerprint(tp: type[lib.t.Any]) -> int:
+    """
+    Return a 32-bit fingerprint of the schema (field names and types) \
+    of `Object` class `tp`, stable across processes.
+
+    """
+
+    memo = get_memo(tp)
+    if (fingerprint := memo.get(Constants.MEMO_FINGERPRINT)) is None:
+        fingerprint = memo[Constants.MEMO_FINGERPRINT] = lib.zlib.crc32(
+            '\n'.join(
+                f'{field}:{tp.__dataclass_fields__[field]["type"]!r}'
+                for field
+                in tp.fields
+                ).encode()
+            )
+
+    return fingerprint
+
+
+def encode_binary(value: typ.Object) -> bytes:
+    """
+    Encode `Object` as a binary row.
+
+    ---
+
+    See `obj.BinaryLayout` for a description of the row format.
+
+    """
+
+    return obj.BinaryLayout.get(value.__class__).pack(value)
+
+
+def read_binary(
+    tp: type[typ.Object],
+    data: bytes | bytearray | memoryview
+    ) -> 'obj.BinaryRecord | enm.ParseErrorRef':
+    """
+    Return a lazy, read-only view of binary row `data` for `Object` \
+    class `tp`, without copying.
+
+    ---
+
+    Returns `enm.ParseErrorRef` if `data` was not encoded for `tp`.
+
+    """
+
+    return obj.BinaryRecord.from_buffer(tp, memoryview(data))
+
+
+def decode_binary(
+    tp: type[typ.ObjectType],
+    data: bytes | bytearray | memoryview
+    ) -> typ.ObjectType | enm.ParseErrorRef:
+    """
+    Decode binary row `data` to an instance of `Object` class `tp`.
+
+    ---
+
+    Returns `enm.ParseErrorRef` if `data` was not encoded for `tp`.
+
+    """
+
+    if isinstance(
+        (record := obj.BinaryRecord.from_buffer(tp, memoryview(data))),
+        enm.ParseErrorRef
+        ):
+        return record
+
+    object_: typ.ObjectType = record.to_object()
+    return object_
+
+
+def dump_stream(
+    values: lib.t.Iterable[lib.t.Any],
+    stream: lib.t.IO[lib.t.Any],
+    ndjson: bool = False
+    ) -> int:
+    """
+    Incrementally write `values` to `stream` as a JSON array or, if \
+    `ndjson` is `True`, as newline-delimited JSON.
+
+    ---
+
+    Returns the number of values written.
+
+    """
+
+    with obj.StreamEncoder(stream, ndjson=ndjson) as encoder:
+        encoder.write_all(values)
+
+    return encoder.count
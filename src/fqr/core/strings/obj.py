@@ -114,6 +114,30 @@ class Pattern:
 
     """
 
+    DateTimeLines = lib.re.compile(r'(.{4}-..-.*\n)*')
+    """
+    Matches newline-terminated lines, each with `datetime` date \
+    separators in place.
+
+    ---
+
+    Used to validate batches of strings already parsed by \
+    `fromisoformat()`, which are then also matched by `DateTime`.
+
+    """
+
+    PlainNumberLines = lib.re.compile(r'([+-]?[0-9]*\.?[0-9]+\n)*')
+    """
+    Matches newline-terminated lines, each a plain integer or decimal \
+    number.
+
+    ---
+
+    Used to validate batches of number strings at once; lines of up \
+    to 64 characters matched are also matched by `Number`.
+
+    """
+
 
 class RedactionPattern:
     """
@@ -117,6 +117,9 @@ class MetaLike(lib.t.Protocol):
     __annotations__: 'typ.SnakeDict'
     __dataclass_fields__: 'lib.t.ClassVar[typ.DataClassFields]'
 
+    @property
+    def __heritage__(self) -> tuple[type, ...]: ...
+
 
 class ObjectLike(lib.t.Protocol):
     """Object protocol."""
@@ -150,6 +153,13 @@ class ObjectLike(lib.t.Protocol):
     @classmethod
     def keys(cls) -> 'lib.t.KeysView[typ.string[typ.snake_case]]': ...
 
+    @classmethod
+    def from_trusted(
+        cls,
+        __values: 'lib.t.Mapping[typ.string[typ.snake_case], lib.t.Any]',
+        /
+        ) -> lib.Self: ...
+
     def pop(
         self,
         __key: str,
@@ -39,6 +39,9 @@ if lib.t.TYPE_CHECKING:  # pragma: no cover
 class Constants(cfg.Constants):
     """Constant values specific to this file."""
 
+    CACHED_CHECKABLE_TYPES: dict[lib.t.Any, tuple[type, ...]] = {}
+    """Local cache for checkable types."""
+
 
 def get_args(tp: lib.t.Any) -> tuple[lib.t.Any, ...]:
     """Wrapper for `lib.t.get_args`."""
@@ -108,14 +111,29 @@ def get_checkable_types(
 
     """
 
-    checkable_types = {
-        otp
-        for tp
-        in expand_types(any_tp)
-        if isinstance((otp := lib.t.get_origin(tp) or tp), type)
-        }
+    try:
+        return Constants.CACHED_CHECKABLE_TYPES[any_tp]
+    except (KeyError, TypeError):
+        pass
+
+    checkable_types = tuple(
+        {
+            otp
+            for tp
+            in expand_types(any_tp)
+            if isinstance((otp := lib.t.get_origin(tp) or tp), type)
+            }
+        )
+
+    if len(Constants.CACHED_CHECKABLE_TYPES) >= Constants.MAX_CACHED_TYPES:
+        Constants.CACHED_CHECKABLE_TYPES.clear()
+
+    try:
+        Constants.CACHED_CHECKABLE_TYPES[any_tp] = checkable_types
+    except TypeError:  # pragma: no cover
+        pass
 
-    return tuple(checkable_types)
+    return checkable_types
 
 
 @lib.t.overload
@@ -419,9 +437,12 @@ def is_object(
     else:
         otp = type(obj_)
 
+    if (lineage := getattr(otp, Constants.__LINEAGE__, None)) is None:
+        return False
+
     from .... import objects
 
-    return issubclass(otp, objects.Object)
+    return objects.Object in lineage
 
 
 def is_field(
@@ -158,6 +158,8 @@ def _collect_annotations(
     annotations.pop(Constants.__DATACLASS_FIELDS__, None)
     annotations.pop(Constants.__DICT__, None)
     annotations.pop(Constants.__HERITAGE__, None)
+    annotations.pop(Constants.__LINEAGE__, None)
+    annotations.pop(Constants.__MEMO__, None)
     annotations.pop(Constants.FIELDS, None)
     annotations.pop(Constants.ENUMERATIONS, None)
     annotations.pop(Constants.HASH_FIELDS, None)
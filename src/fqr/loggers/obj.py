@@ -271,11 +271,11 @@ def _monkey_log(
         fn,
         lno,
         lib.textwrap.indent(
-            lib.json.dumps(
+            core.codecs.utl.dumps_json(
                 core.strings.utl.convert_for_repr(msg_final),
-                default=core.strings.utl.convert_for_repr,
-                indent=Constants.INDENT,
-                sort_keys=True
+                core.strings.utl.convert_for_repr,
+                Constants.INDENT,
+                True
                 ),
             Constants.INDENT * ' '
             ),
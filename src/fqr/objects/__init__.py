@@ -4,7 +4,8 @@ Objects Overview
 
 **Author:** dan@1howardcapital.com
 
-**Summary:** Objects module including `Object` and `Field`.
+**Summary:** Objects module including `Object`, `FrozenObject`, \
+`Field`, `ObjectFrame` and `ObjectDataset`.
 
 ---
 
@@ -19,9 +20,11 @@ import fqr
 """
 
 from . import cfg
+from . import datasets
 from . import enm
 from . import exc
 from . import fields
+from . import frames
 from . import lib
 from . import metas
 from . import objs
@@ -31,9 +34,11 @@ from . import utl
 
 __all__ = (
     'cfg',
+    'datasets',
     'enm',
     'exc',
     'fields',
+    'frames',
     'lib',
     'metas',
     'objs',
@@ -41,8 +46,13 @@ __all__ = (
     'typ',
     'utl',
     'Field',
-    'Object'
+    'FrozenObject',
+    'Object',
+    'ObjectDataset',
+    'ObjectFrame'
     )
 
+from . datasets import ObjectDataset
 from . fields import Field
-from . objs import Object
+from . frames import ObjectFrame
+from . objs import FrozenObject, Object
@@ -12,6 +12,8 @@ class Constants(core.cfg.Constants):
 
     BASE_ATTRS = (
         '__heritage__',
+        '__lineage__',
+        '__memo__',
         '__dataclass_fields__',
         'enumerations',
         'fields',
@@ -37,6 +39,39 @@ class Constants(core.cfg.Constants):
         'read_only',
         'write_only',
         )
+    LAZY = 'lazy'
+    LAZY_FINALIZATION = (
+        core.lib.os.getenv('LAZY_FINALIZATION', 'false').lower() == 'true'
+        )
+    """
+    Default, package-wide class finalization mode.
+
+    ---
+
+    If `True`, parsing of `Object` class definitions is deferred \
+    until first instantiation or first access of any of its fields.
+
+    """
+    TRUSTED_ASSERTIONS = (
+        core.lib.os.getenv('TRUSTED_ASSERTIONS', 'false').lower() == 'true'
+        )
+    """
+    Debug mode for trusted `Object` constructors.
+
+    ---
+
+    If `True` (and `python` is not run with `-O`), values passed to \
+    `Object.from_trusted()` and `Object.from_tuple()` are asserted \
+    to match the fields and types of the class.
+
+    """
+    DEFERRED_ATTRS = (
+        '__annotations__',
+        '__dataclass_fields__',
+        'enumerations',
+        'fields',
+        'hash_fields',
+        )
     FIELDS_MODULE = __name__.replace('cfg', 'fields.obj')
     OBJECTS_MODULE = __name__.replace('cfg', 'objs.obj')
     FORBIDDEN_KEYWORDS = (
@@ -60,6 +95,8 @@ class Constants(core.cfg.Constants):
         '__sub__',
         '__lshift__',
         '__rshift__',
+        '__ilshift__',
+        '__irshift__',
         '__getstate__',
         '__setstate__',
         '__instancecheck__',
@@ -0,0 +1,425 @@
+"""Dataset module."""
+
+__all__ = (
+    'ObjectDataset',
+    )
+
+from ... import core
+
+from .. import cfg
+from .. import frames
+from .. import lib
+from .. import queries
+from .. import typ
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    BLOCK_SIZE = 1024
+    """Default number of rows summarized per block of index stats."""
+
+    INDEX_SUFFIX = '.idx'
+    """Suffix of the default index path, appended to the dataset path."""
+
+    INDEX_VERSION = 2
+    """Version of the index format, stored with each index."""
+
+    OFFSET_TYPECODE = 'Q'
+    """Typecode of the `array` of row offsets."""
+
+    NUMERIC_TYPES = frozenset((int, float, core.typ.NoneType))
+    """Field types for which index stats are collected."""
+
+    STATS_OPERATORS: dict[
+        str,
+        lib.t.Callable[[lib.t.Any, lib.t.Any, lib.t.Any], bool]
+        ] = {
+        'eq': lambda lo, hi, v: lo <= v <= hi,
+        'ge': lambda lo, hi, v: hi >= v,
+        'gt': lambda lo, hi, v: hi > v,
+        'le': lambda lo, hi, v: lo <= v,
+        'lt': lambda lo, hi, v: lo < v,
+        }
+    """
+    Block filters per `QueryCondition` field, returning `False` \
+    only if no value between `lo` and `hi` can match `v`.
+
+    """
+
+
+class ObjectDataset(lib.t.Generic[typ.ObjectType]):
+    """
+    Memory-mapped, read-only JSON Lines (NDJSON) file of rows \
+    of a single `Object` class.
+
+    ---
+
+    ### Usage
+
+    The file is indexed on first open, and the index (the byte offset \
+    of each row) is persisted to a sidecar file at `index_path` \
+    (`path` + `'.idx'` by default), which is reused until the file \
+    or the class changes. The sidecar file holds a JSON header line \
+    followed by the raw bytes of the offsets `array`.
+
+    If `stats` is `True`, the index also holds the minimum and \
+    maximum value of each `int` and `float` field per block of \
+    `block_size` rows, so `filter()` may skip blocks that cannot match \
+    without decoding them.
+
+    Rows are only decoded to `Object` instances on iteration \
+    or indexing (slices return a `list`).
+
+    Blank lines are ignored.
+
+    ---
+
+    ### Example
+
+    ```py
+    with ObjectDataset(Pet, 'pets.ndjson') as dataset:
+        dataset[-1]
+        dataset.filter((Pet.age >= 10) & (Pet.name << 'F'))
+
+    ```
+
+    """
+
+    __slots__ = (
+        '_file',
+        '_mmap',
+        'block_size',
+        'cls',
+        'index_path',
+        'offsets',
+        'path',
+        'stats',
+        )
+
+    def __init__(
+        self,
+        cls: type[typ.ObjectType],
+        path: str,
+        index_path: lib.t.Optional[str] = None,
+        stats: bool = True,
+        block_size: int = Constants.BLOCK_SIZE
+        ):
+        self.cls = cls
+        self.path = path
+        self.index_path = index_path or path + Constants.INDEX_SUFFIX
+        self.block_size = block_size
+        self._file = open(path, 'rb')
+        self._mmap: lib.mmap.mmap | bytes = (
+            lib.mmap.mmap(
+                self._file.fileno(),
+                0,
+                access=lib.mmap.ACCESS_READ
+                )
+            if lib.os.fstat(self._file.fileno()).st_size
+            else b''
+            )
+        self.offsets: lib.array.array[int]
+        self.stats: lib.t.Optional[
+            dict[str, tuple[list[lib.t.Any], list[lib.t.Any]]]
+            ]
+        try:
+            self._load_index(stats)
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> lib.Self:
+        return self
+
+    def __exit__(self, *args: lib.t.Any) -> None:
+        return self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self) -> lib.t.Iterator[typ.ObjectType]:
+        return map(self._decode, range(len(self.offsets)))
+
+    @lib.t.overload
+    def __getitem__(self, __index: int) -> typ.ObjectType: ...
+    @lib.t.overload
+    def __getitem__(self, __index: slice) -> list[typ.ObjectType]: ...
+    def __getitem__(
+        self,
+        __index: int | slice
+        ) -> typ.ObjectType | list[typ.ObjectType]:
+        if isinstance(__index, slice):
+            return list(map(self._decode, range(len(self.offsets))[__index]))
+        return self._decode(range(len(self.offsets))[__index])
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}[{self.cls.__name__}]'
+            f'({len(self.offsets)})'
+            )
+
+    def close(self) -> None:
+        """Release the memory map and close the file."""
+
+        if isinstance(self._mmap, lib.mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+        return None
+
+    def filter(
+        self,
+        __query: queries.Query
+        ) -> frames.ObjectFrame[typ.ObjectType]:
+        """
+        Return an `ObjectFrame` of rows matching `query`.
+
+        ---
+
+        Only blocks of rows which may match `query` according \
+        to index stats are decoded, and scanning stops early once \
+        `limit` rows match, unless the `Query` is also sorted.
+
+        Any sorting and limit specified on the top-level `Query` \
+        are applied to the result.
+
+        """
+
+        limit = None if __query.sorting else __query.limit
+        matches: frames.ObjectFrame[typ.ObjectType] = frames.ObjectFrame(
+            self.cls
+            )
+        for start in range(0, len(self.offsets), self.block_size):
+            if not self._may_match(__query, start // self.block_size):
+                continue
+            rows = self[start:start + self.block_size]
+            frame = frames.ObjectFrame(self.cls, rows)
+            matches.extend(
+                lib.itertools.compress(rows, frame._scan(__query))
+                )
+            if limit is not None and len(matches) >= limit:
+                break
+
+        return matches._select(list(range(len(matches))), __query)
+
+    def _decode(self, __index: int) -> typ.ObjectType:
+        """Decode row at `index` to an `Object`."""
+
+        return self.cls(
+            core.codecs.utl.loads_json(self._read(self.offsets[__index]))
+            )
+
+    def _read(self, __offset: int) -> bytes:
+        """Return raw bytes of the line starting at `offset`."""
+
+        if (end := self._mmap.find(b'\n', __offset)) == -1:
+            end = len(self._mmap)
+        return self._mmap[__offset:end]
+
+    def _get_fingerprint(self) -> dict[str, lib.t.Any]:
+        """Return values identifying the dataset file and class."""
+
+        stat = lib.os.stat(self.path)
+        return {
+            'block_size': self.block_size,
+            'byteorder': lib.sys.byteorder,
+            'mtime_ns': stat.st_mtime_ns,
+            'schema': core.codecs.utl.get_schema_fingerprint(self.cls),
+            'size': stat.st_size,
+            'version': Constants.INDEX_VERSION,
+            }
+
+    def _load_index(self, __stats: bool) -> None:
+        """Load the persisted index if valid, otherwise rebuild it."""
+
+        fingerprint = self._get_fingerprint()
+        index = self._read_index()
+        if (
+            index.get('fingerprint') != fingerprint
+            or (__stats and index.get('stats') is None)
+            ):
+            index = self._build_index(__stats)
+            index['fingerprint'] = fingerprint
+            self._dump_index(index)
+
+        self.offsets = index['offsets']
+        self.stats = index['stats'] if __stats else None
+        return None
+
+    def _build_index(self, __stats: bool) -> dict[str, lib.t.Any]:
+        """Return byte offsets of all rows and, optionally, block stats."""
+
+        offsets: lib.array.array[int] = lib.array.array(
+            Constants.OFFSET_TYPECODE
+            )
+        data = self._mmap
+        size = len(data)
+        position = 0
+        while position < size:
+            if (end := data.find(b'\n', position)) == -1:
+                end = size
+            if end > position and not data[position:end].isspace():
+                offsets.append(position)
+            position = end + 1
+
+        if not __stats:
+            return {'offsets': offsets, 'stats': None}
+
+        stats: dict[str, tuple[list[lib.t.Any], list[lib.t.Any]]] = {}
+        defaults: dict[str, lib.t.Any] = {}
+        kinds: dict[str, tuple[type[lib.t.Any], ...]] = {}
+        for field, default in zip(self.cls.fields, self.cls._get_defaults()):
+            if Constants.NUMERIC_TYPES.issuperset(
+                types := typ.utl.check.get_checkable_types(
+                    self.cls.__dataclass_fields__[field]['type']
+                    )
+                ):
+                stats[field] = ([], [])
+                defaults[field] = default
+                kinds[field] = types
+        for start in range(0, len(offsets), self.block_size):
+            lo = dict.fromkeys(stats, lib.math.inf)
+            hi = dict.fromkeys(stats, -lib.math.inf)
+            for offset in offsets[start:start + self.block_size]:
+                if (row := self._read_stats_row(offset, defaults)) is None:
+                    lo = dict.fromkeys(stats, -lib.math.inf)
+                    hi = dict.fromkeys(stats, lib.math.inf)
+                    break
+                for field, value in row.items():
+                    if value is None:
+                        continue
+                    elif value.__class__ in kinds[field]:
+                        lo[field] = min(lo[field], value)
+                        hi[field] = max(hi[field], value)
+                    else:
+                        # Values not of the field type may be converted
+                        # on decoding (or fail to decode), so cannot be
+                        # compared reliably and the block is never skipped.
+                        lo[field] = -lib.math.inf
+                        hi[field] = lib.math.inf
+            for field, (mins, maxs) in stats.items():
+                mins.append(lo[field])
+                maxs.append(hi[field])
+
+        return {'offsets': offsets, 'stats': stats}
+
+    def _read_stats_row(
+        self,
+        __offset: int,
+        __defaults: dict[str, lib.t.Any]
+        ) -> lib.t.Optional[dict[str, lib.t.Any]]:
+        """
+        Return values of fields with stats for row at `offset`, \
+        or `None` if the row is not a JSON object.
+
+        """
+
+        try:
+            raw = core.codecs.utl.loads_json(self._read(__offset))
+        except Exception:
+            return None
+        if not isinstance(raw, dict):
+            return None
+
+        row = __defaults.copy()
+        for key, value in raw.items():
+            if (
+                isinstance(key, str)
+                and (field := core.strings.utl.cname_for(key, self.cls.fields))
+                and field in row
+                ):
+                row[field] = value
+        return row
+
+    def _read_index(self) -> dict[str, lib.t.Any]:
+        """
+        Return the index persisted at `index_path`, or an empty `dict` \
+        if missing or invalid.
+
+        """
+
+        try:
+            with open(self.index_path, 'rb') as f:
+                index: dict[str, lib.t.Any] = lib.json.loads(f.readline())
+                offsets: lib.array.array[int] = lib.array.array(
+                    Constants.OFFSET_TYPECODE
+                    )
+                offsets.frombytes(f.read())
+            if len(offsets) != index['count']:
+                return {}
+            index['offsets'] = offsets
+            if (stats := index['stats']) is not None:
+                index['stats'] = {
+                    field: (mins, maxs)
+                    for field, (mins, maxs)
+                    in stats.items()
+                    }
+        except Exception:
+            return {}
+
+        return index
+
+    def _dump_index(self, __index: dict[str, lib.t.Any]) -> None:
+        """
+        Persist `index` to `index_path`.
+
+        ---
+
+        The index is written atomically; failures to write are ignored.
+
+        """
+
+        header = {
+            'count': len(__index['offsets']),
+            'fingerprint': __index['fingerprint'],
+            'stats': __index['stats'],
+            }
+        tmp_path = f'{self.index_path}.{lib.os.getpid()}'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(lib.json.dumps(header).encode() + b'\n')
+                __index['offsets'].tofile(f)
+            lib.os.replace(tmp_path, self.index_path)
+        except Exception:
+            return None
+
+        return None
+
+    def _may_match(self, __query: queries.Query, __block: int) -> bool:
+        """
+        Return `False` only if index stats show no row in `block` \
+        can match `query`.
+
+        """
+
+        if self.stats is None:
+            return True
+        elif isinstance(__query, queries.AndQuery):
+            return all(self._may_match(q, __block) for q in __query.and_)
+        elif isinstance(__query, queries.OrQuery):
+            return any(self._may_match(q, __block) for q in __query.or_)
+        elif (
+            isinstance(__query, queries.obj.QueryCondition)
+            and (
+                field := core.strings.utl.cname_for(
+                    __query.field,
+                    self.cls.fields
+                    )
+                ) in self.stats
+            ):
+            key = next(
+                (k for k in __query.fields if k in Constants.STATS_OPERATORS),
+                None
+                )
+            if key is None or (
+                (value := getattr(__query, key)).__class__ not in (int, float)
+                ):
+                return True
+            mins, maxs = self.stats[field]
+            return Constants.STATS_OPERATORS[key](
+                mins[__block],
+                maxs[__block],
+                value
+                )
+        else:
+            return True
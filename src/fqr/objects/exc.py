@@ -3,7 +3,10 @@
 from .. import core
 
 __all__ = (
+    'BinaryEncodingError',
     'FieldAnnotationError',
+    'FrozenObjectError',
+    'IncompatibleSchemaError',
     'IncorrectCasingError',
     'IncorrectDefaultTypeError',
     'IncorrectTypeError',
@@ -60,6 +63,58 @@ class InvalidFieldRedefinitionError(BasePackageException[str]):
             )
 
 
+class FrozenObjectError(BasePackageException[str, str]):
+    """Cannot modify fields of a frozen object after instantiation."""
+
+    def __init__(self, name: str, field: str):
+        super().__init__(
+            ' '.join(
+                (
+                    'Cannot modify fields of a frozen object',
+                    'after instantiation.',
+                    f'\nCLASS: {name}',
+                    f'\nFIELD: {field}',
+                    )
+                ),
+            *(name, field)
+            )
+
+
+class IncompatibleSchemaError(BasePackageException[str, int, int]):
+    """Cannot restore state serialized for a different class schema."""
+
+    def __init__(self, name: str, version: int, expected: int):
+        super().__init__(
+            ' '.join(
+                (
+                    'Cannot restore state serialized for a different',
+                    'schema of the same class.',
+                    f'\nCLASS: {name}',
+                    f'\nVERSION: {version}',
+                    f'\nEXPECTED: {expected}',
+                    )
+                ),
+            *(name, version, expected)
+            )
+
+
+class BinaryEncodingError(BasePackageException[str, lib.t.Any]):
+    """Cannot encode field value in its fixed-size binary slot."""
+
+    def __init__(self, name: str, value: lib.t.Any):
+        super().__init__(
+            ' '.join(
+                (
+                    'Cannot encode field value in its fixed-size',
+                    'binary slot.',
+                    f'\nFIELD: {name}',
+                    f'\nVALUE: {value!r}',
+                    )
+                ),
+            *(name, value)
+            )
+
+
 class IncorrectCasingError(BasePackageException[lib.t.Iterable[str]]):
     """Incorrect field casing."""
 
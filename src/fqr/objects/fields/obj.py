@@ -435,7 +435,7 @@ class Field(objs.Object, lib.t.Generic[typ.AnyType]):
         for cname_, value in ckwargs.items():
             setattr(self, cname_, value)
 
-        self.__post_init__()
+        self._finalize_init()
 
     def __field_hash__(self) -> int:
         return hash(
@@ -736,7 +736,11 @@ class Field(objs.Object, lib.t.Generic[typ.AnyType]):
 
         """
 
-        parsed = core.codecs.utl.parse(value, self.type_)
+        parsed: typ.AnyType | core.codecs.enm.ParseErrorRef
+        if isinstance(value, str):
+            parsed = core.codecs.utl.get_str_decoder(self.type_)(value)
+        else:
+            parsed = core.codecs.utl.parse(value, self.type_)
         if isinstance(parsed, core.codecs.enm.ParseErrorRef):
             if raise_validation_error:
                 raise exc.TypeValidationError(self.name, self.type_, parsed)
@@ -0,0 +1,11 @@
+"""Frame modules."""
+
+from . import obj
+
+__all__ = (
+    'obj',
+    *obj.__all__
+    )
+
+
+from . obj import *
@@ -0,0 +1,346 @@
+"""Frame module."""
+
+__all__ = (
+    'ObjectFrame',
+    )
+
+from ... import core
+
+from .. import cfg
+from .. import enm
+from .. import lib
+from .. import queries
+from .. import typ
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    ARRAY_TYPECODES: dict[type, str] = {
+        bool: 'b',
+        float: 'd',
+        int: 'q',
+        }
+    """Typecodes for fields stored in `array.array` columns."""
+
+    ARRAY_TYPES: dict[str, type] = {
+        typecode: tp
+        for tp, typecode
+        in ARRAY_TYPECODES.items()
+        }
+    """Python types for values stored in `array.array` columns."""
+
+    SCAN_OPERATORS: dict[
+        str,
+        lib.t.Callable[[lib.t.Any, lib.t.Any], lib.t.Any]
+        ] = {
+        'contains': lib.operator.contains,
+        'eq': lib.operator.eq,
+        'ge': lib.operator.ge,
+        'gt': lib.operator.gt,
+        'le': lib.operator.le,
+        'lt': lib.operator.lt,
+        'ne': lib.operator.ne,
+        }
+    """Column scan operators per `QueryCondition` field."""
+
+
+def _compare(
+    __operator: lib.t.Callable[[lib.t.Any, lib.t.Any], lib.t.Any],
+    __value: lib.t.Any,
+    __other: lib.t.Any
+    ) -> bool:
+    """Compare values, treating incomparable values as non-matching."""
+
+    try:
+        return bool(__operator(__value, __other))
+    except TypeError:
+        return False
+
+
+class ObjectFrame(lib.t.Generic[typ.ObjectType]):
+    """
+    Columnar container for a large collection of a single `Object` class.
+
+    ---
+
+    ### Usage
+
+    Values are stored per field, in a column:
+
+    * `int`, `float` and `bool` fields in an `array.array`.
+    * `str` fields in a `list` of interned strings.
+    * All other fields in a `list`.
+
+    A column falls back to a `list` automatically if a value \
+    cannot be stored in its `array.array` (i.e. `None`).
+
+    Rows are materialized back to `Object` instances lazily, on \
+    iteration or indexing, and share any mutable values with the frame.
+
+    `Query` trees are executed as scans over columns, \
+    returning a new `ObjectFrame` with only the matching rows.
+
+    ---
+
+    ### Example
+
+    ```py
+    frame = ObjectFrame(Pet, [{'name': 'Fido'}, Pet(name='Rex')])
+
+    frame.filter((Pet.name == 'Rex') | (Pet.name << 'F'))
+    frame.project('name')
+    {'name': ['Fido', 'Rex']}
+
+    ```
+
+    """
+
+    __slots__ = ('_kinds', '_size', 'cls', 'columns')
+
+    def __init__(
+        self,
+        cls: type[typ.ObjectType],
+        rows: lib.t.Iterable[typ.ObjectType | typ.SnakeDict] = ()
+        ):
+        self.cls = cls
+        self.columns: dict[str, typ.Column] = {}
+        self._kinds: dict[str, lib.t.Optional[type]] = {}
+        self._size = 0
+        for field in cls.fields:
+            types = typ.utl.check.get_checkable_types(
+                cls.__dataclass_fields__[field]['type']
+                )
+            kind = types[0] if len(types) == 1 else None
+            self._kinds[field] = kind
+            self.columns[field] = (
+                lib.array.array(Constants.ARRAY_TYPECODES[kind])
+                if kind in Constants.ARRAY_TYPECODES
+                else []
+                )
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> lib.t.Iterator[typ.ObjectType]:
+        return self._materialize(range(self._size))
+
+    @lib.t.overload
+    def __getitem__(self, __index: int) -> typ.ObjectType: ...
+    @lib.t.overload
+    def __getitem__(self, __index: slice) -> lib.Self: ...
+    def __getitem__(
+        self,
+        __index: int | slice
+        ) -> typ.ObjectType | lib.Self:
+        if isinstance(__index, slice):
+            return self._take(range(self._size)[__index])
+        return next(self._materialize((range(self._size)[__index], )))
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}[{self.cls.__name__}]({self._size})'
+            )
+
+    def append(self, __row: typ.ObjectType | typ.SnakeDict) -> None:
+        """Append a single row from an `Object` or `dict`."""
+
+        return self.extend((__row, ))
+
+    def extend(
+        self,
+        __rows: lib.t.Iterable[typ.ObjectType | typ.SnakeDict]
+        ) -> None:
+        """Append rows from an iterable of `Objects` and / or `dicts`."""
+
+        rows = [
+            self.cls(row) if isinstance(row, dict) else row
+            for row
+            in __rows
+            ]
+        for field, values in zip(
+            self.cls.fields,
+            zip(*(row._get_values() for row in rows))
+            ):
+            self._extend_column(field, list(values))
+        self._size += len(rows)
+        return None
+
+    def column(self, __field: str) -> typ.Column:
+        """
+        Return the column for `field`.
+
+        ---
+
+        Columns are returned as stored, without copying; \
+        `bool` columns hold `0` or `1`.
+
+        """
+
+        if (field := core.strings.utl.cname_for(__field, self.cls.fields)):
+            return self.columns[field]
+        raise KeyError(__field)
+
+    def project(self, *fields: str) -> dict[str, typ.Column]:
+        """Return columns for `fields` only, keyed by field."""
+
+        return {field: self.column(field) for field in fields}
+
+    def filter(self, __query: queries.Query) -> lib.Self:
+        """
+        Return a new `ObjectFrame` of rows matching `query`.
+
+        ---
+
+        Any sorting and limit specified on the top-level `Query` \
+        are applied to the result. `None` values sort last in \
+        ascending order, and first in descending order.
+
+        """
+
+        return self._select(
+            list(
+                lib.itertools.compress(
+                    range(self._size),
+                    self._scan(__query)
+                    )
+                ),
+            __query
+            )
+
+    def _select(
+        self,
+        __indices: list[int],
+        __query: queries.Query
+        ) -> lib.Self:
+        """
+        Return a new `ObjectFrame` of rows at `indices`, sorted and \
+        limited as specified on `query`.
+
+        """
+
+        indices = __indices
+        for sort_by in reversed(__query.sorting):
+            column = self.column(sort_by.field)
+            indices.sort(
+                key=lambda i: (column[i] is None, column[i]),
+                reverse=sort_by.direction == 'desc'
+                )
+        if __query.limit is not None:
+            indices = indices[:__query.limit]
+
+        return self._take(indices)
+
+    def _extend_column(self, __field: str, __values: list[lib.t.Any]) -> None:
+        """Extend column for `field`, falling back to a `list` as needed."""
+
+        column = self.columns[__field]
+        if isinstance(column, lib.array.array):
+            size = len(column)
+            kind = Constants.ARRAY_TYPES[column.typecode]
+            if {*map(type, __values)} <= {kind}:
+                try:
+                    return column.extend(__values)
+                except OverflowError:
+                    del column[size:]
+            column = self.columns[__field] = list(map(kind, column))
+        elif self._kinds[__field] is str:
+            __values = [
+                lib.sys.intern(v) if v.__class__ is str else v
+                for v
+                in __values
+                ]
+        return column.extend(__values)
+
+    def _materialize(
+        self,
+        __indices: lib.t.Iterable[int]
+        ) -> lib.t.Iterator[typ.ObjectType]:
+        """Yield rows at `indices` as `Object` instances."""
+
+        members = self.cls._get_members()
+        readers = [
+            (
+                isinstance(column, lib.array.array)
+                and column.typecode == Constants.ARRAY_TYPECODES[bool],
+                column
+                )
+            for column
+            in self.columns.values()
+            ]
+        for index in __indices:
+            object_ = object.__new__(self.cls)
+            object_.__clean__ = values = tuple(
+                bool(column[index]) if is_bool else column[index]
+                for is_bool, column
+                in readers
+                )
+            for member, value in zip(members, values):
+                member.__set__(object_, value)
+            yield object_
+
+    def _take(self, __indices: lib.t.Sequence[int]) -> lib.Self:
+        """Return a new `ObjectFrame` of rows at `indices`."""
+
+        frame = self.__class__(self.cls)
+        for field, column in self.columns.items():
+            values = map(column.__getitem__, __indices)
+            frame.columns[field] = (
+                lib.array.array(column.typecode, values)
+                if isinstance(column, lib.array.array)
+                else list(values)
+                )
+        frame._size = len(__indices)
+        return frame
+
+    def _scan(self, __query: queries.Query) -> list[bool]:
+        """Return a mask of rows matching `query`."""
+
+        if isinstance(__query, queries.AndQuery):
+            return lib.functools.reduce(
+                lambda a, b: list(map(lib.operator.and_, a, b)),
+                (self._scan(query) for query in __query.and_)
+                )
+        elif isinstance(__query, queries.OrQuery):
+            return lib.functools.reduce(
+                lambda a, b: list(map(lib.operator.or_, a, b)),
+                (self._scan(query) for query in __query.or_)
+                )
+        elif isinstance(__query, queries.InvertQuery):
+            return list(map(lib.operator.not_, self._scan(__query.invert)))
+        elif isinstance(__query, queries.SimilarQueryCondition):
+            like = str(__query.like)
+            threshold = (
+                __query.threshold
+                if __query.threshold is not None
+                else enm.MatchThreshold.default.value
+                )
+            return [
+                value is not None
+                and lib.difflib.SequenceMatcher(
+                    None,
+                    str(value),
+                    like
+                    ).ratio() >= threshold
+                for value
+                in self.column(__query.field)
+                ]
+        elif isinstance(__query, queries.obj.QueryCondition):
+            column = self.column(__query.field)
+            key = next(
+                k
+                for k
+                in __query.fields
+                if k in Constants.SCAN_OPERATORS
+                )
+            operator_ = Constants.SCAN_OPERATORS[key]
+            value = getattr(__query, key)
+            try:
+                return list(
+                    map(operator_, column, lib.itertools.repeat(value))
+                    )
+            except TypeError:
+                return [_compare(operator_, v, value) for v in column]
+        else:
+            return [True] * self._size
@@ -3,14 +3,30 @@
 from .. import core
 
 __all__ = (
+    'array',
     'copy',
+    'copyreg',
     'dataclass_transform',
+    'difflib',
     'inspect',
+    'math',
+    'mmap',
+    'operator',
+    'threading',
+    'weakref',
     *core.lib.__all__
     )
 
+import array
 import copy
+import copyreg
+import difflib
 import inspect
+import math
+import mmap
+import operator
+import threading
+import weakref
 
 from .. core . lib import *
 
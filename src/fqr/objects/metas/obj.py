@@ -1,6 +1,7 @@
 """Metaclass module."""
 
 __all__ = (
+    'Deferred',
     'Meta',
     )
 
@@ -20,15 +21,95 @@ if lib.t.TYPE_CHECKING:  # pragma: no cover
 class Constants(cfg.Constants):
     """Constant values specific to this file."""
 
+    REBASES: 'lib.weakref.WeakValueDictionary[tuple[type, ...], Meta]' = (
+        lib.weakref.WeakValueDictionary()
+        )
+    """
+    Local cache for common bases synthesized per tuple of bases.
+
+    ---
+
+    Entries are dropped once no class derives from the common base.
+
+    """
+
+    CLASSES: 'lib.weakref.WeakSet[Meta]' = lib.weakref.WeakSet()
+    """
+    All classes created by `Meta`, whose memos (values derived from \
+    fields) are cleared when a field they inherit is redefined.
+
+    """
+
+
+class Deferred:
+    """
+    Placeholder for a class attribute of a class defined in lazy mode.
+
+    ---
+
+    Finalizes its owner class on first access, after which the \
+    placeholder is replaced by the actual class attribute.
+
+    ---
+
+    Deferred class state is shared by reference across all of a \
+    class's placeholders and is emptied once the class is finalized.
+
+    """
+
+    __slots__ = ('deferred', 'name', 'owner')
+
+    def __init__(self, deferred: dict[str, lib.t.Any]) -> None:
+        self.deferred = deferred
+
+    def __set_name__(self, owner: 'Meta', name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(
+        self,
+        instance: lib.t.Optional[lib.t.Any],
+        owner: lib.t.Optional[type[lib.t.Any]] = None
+        ) -> lib.t.Any:
+        utl.finalize(self.owner, self.deferred)
+        obj_ = self.owner if instance is None else instance
+        if (
+            type.__getattribute__(self.owner, '__dict__').get(self.name)
+            is self
+            ):
+            # Owner is still being finalized (for example, while
+            # resolving a self-referencing annotation), so fall back
+            # to the value inherited from its bases in the meantime.
+            return getattr(super(self.owner, obj_), self.name)
+        else:
+            return getattr(obj_, self.name)
+
 
 class Meta(type):
-    """Base class constructor."""
+    """
+    Base class constructor.
+
+    ---
+
+    Class definitions are parsed for `Fields` on creation, unless \
+    defined in lazy mode (either by passing `lazy=True` as a class \
+    keyword or by setting the `LAZY_FINALIZATION` environment variable \
+    to `true`), in which case parsing is deferred until first \
+    instantiation or first access of any of the class's fields.
+
+    ---
+
+    Classes with more than one `Object` base are never deferred.
+
+    """
 
     if lib.t.TYPE_CHECKING:  # pragma: no cover
         __annotations__: typ.SnakeDict
         __dict__: dict[typ.AnyString, lib.t.Any]
         __dataclass_fields__: lib.t.ClassVar[typ.DataClassFields]
         __heritage__: lib.t.ClassVar[tuple['Meta', ...]]
+        __lineage__: lib.t.ClassVar[frozenset[type]]
+        __memo__: lib.t.ClassVar[dict[str, lib.t.Any]]
 
         enumerations: lib.t.ClassVar[dict[str, tuple[typ.Primitive, ...]]]
         fields: lib.t.ClassVar[typ.FieldsTuple]
@@ -45,7 +126,7 @@ class Meta(type):
         heritage: tuple[type, ...] = __bases
         slots: list[typ.string[typ.snake_case]]
         _slots: tuple[typ.string[typ.snake_case], ...] | str = (
-            __namespace.get(Constants.__SLOTS__, ())
+            __namespace.pop(Constants.__SLOTS__, ())
             )
         if (
             isinstance(_slots, str)
@@ -59,25 +140,66 @@ class Meta(type):
         module: str = __namespace.get(Constants.__MODULE__, '')
         annotations: typ.SnakeDict
         annotations = __namespace.pop(Constants.__ANNOTATIONS__, {})
-        annotations |= {
-            k: typ.utl.hint.resolve_type(
-                v,
-                lib.sys.modules[module].__dict__
-                )
-            for k, v
-            in annotations.items()
-            }
-
-        base_count = 0
-        for _base in reversed(__bases):
-            if isinstance(_base, Meta):
-                base_count += 1
-                fields |= _base.__dataclass_fields__
+        lazy: bool = kwargs.pop(Constants.LAZY, Constants.LAZY_FINALIZATION)
 
         __namespace.pop(Constants.CLASS_AS_DICT, None)
         annotations.pop(Constants.CLASS_AS_DICT, None)
 
-        if base_count > 1:
+        meta_bases = tuple(b for b in __bases if isinstance(b, Meta))
+        base_count = len(meta_bases)
+
+        if (
+            lazy
+            and base_count <= 1
+            and module not in {
+                Constants.FIELDS_MODULE,
+                Constants.OBJECTS_MODULE
+                }
+            ):
+            deferred: dict[str, lib.t.Any] = {
+                Constants.__ANNOTATIONS__: annotations,
+                Constants.__DICT__: __namespace.copy(),
+                Constants.__HERITAGE__: meta_bases,
+                Constants.__MODULE__: module,
+                }
+            slots = utl.defer_new_annotations(
+                __namespace,
+                annotations,
+                module,
+                slots
+                )
+            cls = super().__new__(
+                mcs,
+                __name,
+                __bases,
+                {
+                    Constants.__SLOTS__: tuple(slots),
+                    **__namespace,
+                    Constants.__HERITAGE__: heritage,
+                    Constants.__MEMO__: {},
+                    **{
+                        name: Deferred(deferred)
+                        for name
+                        in Constants.DEFERRED_ATTRS
+                        }
+                    },
+                **kwargs
+                )
+            type.__setattr__(
+                cls,
+                Constants.__LINEAGE__,
+                utl.get_lineage(cls)
+                )
+            Constants.CLASSES.add(cls)
+            return cls
+
+        utl.resolve_annotations(annotations, module)
+        for _base in reversed(meta_bases):
+            fields |= _base.__dataclass_fields__
+
+        if base_count > 1 and heritage in Constants.REBASES:
+            __bases = (Constants.REBASES[heritage], )
+        elif base_count > 1:
             from .. import objs
             common_annotations: typ.SnakeDict = {}
             common_base_names: list[str] = []
@@ -93,7 +215,7 @@ class Meta(type):
                         if __base.__name__ not in common_base_names:
                             common_base_names.insert(0, __base.__name__)
                             common_bases.insert(0, __base)
-                            for slot in __base.__slots__:
+                            for slot in getattr(__base, Constants.__SLOTS__):
                                 if slot not in common_slots:
                                     common_slots.append(slot)
                             common_annotations |= __base.__annotations__
@@ -112,47 +234,32 @@ class Meta(type):
             common_base = Meta(
                 Constants.DELIM_REBASE.join(common_base_names[:base_count]),
                 (objs.Object, ),
-                common_namespace
+                common_namespace,
+                lazy=False
                 )
+            Constants.REBASES[heritage] = common_base
             __bases = (common_base, )
 
         if module != Constants.OBJECTS_MODULE:
-            base_fields = set(fields.keys())
-            
-            defaults, slots, fields = (
-                utl.parse_new_namespace(
-                    __namespace,
-                    annotations,
-                    module,
-                    slots,
-                    fields
-                    )
-                )
-
-            for name in defaults:
-                __namespace.pop(name)
-
-            slots, fields = (
-                utl.parse_new_annotations(
-                    __namespace,
-                    annotations,
-                    module,
-                    slots,
-                    fields,
-                    base_fields
-                    )
+            slots, fields = utl.parse_new_fields(
+                __namespace,
+                annotations,
+                module,
+                slots,
+                fields
                 )
 
         fields_tuple = tuple(sorted(fields))
 
         namespace = {
-            Constants.__SLOTS__: tuple(slots),
+            Constants.__SLOTS__: tuple(dict.fromkeys(slots)),
             **__namespace,
             }
 
         namespace[Constants.__ANNOTATIONS__] = annotations
         namespace[Constants.__DATACLASS_FIELDS__] = fields
         namespace[Constants.__HERITAGE__] = heritage
+        namespace[Constants.__MEMO__] = {}
 
         namespace[Constants.FIELDS] = fields_tuple
         namespace[Constants.ENUMERATIONS] = (
@@ -163,7 +270,7 @@ class Meta(type):
         else:
             namespace[Constants.HASH_FIELDS] = ('name', )
 
-        return super().__new__(
+        cls = super().__new__(
             mcs,
             __name,
             __bases,
@@ -171,6 +278,11 @@ class Meta(type):
             **kwargs
             )
 
+        type.__setattr__(cls, Constants.__LINEAGE__, utl.get_lineage(cls))
+        Constants.CLASSES.add(cls)
+
+        return cls
+
     def __repr__(cls) -> str:
         """
         Return constructor represented as a neatly formatted JSON string.
@@ -183,7 +295,7 @@ class Meta(type):
         __fields: dict[str, 'typ.AnyField[lib.t.Any]'] = (
             type.__getattribute__(cls, '__dataclass_fields__')
             )
-        if (field := __fields.get(__name)):
+        if (field := __fields.get(__name)) is not None:
             return field
         elif __name == 'class_as_dict':  # pragma: no cover
             # This clause exists to address sphinx-doc error
@@ -255,18 +367,23 @@ class Meta(type):
     def __instancecheck__(cls, __instance: lib.t.Any) -> bool:
         """Instance check that considers slotted heritage."""
 
-        return (
-            super().__instancecheck__(__instance)
-            or cls in getattr(__instance, '__heritage__', ())
-            )
+        if isinstance((tp := type(__instance)), Meta):
+            return cls in type.__getattribute__(tp, Constants.__LINEAGE__)
+        else:
+            return type.__instancecheck__(cls, __instance)
 
     def __subclasscheck__(cls, __subclass: type[lib.t.Any]) -> bool:
         """Subclass check that considers slotted heritage."""
 
-        return (
-            super().__subclasscheck__(__subclass)
-            or cls in getattr(__subclass, '__heritage__', ())
-            )
+        if __subclass is cls:
+            return True
+        elif isinstance(__subclass, Meta):
+            return cls in type.__getattribute__(
+                __subclass,
+                Constants.__LINEAGE__
+                )
+        else:
+            return type.__subclasscheck__(cls, __subclass)
 
     def __setitem__(
         cls,
@@ -302,6 +419,9 @@ class Meta(type):
                 __value['default']
                 )
         elif k is not None:
+            for _cls in tuple(Constants.CLASSES):
+                if cls in type.__getattribute__(_cls, Constants.__LINEAGE__):
+                    type.__getattribute__(_cls, Constants.__MEMO__).clear()
             value_: 'fields_.Field[lib.t.Any]' = __value
             cls.__dataclass_fields__[k].update(value_)  # type: ignore[arg-type]
             return None
@@ -3,8 +3,13 @@
 from .. import utl
 
 __all__ = (
+    'defer_new_annotations',
+    'finalize',
+    'get_lineage',
     'parse_new_annotations',
+    'parse_new_fields',
     'parse_new_namespace',
+    'resolve_annotations',
     *utl.__all__
     )
 
@@ -21,6 +26,70 @@ from .. utl import *
 class Constants(cfg.Constants):
     """Constant values specific to this file."""
 
+    LOCK = lib.threading.RLock()
+    """Lock guarding finalization of lazily defined classes."""
+
+
+def resolve_annotations(
+    __annotations: typ.SnakeDict,
+    __module: str
+    ) -> typ.SnakeDict:
+    """
+    Resolve passed `__annotations` in place against the namespace of \
+    `__module`.
+
+    Returns updated `__annotations`.
+
+    """
+
+    __annotations |= {
+        k: typ.utl.hint.resolve_type(
+            v,
+            lib.sys.modules[__module].__dict__
+            )
+        for k, v
+        in __annotations.items()
+        }
+
+    return __annotations
+
+
+def defer_new_annotations(
+    __namespace: dict[typ.AnyString, lib.t.Any],
+    __annotations: typ.SnakeDict,
+    __module: str,
+    __slots: list[typ.string[typ.snake_case]]
+    ) -> list[typ.string[typ.snake_case]]:
+    """
+    Reserve `__slots` for passed `__annotations` without parsing them \
+    for valid `Fields`, deferring that work until class finalization.
+
+    Returns updated `__slots`.
+
+    ---
+
+    Passed `__namespace` will be mutated inplace, removing all key, \
+    value pairs where keys overlap with those reserved as `__slots`.
+
+    ---
+
+    Only annotations that are still `str` or `ForwardRef` are resolved \
+    here, and only to tell wrapper types (like `ClassVar`) apart.
+
+    """
+
+    for name, dtype in __annotations.items():
+        if isinstance(dtype, (str, lib.t.ForwardRef)):
+            dtype = typ.utl.hint.resolve_type(
+                dtype,
+                lib.sys.modules[__module].__dict__
+                )
+        if not typ.utl.check.is_wrapper_type(dtype):
+            __namespace.pop(name, None)
+            __slots.append(name)
+
+    return __slots
+
 
 def parse_new_annotations(
     __namespace: dict[typ.AnyString, lib.t.Any],
@@ -179,3 +248,137 @@ def parse_new_namespace(
             defaults.append(name)
 
     return defaults, __slots, __fields
+
+
+def parse_new_fields(
+    __namespace: dict[typ.AnyString, lib.t.Any],
+    __annotations: typ.SnakeDict,
+    __module: str,
+    __slots: list[typ.string[typ.snake_case]],
+    __fields: typ.DataClassFields,
+    ) -> tuple[
+        list[typ.string[typ.snake_case]],
+        typ.DataClassFields
+        ] | lib.Never:
+    """
+    Parse passed `__namespace`, then `__annotations`, for valid \
+    `Fields`.
+
+    Returns updated `__slots` and `__fields`.
+
+    ---
+
+    Passed `__namespace` will be mutated inplace, removing all key, \
+    value pairs parsed as `Fields`.
+
+    ---
+
+    Raises a corresponding exception if class definition invalid.
+
+    """
+
+    base_fields = set(__fields.keys())
+
+    defaults, __slots, __fields = parse_new_namespace(
+        __namespace,
+        __annotations,
+        __module,
+        __slots,
+        __fields
+        )
+
+    for name in defaults:
+        __namespace.pop(name)
+
+    return parse_new_annotations(
+        __namespace,
+        __annotations,
+        __module,
+        __slots,
+        __fields,
+        base_fields
+        )
+
+
+def get_lineage(__cls: 'typ.obj.MetaLike') -> frozenset[type]:
+    """
+    Return all classes from which `__cls` inherits, including \
+    (transitively) those only inherited through slotted heritage.
+
+    """
+
+    # Read without finalizing any class defined in lazy mode.
+    return frozenset(type.__getattribute__(__cls, '__mro__')).union(
+        *(
+            type.__getattribute__(_base, '__dict__').get(
+                Constants.__LINEAGE__,
+                type.__getattribute__(_base, '__mro__')
+                )
+            for _base
+            in type.__getattribute__(__cls, '__dict__')[
+                Constants.__HERITAGE__
+                ]
+            )
+        )
+
+
+def finalize(
+    __cls: 'typ.obj.MetaLike',
+    __deferred: dict[str, lib.t.Any]
+    ) -> lib.t.Optional[lib.Never]:
+    """
+    Finalize a class defined in lazy mode, parsing its `__deferred` \
+    namespace and annotations for valid `Fields` and setting all \
+    derived class attributes.
+
+    ---
+
+    Does nothing if `__cls` has already been finalized.
+
+    ---
+
+    Raises a corresponding exception if class definition invalid, \
+    in which case `__cls` remains unfinalized.
+
+    """
+
+    with Constants.LOCK:
+        if not __deferred:
+            return None
+
+        deferred = __deferred.copy()
+        __deferred.clear()
+
+        try:
+            namespace: dict[typ.AnyString, lib.t.Any] = (
+                deferred[Constants.__DICT__].copy()
+                )
+            module: str = deferred[Constants.__MODULE__]
+            annotations = resolve_annotations(
+                deferred[Constants.__ANNOTATIONS__],
+                module
+                )
+            fields: typ.DataClassFields = {}
+            for _base in reversed(deferred[Constants.__HERITAGE__]):
+                fields |= _base.__dataclass_fields__
+            _, fields = parse_new_fields(
+                namespace,
+                annotations,
+                module,
+                [],
+                fields
+                )
+        except BaseException:
+            __deferred |= deferred
+            raise
+
+        for name, value in (
+            (Constants.__ANNOTATIONS__, annotations),
+            (Constants.__DATACLASS_FIELDS__, fields),
+            (Constants.FIELDS, tuple(sorted(fields))),
+            (Constants.ENUMERATIONS, get_enumerations_from_fields(fields)),
+            (Constants.HASH_FIELDS, get_fields_for_hash(fields)),
+            ):
+            type.__setattr__(__cls, name, value)
+
+    return None
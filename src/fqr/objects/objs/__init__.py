@@ -2,9 +2,10 @@
 
 __all__ = (
     'obj',
+    'FrozenObject',
     'Object',
     )
 
 from . import obj
 
-from . obj import Object
+from . obj import FrozenObject, Object
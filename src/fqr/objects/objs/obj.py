@@ -1,6 +1,7 @@
 """Object module."""
 
 __all__ = (
+    'FrozenObject',
     'Object',
     )
 
@@ -20,6 +21,44 @@ if lib.t.TYPE_CHECKING:  # pragma: no cover
 class Constants(cfg.Constants):
     """Constant values specific to this file."""
 
+    MEMO_DEFAULTS = 'defaults'
+    """Key of default field values in the memo of a class."""
+
+    MEMO_GETTER = 'getter'
+    """Key of the callable reading field values in the memo of a class."""
+
+    MEMO_MEMBERS = 'members'
+    """Key of field slot descriptors in the memo of a class."""
+
+    MEMO_SLOTS = 'slots'
+    """Key of all other slot descriptors in the memo of a class."""
+
+    UNPICKLED_SLOTS = frozenset(('__clean__', cfg.Constants.__CACHE__))
+    """Non-field slots rebuilt, rather than restored, on unpickling."""
+
+    IMMUTABLE_TYPES: tuple[type, ...] = (
+        bool,
+        bytes,
+        complex,
+        float,
+        int,
+        lib.types.NoneType,
+        str,
+        lib.datetime.date,
+        lib.datetime.time,
+        lib.datetime.timedelta,
+        lib.decimal.Decimal,
+        lib.enum.Enum,
+        )
+    """Types of values that cannot be modified once created."""
+
+    INTERNED: 'lib.weakref.WeakValueDictionary[lib.t.Hashable, FrozenObject]'
+    INTERNED = lib.weakref.WeakValueDictionary()
+    """Canonical instances of `FrozenObjects`, keyed by class and values."""
+
+    LAZY_VALUE = core.codecs.obj.LazyValue
+    """Class of raw field values left for decoding on first access."""
+
 
 @lib.dataclass_transform(
     field_specifiers=(typ.Field, )
@@ -31,11 +70,18 @@ class ObjectBase(metaclass=metas.Meta):
     __dict__: dict[typ.AnyString, lib.t.Any]
     __dataclass_fields__: lib.t.ClassVar[typ.DataClassFields]
     __heritage__: lib.t.ClassVar[tuple['metas.Meta', ...]]
+    __lineage__: lib.t.ClassVar[frozenset[type]]
+    __memo__: lib.t.ClassVar[dict[str, lib.t.Any]]
 
     enumerations: lib.t.ClassVar[dict[str, tuple[typ.Primitive, ...]]]
     fields: lib.t.ClassVar[typ.FieldsTuple]
     hash_fields: lib.t.ClassVar[typ.FieldsTuple]
 
+    __slots__ = ('__clean__', )
+
+    if lib.t.TYPE_CHECKING:  # pragma: no cover
+        __clean__: tuple[lib.t.Any, ...]
+
     def __repr__(self) -> str:
         """
         Return constructor represented as a neatly formatted JSON string.
@@ -73,11 +119,39 @@ class ObjectBase(metaclass=metas.Meta):
         for cname, value in ckwargs.items():
             setattr(self, cname, value)
 
-        self.__post_init__()
+        self._finalize_init()
 
     def __post_init__(self) -> None:
         """Method that will always run after instantiation."""
 
+    def __getattr__(self, __name: str) -> lib.t.Any:
+        """
+        Decode, set and return the raw value of a lazy field \
+        (see `core.codecs.utl.parse()`) on first access.
+
+        """
+
+        if (
+            __name not in self.__dataclass_fields__
+            or (
+                value := (clean := self.__clean__)[
+                    (index := self.fields.index(__name))
+                    ]
+                ).__class__ is not Constants.LAZY_VALUE
+            ):
+            return object.__getattribute__(self, __name)
+
+        field = self.__dataclass_fields__[self.fields[index]]
+        if isinstance(
+            (parsed := core.codecs.utl.parse(value.value, field.type_)),
+            core.codecs.enm.ParseErrorRef
+            ):
+            raise exc.IncorrectTypeError(__name, field.type_, value.value)
+
+        object.__setattr__(self, __name, parsed)
+        self.__clean__ = (*clean[:index], parsed, *clean[index + 1:])
+        return parsed
+
     def __delitem__(self, __key: lib.t.Any) -> lib.t.Optional[lib.Never]:
         """Reset current value for key to field default."""
 
@@ -234,7 +308,11 @@ class ObjectBase(metaclass=metas.Meta):
     def __bool__(self) -> bool:
         """Determine truthiness by diff with default field values."""
 
-        return bool(self - self.__class__())
+        return any(
+            getattr(self, field, value) != value
+            for field, value
+            in zip(self.fields, self._get_defaults())
+            )
 
     @lib.t.overload
     def __eq__(
@@ -333,23 +411,7 @@ class ObjectBase(metaclass=metas.Meta):
 
         """
 
-        if not all(field in other for field in self.__dataclass_fields__):
-            raise exc.InvalidObjectComparisonError(self, other)
-        else:
-            object_ = self.__class__()
-            for field, __field in self.__dataclass_fields__.items():
-                if typ.utl.check.is_field(self):
-                    default_value = __field['default']
-                else:
-                    default_value = __field.factory()
-                if (
-                    self[field] == default_value
-                    and other[field] != default_value
-                    ):
-                    object_[field] = other[field]
-                else:
-                    object_[field] = self[field]
-            return object_
+        return self._merge(other, False, False)
 
     def __rshift__(
         self,
@@ -361,13 +423,29 @@ class ObjectBase(metaclass=metas.Meta):
 
         """
 
-        object_ = self.__class__()
-        for field, __field in self.__dataclass_fields__.items():
-            if other[field] != __field.factory():
-                object_[field] = other[field]
-            else:
-                object_[field] = self[field]
-        return object_
+        return self._merge(other, True, False)
+
+    def __ilshift__(  # type: ignore[misc]
+        self,
+        other: typ.obj.ObjectLike,
+        /
+        ) -> lib.Self:
+        """
+        Interpolate values from other if populated with non-default \
+        in place, without mutating other.
+
+        """
+
+        return self._merge(other, False, True)
+
+    def __irshift__(self, other: typ.obj.ObjectLike, /) -> lib.Self:
+        """
+        Overwrite values from other if populated with non-default \
+        in place, without mutating other.
+
+        """
+
+        return self._merge(other, True, True)
 
     def __reversed__(self) -> lib.t.Iterator[typ.string[typ.snake_case]]:
         """
@@ -383,26 +461,140 @@ class ObjectBase(metaclass=metas.Meta):
             yield field
 
     def __copy__(self) -> lib.Self:
-        """Return a copy of the instance."""
+        """
+        Return a shallow copy of the instance.
+
+        ---
 
-        return self.__class__(dict(self))
+        `__post_init__()` is run once fields are copied, after which \
+        all other slots (of the class and its bases) are copied too.
+
+        """
+
+        object_ = object.__new__(self.__class__)
+        object_.__clean__ = self.__clean__
+        for member in self._get_members():
+            try:
+                member.__set__(object_, member.__get__(self))
+            except AttributeError:
+                continue
+        object_._finalize_copy()
+        for member in self._get_slots():
+            try:
+                member.__set__(object_, member.__get__(self))
+            except AttributeError:
+                continue
+
+        return object_
 
     def __deepcopy__(
         self,
-        memo: lib.t.Optional[typ.AnyDict] = None
+        memo: lib.t.Optional[dict[int, typ.AnyType]] = None
         ) -> lib.Self:
-        """Return a deep copy of the instance."""
+        """
+        Return a deep copy of the instance.
 
-        return self.__copy__()
+        ---
+
+        Nested `Objects` and containers are cloned structurally, \
+        preserving any shared or cyclic references.
+
+        ---
+
+        `__post_init__()` is run once fields are copied, after which \
+        all other slots (of the class and its bases) are copied too.
+
+        """
+
+        if memo is None:
+            memo = {}
+
+        object_ = memo[id(self)] = object.__new__(self.__class__)
+        object_.__clean__ = lib.copy.deepcopy(self.__clean__, memo)
+        for member in self._get_members():
+            try:
+                value = member.__get__(self)
+            except AttributeError:
+                continue
+            member.__set__(object_, lib.copy.deepcopy(value, memo))
+        object_._finalize_copy()
+        for member in self._get_slots():
+            try:
+                value = member.__get__(self)
+            except AttributeError:
+                continue
+            member.__set__(object_, lib.copy.deepcopy(value, memo))
+
+        return object_
 
     def __getstate__(self) -> typ.SnakeDict:
         return dict(self)
 
-    def __setstate__(self, state: typ.SnakeDict) -> None:
+    def __setstate__(
+        self,
+        state: typ.SnakeDict | tuple[lib.t.Any, ...]
+        ) -> lib.t.Optional[lib.Never]:
+        if isinstance(state, tuple):
+            version, values, *slots = state
+            if version != (expected := self._get_schema_version()):
+                raise exc.IncompatibleSchemaError(
+                    self.__class__.__name__,
+                    version,
+                    expected
+                    )
+            for member, value in zip(self._get_members(), values):
+                member.__set__(self, value)
+            self.__clean__ = values
+            for name, value in (slots[0] if slots else {}).items():
+                object.__setattr__(self, name, value)
+            return None
+
         other: typ.obj.ObjectLike = self.__class__(state)
         self.update(other)
+        self.mark_clean()
         return None
 
+    def __reduce_ex__(
+        self,
+        __protocol: lib.t.SupportsIndex
+        ) -> tuple[
+            lib.t.Callable[..., lib.Self],
+            tuple[type[lib.Self]],
+            tuple[lib.t.Any, ...]
+            ]:
+        """
+        Return a compact representation of the instance for `pickle`.
+
+        ---
+
+        Field values are pickled positionally, in `fields` order, \
+        alongside a tag identifying the schema of the class, and are \
+        restored directly on unpickling, without instantiation.
+
+        Any other slots set on the instance (of the class and its \
+        bases) are pickled by name after field values.
+
+        """
+
+        slots: dict[str, lib.t.Any] = {}
+        for member in self._get_slots():
+            if member.__name__ in Constants.UNPICKLED_SLOTS:
+                continue
+            try:
+                slots[member.__name__] = member.__get__(self)
+            except AttributeError:
+                continue
+
+        return (
+            lib.copyreg.__newobj__,  # type: ignore[attr-defined]
+            (self.__class__, ),
+            (
+                self._get_schema_version(),
+                self._get_values(),
+                *((slots, ) if slots else ())
+                )
+            )
+
     def __ior__(self, other: typ.obj.ObjectLike, /) -> lib.Self:
         self.update(other)
         return self
@@ -424,6 +616,258 @@ class ObjectBase(metaclass=metas.Meta):
 
         return self.__copy__()
 
+    def _finalize_copy(self) -> None:
+        """Run `__post_init__()` on a copy, once its fields are set."""
+
+        self.__post_init__()
+        return None
+
+    def _finalize_init(self) -> None:
+        """Run `__post_init__()` and reset tracking of changed fields."""
+
+        self.__post_init__()
+        self.mark_clean()
+        return None
+
+    @classmethod
+    def _get_defaults(cls) -> tuple[lib.t.Any, ...]:
+        """Return default values for all fields of class."""
+
+        if (defaults := cls.__memo__.get(Constants.MEMO_DEFAULTS)) is None:
+            default = cls()
+            defaults = cls.__memo__[Constants.MEMO_DEFAULTS] = tuple(
+                getattr(default, field, None)
+                for field
+                in cls.fields
+                )
+
+        return defaults
+
+    @classmethod
+    def _get_members(cls) -> tuple[lib.types.MemberDescriptorType, ...]:
+        """Return slot descriptors for all fields of class."""
+
+        if (members := cls.__memo__.get(Constants.MEMO_MEMBERS)) is None:
+            members = cls.__memo__[Constants.MEMO_MEMBERS] = tuple(
+                next(
+                    vars(_base)[field]
+                    for _base
+                    in cls.__mro__
+                    if field in vars(_base)
+                    )
+                for field
+                in cls.fields
+                )
+
+        return members
+
+    @classmethod
+    def _get_slots(cls) -> tuple[lib.types.MemberDescriptorType, ...]:
+        """
+        Return slot descriptors for all slots of class (and its \
+        bases) other than those of fields.
+
+        """
+
+        if (slots := cls.__memo__.get(Constants.MEMO_SLOTS)) is None:
+            members: dict[str, lib.types.MemberDescriptorType] = {}
+            for _base in cls.__mro__:
+                for name, member in vars(_base).items():
+                    if (
+                        isinstance(member, lib.types.MemberDescriptorType)
+                        and name not in cls.__dataclass_fields__
+                        ):
+                        members.setdefault(name, member)
+            slots = cls.__memo__[Constants.MEMO_SLOTS] = tuple(
+                members.values()
+                )
+
+        return slots
+
+    def _get_values(self) -> tuple[lib.t.Any, ...]:
+        """
+        Return values of all fields, in `fields` order (lazy fields \
+        are decoded first).
+
+        """
+
+        if (getter := self.__memo__.get(Constants.MEMO_GETTER)) is None:
+            if len(fields := self.fields) > 1:
+                getter = lib.operator.attrgetter(*fields)
+            else:
+                def getter(
+                    __object: 'ObjectBase'
+                    ) -> tuple[lib.t.Any, ...]:
+                    return tuple(getattr(__object, f) for f in fields)
+            self.__memo__[Constants.MEMO_GETTER] = getter
+
+        return getter(self)
+
+    def _get_raw_values(self) -> tuple[lib.t.Any, ...]:
+        """
+        Same as `_get_values()`, but with lazy fields not yet decoded \
+        left as is.
+
+        """
+
+        if not core.codecs.cfg.Constants.LAZY_DECODING:
+            return self._get_values()
+
+        values: list[lib.t.Any] = []
+        for index, member in enumerate(self._get_members()):
+            try:
+                values.append(member.__get__(self))
+            except AttributeError:
+                values.append(self.__clean__[index])
+
+        return tuple(values)
+
+    @classmethod
+    def _get_schema_version(cls) -> int:
+        """
+        Return a tag identifying the schema (field names and types) \
+        of class, stable across processes.
+
+        """
+
+        return core.codecs.utl.get_schema_fingerprint(cls)
+
+    def _merge(
+        self,
+        other: typ.obj.ObjectLike,
+        overwrite: bool,
+        inplace: bool
+        ) -> lib.Self:
+        """
+        Return self (if `inplace`) or a new instance with values of \
+        self merged with non-default values of other.
+
+        """
+
+        if inplace:
+            object_ = self
+        else:
+            object_ = object.__new__(self.__class__)
+
+        self._merge_into(object_, other, overwrite)
+        if not inplace:
+            object_.__clean__ = self.__clean__
+        return object_
+
+    def _merge_into(
+        self,
+        __object: lib.Self,
+        __other: typ.obj.ObjectLike,
+        overwrite: bool
+        ) -> bool:
+        """
+        Set values of `object` to those of self, merged with values \
+        of `other` that are not field defaults, returning `True` if \
+        any values differ from those of self.
+
+        ---
+
+        Values of `other` are only used for fields at their default \
+        value on self, unless `overwrite` is `True`.
+
+        ---
+
+        Values are read and written directly if `other` is of the same \
+        class as self, and are otherwise validated on assignment.
+
+        """
+
+        if (trusted := __other.__class__ is self.__class__):
+            values = lib.t.cast(lib.Self, __other)._get_values()
+        elif overwrite or all(field in __other for field in self.fields):
+            values = [__other[field] for field in self.fields]
+        else:
+            raise exc.InvalidObjectComparisonError(self, __other)
+
+        changed = False
+        for field, member, default, current, value in zip(
+            self.fields,
+            self._get_members(),
+            self._get_defaults(),
+            self._get_values(),
+            values
+            ):
+            if (
+                (overwrite or current == default)
+                and value != default
+                and value != current
+                ):
+                changed = True
+                if trusted:
+                    member.__set__(__object, value)
+                else:
+                    setattr(__object, field, value)
+            elif __object is not self:
+                member.__set__(__object, current)
+
+        return changed
+
+    def changed_fields(self) -> typ.FieldsTuple:
+        """
+        Return names of fields with values that differ from those \
+        at instantiation or when `mark_clean()` was last called.
+
+        ---
+
+        Values are compared, not tracked, so fields set back to their \
+        previous values are not considered changed, and neither are \
+        containers modified in place.
+
+        """
+
+        return tuple(
+            field
+            for field, value, clean
+            in zip(self.fields, self._get_raw_values(), self.__clean__)
+            if value is not clean and value != clean
+            )
+
+    def mark_clean(self) -> None:
+        """Reset tracking of changed fields."""
+
+        self.__clean__ = self._get_raw_values()
+        return None
+
+    @lib.t.overload
+    def delta(
+        self,
+        camel_case: lib.t.Literal[False] = False,
+        include_null: bool = True
+        ) -> typ.SnakeDict: ...
+    @lib.t.overload
+    def delta(
+        self,
+        camel_case: lib.t.Literal[True],
+        include_null: bool
+        ) -> typ.CamelDict: ...
+    @lib.t.overload
+    def delta(
+        self,
+        camel_case: bool,
+        include_null: bool
+        ) -> 'typ.SnakeDict | typ.CamelDict': ...
+    def delta(
+        self,
+        camel_case: bool = False,
+        include_null: bool = True
+        ) -> 'typ.SnakeDict | typ.CamelDict':
+        """
+        Same as `to_dict()`, but only for fields changed since \
+        instantiation or since `mark_clean()` was last called.
+
+        ---
+
+        Unchanged fields are skipped entirely.
+
+        """
+
+        return self._to_dict(self.changed_fields(), camel_case, include_null)
+
     @classmethod
     def fromkeys(
         cls,
@@ -441,6 +885,142 @@ class ObjectBase(metaclass=metas.Meta):
 
         return cls()
 
+    @classmethod
+    def merge(
+        cls,
+        __objects: lib.t.Iterable[lib.Self],
+        __others: lib.t.Iterable[typ.obj.ObjectLike],
+        /,
+        overwrite: bool = False,
+        inplace: bool = False
+        ) -> list[lib.Self]:
+        """
+        Merge aligned `objects` with `others` pairwise, returning \
+        the merged objects.
+
+        ---
+
+        Same as `object << other` for each pair, or `object >> other` \
+        if `overwrite` is `True`.
+
+        If `inplace` is `True`, each object is updated in place \
+        instead (`<<=` or `>>=`).
+
+        ---
+
+        Raises `ValueError` if `objects` and `others` differ in length.
+
+        """
+
+        return [
+            object_._merge(other, overwrite, inplace)
+            for object_, other
+            in zip(__objects, __others, strict=True)
+            ]
+
+    @classmethod
+    def from_trusted(
+        cls,
+        __values: lib.t.Mapping[typ.string[typ.snake_case], lib.t.Any],
+        /
+        ) -> lib.Self:
+        """
+        Instantiate class from trusted `values`, keyed by field name, \
+        assigning them directly without parsing or validation.
+
+        ---
+
+        Fields missing from `values` are set to their defaults, \
+        and `__post_init__()` is run as usual.
+
+        ---
+
+        Only use for data already validated against the class (for \
+        example, rows written by the same class); set the \
+        `TRUSTED_ASSERTIONS` environment variable to `true` to assert \
+        as much while debugging.
+
+        """
+
+        if Constants.TRUSTED_ASSERTIONS:
+            assert not (keys := set(__values).difference(cls.fields)), (
+                f'Invalid fields for {cls.__name__}: {sorted(keys)}'
+                )
+
+        return cls.from_tuple(
+            [
+                (
+                    value
+                    if (
+                        value := __values.get(field, Constants.UNDEFINED)
+                        ) is not Constants.UNDEFINED
+                    else cls.__dataclass_fields__[field].factory()
+                    )
+                for field
+                in cls.fields
+                ]
+            )
+
+    @classmethod
+    def from_tuple(
+        cls,
+        __values: lib.t.Sequence[lib.t.Any],
+        /
+        ) -> lib.Self:
+        """
+        Instantiate class from trusted `values`, in `fields` order, \
+        assigning them directly without parsing or validation.
+
+        ---
+
+        `__post_init__()` is run as usual. Raw values wrapped in \
+        `core.codecs.obj.LazyValue` are decoded on first access.
+
+        ---
+
+        Only use for data already validated against the class (for \
+        example, rows written by the same class); set the \
+        `TRUSTED_ASSERTIONS` environment variable to `true` to assert \
+        as much while debugging.
+
+        """
+
+        if Constants.TRUSTED_ASSERTIONS:
+            cls._assert_trusted(__values)
+
+        object_ = object.__new__(cls)
+        object_.__clean__ = tuple(__values)
+        for member, value in zip(cls._get_members(), __values):
+            if value.__class__ is not Constants.LAZY_VALUE:
+                member.__set__(object_, value)
+
+        object_._finalize_init()
+        return object_
+
+    @classmethod
+    def _assert_trusted(cls, __values: lib.t.Sequence[lib.t.Any]) -> None:
+        """Assert `values` match the fields and types of class."""
+
+        assert len(__values) == len(cls.fields), (
+            f'Expected {len(cls.fields)} values for {cls.__name__},'
+            f' got {len(__values)}'
+            )
+        for field, value in zip(cls.fields, __values):
+            assert (
+                value is None
+                or value.__class__ is Constants.LAZY_VALUE
+                or lib.t.Any in (
+                    types := typ.utl.check.get_checkable_types(
+                        cls.__dataclass_fields__[field]['type']
+                        )
+                    )
+                or isinstance(value, types)
+                ), (
+                f'Invalid value for {cls.__name__}.{field}: {value!r}'
+                )
+
+        return None
+
     @classmethod
     def keys(cls) -> lib.t.KeysView[typ.string[typ.snake_case]]:
         """
@@ -568,10 +1148,18 @@ class ObjectBase(metaclass=metas.Meta):
 
         """
 
+        return self._to_dict(self.fields, camel_case, include_null)
+
+    def _to_dict(
+        self,
+        fields: typ.FieldsTuple,
+        camel_case: bool,
+        include_null: bool
+        ) -> 'typ.SnakeDict | typ.CamelDict':
         d = {
             k: v
             for k
-            in self.fields
+            in fields
             if (v := self[k]) is not None
             or (include_null and v is None)
             }
@@ -878,6 +1466,20 @@ class Object(ObjectBase):
     Object1 >> Object2
     ```
 
+    Same as the above, but updates Object1 in place.
+
+    ```py
+    Object1 <<= Object2
+    Object1 >>= Object2
+    ```
+
+    Same as the above, but for aligned lists of Objects.
+
+    ```py
+    Object.merge(objects1, objects2)
+    Object.merge(objects1, objects2, overwrite=True, inplace=True)
+    ```
+
     Returns a dictionary with {fieldName: fieldValue2} for \
     any fields that differ between the two Objects.
 
@@ -920,3 +1522,281 @@ class Object(ObjectBase):
     version of class in `dict` form).
 
     """
+
+
+def _get_intern_key(__value: lib.t.Any) -> lib.t.Hashable:
+    """
+    Return hashable key identifying `value` by class and contents \
+    (so that e.g. `True`, `1` and `1.0` are keyed apart).
+
+    """
+
+    if isinstance(__value, FrozenObject):
+        return (
+            __value.__class__,
+            *(_get_intern_key(value) for value in __value._get_values())
+            )
+    elif isinstance(__value, (list, tuple)):
+        return (
+            __value.__class__,
+            *(_get_intern_key(v) for v in __value)
+            )
+    elif isinstance(__value, (set, frozenset)):
+        return (
+            __value.__class__,
+            frozenset(_get_intern_key(v) for v in __value)
+            )
+    elif isinstance(__value, dict):
+        return (
+            __value.__class__,
+            *(
+                (_get_intern_key(k), _get_intern_key(v))
+                for k, v
+                in __value.items()
+                )
+            )
+    elif isinstance(__value, Object):
+        # Mutable Objects may change after interning.
+        return (__value.__class__, id(__value))
+    else:
+        return (__value.__class__, __value)
+
+
+def _is_immutable(__value: lib.t.Any) -> bool:
+    """Return whether `value`, and all values nested in it, are immutable."""
+
+    if isinstance(__value, FrozenObject):
+        return all(_is_immutable(value) for value in __value._get_values())
+    elif isinstance(__value, (tuple, frozenset)):
+        return all(_is_immutable(value) for value in __value)
+    else:
+        return isinstance(__value, Constants.IMMUTABLE_TYPES)
+
+
+@lib.dataclass_transform(
+    kw_only_default=True,
+    frozen_default=True,
+    field_specifiers=(typ.Field, )
+    )
+class FrozenObject(Object):
+    """
+    Immutable Object.
+
+    ---
+
+    Usage
+    -----
+
+    * Subclass to create objects that are never modified after \
+    instantiation (reference data, configuration, etc.).
+
+    Fields may be set only during `__init__` and `__post_init__`; \
+    any other attempt to modify a field raises `FrozenObjectError`.
+
+    ```py
+    class Currency(fqr.FrozenObject):
+        code: fqr.Field[str]
+        decimals: fqr.Field[int] = 2
+
+    usd = Currency(code='USD')
+    usd.decimals = 0  # raises FrozenObjectError
+
+    ```
+
+    ---
+
+    `hash()` and `to_dict()` output are computed once per instance \
+    and cached; `copy()` returns the instance itself, as does \
+    `deepcopy()` unless a field holds a mutable value (e.g. a `list`).
+
+    ---
+
+    Equal instances may be deduplicated to a single, shared instance \
+    with `intern()`.
+
+    ```py
+    usd = Currency(code='USD').intern()
+    assert Currency(code='USD').intern() is usd
+
+    ```
+
+    """
+
+    __slots__ = ('__cache__', '__weakref__')
+
+    def __init__(
+        self,
+        class_as_dict: lib.t.Optional[dict[typ.string[typ.snake_case], lib.t.Any]] = None,
+        /,
+        **kwargs: lib.t.Any
+        ):
+        # `__cache__` is None only while fields are writable, and
+        # is otherwise left unset until output is first cached.
+        self.__cache__ = None
+        super().__init__(class_as_dict, **kwargs)
+
+    def _finalize_copy(self) -> None:
+        self.__cache__ = None
+        super()._finalize_copy()
+        del self.__cache__
+        return None
+
+    def _finalize_init(self) -> None:
+        self.__cache__ = None
+        super()._finalize_init()
+        del self.__cache__
+        return None
+
+    def __setattr__(
+        self,
+        __name: str,
+        __value: lib.t.Any
+        ) -> lib.t.Optional[lib.Never]:
+        if (
+            __name in self.__dataclass_fields__
+            and getattr(self, Constants.__CACHE__, True) is not None
+            ):
+            raise exc.FrozenObjectError(self.__class__.__name__, __name)
+
+        object.__setattr__(self, __name, __value)
+        return None
+
+    def __delattr__(self, __name: str) -> lib.t.Optional[lib.Never]:
+        if __name in self.__dataclass_fields__:
+            raise exc.FrozenObjectError(self.__class__.__name__, __name)
+
+        super().__delattr__(__name)
+        return None
+
+    def __hash__(self) -> int:
+        if (cache := self._get_cache()) is None:
+            return super().__hash__()
+        elif (hash_ := cache.get(Constants.__HASH__)) is None:
+            hash_ = cache[Constants.__HASH__] = super().__hash__()
+
+        return hash_
+
+    def __ilshift__(  # type: ignore[misc]
+        self,
+        other: typ.obj.ObjectLike,
+        /
+        ) -> lib.Self:
+        """Same as `<<`, returning a new instance (or self)."""
+
+        return self._merge(other, False, False)
+
+    def __irshift__(self, other: typ.obj.ObjectLike, /) -> lib.Self:
+        """Same as `>>`, returning a new instance (or self)."""
+
+        return self._merge(other, True, False)
+
+    def __copy__(self) -> lib.Self:
+        """Return the instance itself, as it cannot be modified."""
+
+        return self
+
+    def __deepcopy__(
+        self,
+        memo: lib.t.Optional[dict[int, typ.AnyType]] = None
+        ) -> lib.Self:
+        """
+        Return the instance itself if none of its values (nested or \
+        otherwise) can be modified, or a deep copy of it otherwise.
+
+        """
+
+        if _is_immutable(self):
+            return self
+
+        return super().__deepcopy__(memo)
+
+    def __setstate__(
+        self,
+        state: typ.SnakeDict | tuple[lib.t.Any, ...]
+        ) -> lib.t.Optional[lib.Never]:
+        self.__cache__ = None
+        super().__setstate__(state)
+        del self.__cache__
+        return None
+
+    def _get_cache(self) -> lib.t.Optional[dict[lib.t.Hashable, lib.t.Any]]:
+        """
+        Return cache of computed output for the instance, \
+        or `None` while its fields are still writable.
+
+        """
+
+        try:
+            return self.__cache__
+        except AttributeError:
+            cache: dict[lib.t.Hashable, lib.t.Any] = {}
+            self.__cache__ = cache
+            return cache
+
+    def _merge(
+        self,
+        other: typ.obj.ObjectLike,
+        overwrite: bool,
+        inplace: bool
+        ) -> lib.Self:
+        """
+        Return a new instance with values of self merged with \
+        non-default values of other, or self if no values would change.
+
+        """
+
+        object_ = object.__new__(self.__class__)
+        object_.__cache__ = None
+        changed = self._merge_into(object_, other, overwrite)
+        object_.mark_clean()
+        del object_.__cache__
+        return object_ if changed else self
+
+    def _to_dict(
+        self,
+        fields: typ.FieldsTuple,
+        camel_case: bool,
+        include_null: bool
+        ) -> 'typ.SnakeDict | typ.CamelDict':
+        if (
+            fields is not self.fields
+            or (cache := self._get_cache()) is None
+            ):
+            return super()._to_dict(fields, camel_case, include_null)
+        elif (as_dict := cache.get((camel_case, include_null))) is None:
+            as_dict = cache[(camel_case, include_null)] = (
+                super()._to_dict(fields, camel_case, include_null)
+                )
+
+        # Nested containers are copied too, so cached output cannot be
+        # modified through what is returned to callers.
+        return lib.t.cast(
+            'typ.SnakeDict | typ.CamelDict',
+            lib.copy.deepcopy(as_dict)
+            )
+
+    def intern(self) -> lib.Self:
+        """
+        Return the canonical instance equal to this one, registering \
+        this instance as canonical if none exists yet.
+
+        ---
+
+        Instances are equal if they are of the same class and all of \
+        their field values are equal. Instances with field values \
+        that cannot be hashed are never deduplicated.
+
+        ---
+
+        Canonical instances are only referenced weakly, and are \
+        released once no longer referenced elsewhere.
+
+        """
+
+        try:
+            return lib.t.cast(
+                lib.Self,
+                Constants.INTERNED.setdefault(_get_intern_key(self), self)
+                )
+        except TypeError:
+            return self
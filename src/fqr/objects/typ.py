@@ -3,6 +3,7 @@
 from .. import core
 
 __all__ = (
+    'Column',
     'Field',
     'MetaType',
     'SortDirection',
@@ -17,6 +18,7 @@ from . import lib
 if lib.t.TYPE_CHECKING:  # pragma: no cover
     from . import metas  # noqa: F401
 
+Column: lib.t.TypeAlias = 'lib.array.array[lib.t.Any] | list[lib.t.Any]'
 SortDirection = lib.t.Literal['asc'] | lib.t.Literal['desc']
 
 MetaType = lib.t.TypeVar('MetaType', bound='metas.Meta')
@@ -0,0 +1,145 @@
+"""
+JSON backends for conformance tests and benchmarks.
+
+---
+
+Compare backends with:
+
+```sh
+cd src && python -m tests.core.codecs.backends
+
+```
+
+"""
+
+import timeit
+
+import fqr
+
+from fqr . core import codecs
+from fqr . core import lib
+
+from ... import mocking
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    Digits = bytes.maketrans(b'123456789', b'000000000')
+    """
+    Table replacing all digits with `0`, to find exponents (`0e`) and \
+    long integers (`00...`) in JSON with a single substring search.
+
+    """
+
+    MaxIntLen = 19
+    """Longest integer (in digits) `orjson` is known to decode exactly."""
+
+
+def _stdlib_dumps(
+    value: lib.t.Any,
+    default: lib.t.Optional[lib.t.Callable[[lib.t.Any], lib.t.Any]],
+    indent: lib.t.Optional[int],
+    sort_keys: bool
+    ) -> str:
+    return lib.json.dumps(
+        value,
+        default=default,
+        indent=indent,
+        separators=(',', ':') if indent is None else (',', ': '),
+        sort_keys=sort_keys
+        )
+
+
+def _unsupported(*args: lib.t.Any) -> lib.t.Any:
+    raise NotImplementedError
+
+
+def _orjson_dumps(
+    value: lib.t.Any,
+    default: lib.t.Optional[lib.t.Callable[[lib.t.Any], lib.t.Any]],
+    indent: lib.t.Optional[int],
+    sort_keys: bool
+    ) -> str:
+    if indent not in (None, 2):
+        raise NotImplementedError
+    option = (
+        orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    serialized = orjson.dumps(value, default=default, option=option)
+    if (
+        not serialized.isascii()
+        or b'\x7f' in serialized
+        or b'0e' in serialized.translate(Constants.Digits)
+        ):
+        # Unescaped characters and float exponents differ from stdlib.
+        raise NotImplementedError
+    return serialized.decode()
+
+
+def _orjson_loads(value: str | bytes) -> lib.t.Any:
+    if isinstance(value, str):
+        value = value.encode()
+    if b'0' * (Constants.MaxIntLen + 1) in value.translate(Constants.Digits):
+        # Larger integers are decoded as `float`.
+        raise NotImplementedError
+    return orjson.loads(value)
+
+
+Backends = [
+    codecs.obj.JsonBackend('json', _stdlib_dumps, lib.json.loads),
+    codecs.obj.JsonBackend('unsupported', _unsupported, _unsupported),
+    ]
+if orjson is not None:
+    Backends.append(
+        codecs.obj.JsonBackend('orjson', _orjson_dumps, _orjson_loads)
+        )
+
+
+def benchmark(n: int = 1000) -> dict[str, dict[str, float]]:
+    """Return mean µs per call of fqr JSON I/O for each backend."""
+
+    objects = [
+        mocking.TripDeriv(str_field=str(i), int_field=i)
+        for i
+        in range(10)
+        ]
+    rows = [o.to_dict() for o in objects]
+    serialized = codecs.utl.dumps_json(rows, codecs.utl.encode)
+    results: dict[str, dict[str, float]] = {}
+    for backend in (None, *Backends):
+        codecs.utl.register_json_backend(backend)
+        results[backend.name if backend else 'default'] = {
+            name: min(timeit.repeat(fn, number=n, repeat=5)) / n * 1e6
+            for name, fn
+            in (
+                (
+                    'dumps_json',
+                    lambda: codecs.utl.dumps_json(rows, codecs.utl.encode)
+                    ),
+                ('loads_json', lambda: codecs.utl.loads_json(serialized)),
+                (
+                    'serialize',
+                    lambda: codecs.utl.serialize(objects, compact=True)
+                    ),
+                )
+            }
+    codecs.utl.register_json_backend(None)
+    return results
+
+
+if __name__ == '__main__':
+    for name, timings in benchmark().items():
+        fqr.log.info({'backend': name, 'us_per_call': timings})
@@ -0,0 +1,226 @@
+"""
+Benchmarks for encoding and decoding values.
+
+---
+
+Run with:
+
+```sh
+cd src && python -m tests.core.codecs.benchmarks
+
+```
+
+"""
+
+import timeit
+
+from unittest import mock
+
+import fqr
+
+from fqr . core import codecs
+from fqr . core import lib
+
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    PayloadSize = 1000
+    """Number of values of each type in benchmarked payloads."""
+
+
+class Status(lib.enum.IntEnum):
+    """`IntEnum` encoded through the encoder of `enum.Enum`."""
+
+    active = 1
+    inactive = 2
+
+
+class Unions(fqr.Object):
+    """`Object` with union-typed fields."""
+
+    int_or_str: fqr.Field[int | str | None] = None
+    number: fqr.Field[lib.t.Optional[float | int]] = None
+    container: fqr.Field[list[int] | dict[str, int] | None] = None
+
+
+class Pet(fqr.Object):
+    """Row of the `list[Object]` payloads benchmarked."""
+
+    name: fqr.Field[str] = 'pet'
+    age: fqr.Field[int] = 0
+    weight: fqr.Field[float] = 0.0
+    vaccinated: fqr.Field[bool] = False
+
+
+def _time(fn: lib.t.Callable[[], lib.t.Any], n: int) -> float:
+    return min(timeit.repeat(fn, number=n, repeat=5)) / n * 1e6
+
+
+def benchmark_encode(n: int = 100) -> dict[str, float]:
+    """
+    Return mean µs to serialize, row by row, a payload heavy in enums, \
+    paths and UUIDs, with encoders resolved per type cached, and \
+    resolved anew for each row.
+
+    """
+
+    payload = [
+        {
+            'status': Status.active if i % 2 else Status.inactive,
+            'path': codecs.lib.pathlib.Path('/tmp', str(i)),
+            'id': codecs.lib.uuid.UUID(int=i),
+            }
+        for i
+        in range(Constants.PayloadSize)
+        ]
+    resolved = codecs.cfg.Constants.ENCODERS.resolved
+
+    def _serialize(clear: bool) -> None:
+        for row in payload:
+            if clear:
+                resolved.clear()
+            codecs.utl.serialize(row)
+
+    return {
+        'serialize': _time(lambda: _serialize(False), n),
+        'serialize_uncached': _time(lambda: _serialize(True), n),
+        }
+
+
+def benchmark_decode(n: int = 1_000_000) -> dict[str, dict[str, float]]:
+    """
+    Return mean ns per value to decode `n` timestamps and numbers \
+    from `str`, one at a time with `try_decode()` and with decoders \
+    from `get_str_decoder()`, and all at once with `decode_str_batch()`.
+
+    """
+
+    start = lib.datetime.datetime(2024, 1, 1, tzinfo=lib.datetime.timezone.utc)
+    values: dict[type, list[str]] = {
+        lib.datetime.datetime: [
+            (start + lib.datetime.timedelta(seconds=i)).isoformat()
+            for i
+            in range(n)
+            ],
+        int: [str(i) for i in range(n)],
+        float: [f'{i / 7:.4f}' for i in range(n)],
+        }
+    results: dict[str, dict[str, float]] = {}
+    for tp, strings in values.items():
+        decode = codecs.utl.get_str_decoder(tp)
+        results[tp.__name__] = {
+            name: min(timeit.repeat(fn, number=1, repeat=3)) / n * 1e9
+            for name, fn
+            in (
+                (
+                    'try_decode',
+                    lambda: [codecs.utl.try_decode(v, tp) for v in strings]
+                    ),
+                ('get_str_decoder', lambda: list(map(decode, strings))),
+                (
+                    'decode_str_batch',
+                    lambda: codecs.utl.decode_str_batch(strings, tp)
+                    ),
+                )
+            }
+    return results
+
+
+
+def benchmark_union(n: int = 1000) -> dict[str, float]:
+    """
+    Return mean µs to parse a mixed input for union types, per value \
+    with `parse()` and per row instantiating `Unions`.
+
+    """
+
+    cases = [
+        (value, tp)
+        for tp, inputs
+        in (
+            (int | str | None, (1, 'abc', '12', None, 'null')),
+            (lib.t.Optional[float | int], (1, 1.5, '2.5', '3')),
+            (list[int] | dict[str, int] | None, ([1], '[2]', {'a': 1}))
+            )
+        for value
+        in inputs
+        ]
+    rows = [
+        {'int_or_str': a, 'number': b, 'container': c}
+        for a, b, c
+        in zip(
+            (1, 'abc', '12', None),
+            (1, 1.5, '2.5', '3'),
+            ([1], '[2]', {'a': 1}, None)
+            )
+        ]
+    return {
+        'parse': (
+            _time(
+                lambda: [codecs.utl.parse(v, tp) for v, tp in cases],
+                n
+                )
+            / len(cases)
+            ),
+        'init': _time(lambda: [Unions(**row) for row in rows], n) / len(rows),
+        }
+
+
+
+def benchmark_parse_plan(n: int = 1_000_000) -> dict[str, float]:
+    """
+    Return mean µs per row to parse `n` rows as `list[Pet]`, of a \
+    uniform and of mixed key sets, with and without parse plans \
+    cached per key set.
+
+    """
+
+    keys = tuple(Pet.__dataclass_fields__)
+    values = {'name': 'pet', 'age': 3, 'weight': 1.5, 'vaccinated': True}
+    shapes = [
+        [key for i, key in enumerate(keys) if mask >> i & 1]
+        for mask
+        in range(1, 1 << len(keys))
+        ]
+    payloads = {
+        'uniform': [dict(values) for _ in range(n)],
+        'mixed': [
+            {key: values[key] for key in shapes[i % len(shapes)]}
+            for i
+            in range(n)
+            ],
+        }
+    results: dict[str, float] = {}
+    for cached, max_plans in (
+        ('cached', codecs.utl.Constants.MAX_PARSE_PLANS),
+        ('uncached', 0)
+        ):
+        with mock.patch.object(
+            codecs.utl.Constants,
+            'MAX_PARSE_PLANS',
+            max_plans
+            ):
+            for shape, rows in payloads.items():
+                codecs.utl.get_memo(Pet).clear()
+                results[f'{shape}_{cached}'] = (
+                    min(
+                        timeit.repeat(
+                            lambda: codecs.utl.parse(rows, list[Pet]),
+                            number=1,
+                            repeat=5
+                            )
+                        )
+                    / n
+                    * 1e6
+                    )
+    return results
+
+
+if __name__ == '__main__':
+    fqr.log.info({'us_per_payload': benchmark_encode()})
+    fqr.log.info({'ns_per_value': benchmark_decode()})
+    fqr.log.info({'us_per_union': benchmark_union()})
+    fqr.log.info({'us_per_row': benchmark_parse_plan()})
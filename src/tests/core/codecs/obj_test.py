@@ -0,0 +1,693 @@
+"""Module objects unit tests."""
+
+import unittest
+
+import fqr
+
+from fqr . core import codecs
+from fqr . core import lib
+
+from ... import mocking
+
+from . import backends
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to unit tests in this file."""
+
+
+class Color(lib.enum.Enum):
+    """Enumeration for testing."""
+
+    red = 'r'
+    blue = 'b'
+
+
+class AnyDeriv(fqr.Object):
+    """Object with an untyped field."""
+
+    any_field: fqr.Field[lib.t.Any] = None
+
+
+class TestBinaryCodec(unittest.TestCase):
+    """Fixture for testing binary rows."""
+
+    def setUp(self) -> None:
+        self.object_ = mocking.TripDeriv(
+            str_field='cba',
+            int_field=-42,
+            forward_ref_union_field=1.5,
+            non_nullable_field=None
+            )
+        self.data = codecs.utl.encode_binary(self.object_)
+        return super().setUp()
+
+    def test_01_round_trip(self):
+        """Test binary row decodes to an equal `Object`."""
+
+        self.assertEqual(
+            codecs.utl.decode_binary(mocking.TripDeriv, self.data),
+            self.object_
+            )
+
+    def test_02_round_trip(self):
+        """Test binary row decodes from a `memoryview`."""
+
+        self.assertEqual(
+            codecs.utl.decode_binary(
+                mocking.TripDeriv,
+                memoryview(bytearray(self.data))
+                ),
+            self.object_
+            )
+
+    def test_03_read(self):
+        """Test lazy view decodes individual fields."""
+
+        record = codecs.utl.read_binary(mocking.TripDeriv, self.data)
+        self.assertTupleEqual(
+            (
+                record['str_field'],
+                record['int_field'],
+                record['bool_field'],
+                record['forward_ref_union_field'],
+                record['non_nullable_field'],
+                ),
+            ('cba', -42, True, 1.5, None)
+            )
+
+    def test_04_read(self):
+        """Test lazy view of nested `Object` is a lazy view."""
+
+        record = codecs.utl.read_binary(mocking.TripDeriv, self.data)
+        self.assertIsInstance(record['new_deriv'], codecs.obj.BinaryRecord)
+
+    def test_05_read(self):
+        """Test lazy view iterates fields in order."""
+
+        record = codecs.utl.read_binary(mocking.TripDeriv, self.data)
+        self.assertTupleEqual(
+            (tuple(record), len(record)),
+            (mocking.TripDeriv.fields, len(mocking.TripDeriv.fields))
+            )
+
+    def test_06_repr(self):
+        """Test lazy view repr."""
+
+        self.assertEqual(
+            repr(codecs.utl.read_binary(mocking.TripDeriv, self.data)),
+            'BinaryRecord[TripDeriv]'
+            )
+
+    def test_07_anti_decode(self):
+        """Test binary row for a different schema does not decode."""
+
+        self.assertIs(
+            codecs.utl.decode_binary(mocking.NewDeriv, self.data),
+            codecs.enm.ParseErrorRef.binary_decode
+            )
+
+    def test_08_anti_decode(self):
+        """Test truncated binary row does not decode."""
+
+        self.assertIs(
+            codecs.utl.read_binary(mocking.TripDeriv, self.data[:8]),
+            codecs.enm.ParseErrorRef.binary_decode
+            )
+
+    def test_09_size(self):
+        """Test binary row smaller than JSON."""
+
+        self.assertLess(
+            len(self.data),
+            len(codecs.utl.serialize(self.object_).encode())
+            )
+
+    def test_10_fingerprint(self):
+        """Test schema fingerprint differs between schemas."""
+
+        self.assertNotEqual(
+            codecs.utl.get_schema_fingerprint(mocking.TripDeriv),
+            codecs.utl.get_schema_fingerprint(mocking.NewDeriv)
+            )
+
+    def test_11_round_trip(self):
+        """Test untyped field decodes as JSON."""
+
+        object_ = AnyDeriv(any_field={'a': [1, 2]})
+        self.assertEqual(
+            codecs.utl.decode_binary(
+                AnyDeriv,
+                codecs.utl.encode_binary(object_)
+                ),
+            object_
+            )
+
+    def test_12_overflow(self):
+        """Test `int` too large for its slot raises naming the field."""
+
+        self.object_.int_field = 1 << 70
+        with self.assertRaises(fqr.objects.exc.BinaryEncodingError) as ctx:
+            codecs.utl.encode_binary(self.object_)
+        self.assertIn('FIELD: int_field', str(ctx.exception))
+
+    def test_13_incorrect_type(self):
+        """Test value of the wrong type raises naming the field."""
+
+        object.__setattr__(self.object_, 'int_field', 'abc')
+        with self.assertRaises(fqr.objects.exc.BinaryEncodingError) as ctx:
+            codecs.utl.encode_binary(self.object_)
+        self.assertIn('FIELD: int_field', str(ctx.exception))
+
+    def test_14_layout_refreshed(self):
+        """Test layout rebuilt once a field is redefined."""
+
+        class _Layout(fqr.Object):
+            layout_field: fqr.Field[lib.t.Union[int, str]] = 1
+
+        kinds = codecs.obj.BinaryLayout.get(_Layout).kinds
+        _Layout['layout_field'] = fqr.Field(
+            name='layout_field',
+            type_=int,
+            default=2
+            )
+        self.assertNotEqual(
+            codecs.obj.BinaryLayout.get(_Layout).kinds,
+            kinds
+            )
+
+    def test_15_fingerprint(self):
+        """Test schema fingerprint recomputed once a field is redefined."""
+
+        class _Fingerprinted(fqr.Object):
+            fingerprinted_field: fqr.Field[lib.t.Union[int, str]] = 1
+
+        fingerprint = codecs.utl.get_schema_fingerprint(_Fingerprinted)
+        _Fingerprinted['fingerprinted_field'] = fqr.Field(
+            name='fingerprinted_field',
+            type_=int,
+            default=2
+            )
+        self.assertNotEqual(
+            codecs.utl.get_schema_fingerprint(_Fingerprinted),
+            fingerprint
+            )
+
+
+class TestStreamEncoder(unittest.TestCase):
+    """Fixture for testing stream encoding."""
+
+    def setUp(self) -> None:
+        self.objects = [
+            mocking.TripDeriv(str_field=str(i), int_field=i)
+            for i
+            in range(3)
+            ]
+        return super().setUp()
+
+    def test_01_round_trip(self):
+        """Test `Objects` stream to a binary JSON array."""
+
+        stream = codecs.lib.io.BytesIO()
+        codecs.utl.dump_stream(self.objects, stream)
+        self.assertEqual(
+            [
+                mocking.TripDeriv(value)
+                for value
+                in lib.json.loads(stream.getvalue())
+                ],
+            self.objects
+            )
+
+    def test_02_round_trip(self):
+        """Test `Objects` stream to text NDJSON."""
+
+        stream = codecs.lib.io.StringIO()
+        codecs.utl.dump_stream(self.objects, stream, ndjson=True)
+        self.assertEqual(
+            [
+                mocking.TripDeriv(lib.json.loads(line))
+                for line
+                in stream.getvalue().splitlines()
+                ],
+            self.objects
+            )
+
+    def test_03_empty(self):
+        """Test empty stream is an empty JSON array."""
+
+        stream = codecs.lib.io.StringIO()
+        self.assertEqual(codecs.utl.dump_stream((), stream), 0)
+        self.assertEqual(stream.getvalue(), '[]')
+
+    def test_04_encoders(self):
+        """Test non-JSON types are encoded with `ENCODERS`."""
+
+        stream = codecs.lib.io.StringIO()
+        codecs.utl.dump_stream(
+            ({'path': codecs.lib.pathlib.Path('a'), 'n': {1, 2}}, [None]),
+            stream
+            )
+        self.assertEqual(
+            stream.getvalue(),
+            '[{"path":"a","n":[1,2]},[null]]'
+            )
+
+    def test_05_flush(self):
+        """Test buffered chunks are flushed once `chunk_size` is reached."""
+
+        stream = codecs.lib.io.BytesIO()
+        encoder = codecs.obj.StreamEncoder(stream, chunk_size=8)
+        encoder.write_all(self.objects)
+        self.assertLess(encoder.buffered, 8)
+        self.assertTrue(stream.getvalue().startswith(b'[{'))
+
+    def test_06_exit(self):
+        """Test array is not terminated if the block raises."""
+
+        stream = codecs.lib.io.StringIO()
+        with self.assertRaises(ValueError):
+            with codecs.obj.StreamEncoder(stream) as encoder:
+                encoder.write_all(self.objects[:1])
+                raise ValueError
+        self.assertTrue(encoder.closed)
+        self.assertFalse(stream.getvalue().endswith(']'))
+        encoder.close()
+        self.assertFalse(stream.getvalue().endswith(']'))
+
+    def test_07_close(self):
+        """Test `close()` is idempotent."""
+
+        stream = codecs.lib.io.StringIO()
+        with codecs.obj.StreamEncoder(stream) as encoder:
+            encoder.close()
+        self.assertEqual(stream.getvalue(), '[]')
+
+async def _chunked(
+    __value: bytes,
+    __size: int
+    ) -> lib.t.AsyncIterator[bytes]:
+    for i in range(0, len(__value), __size):
+        yield __value[i:i + __size]
+
+
+def _reader(__value: bytes) -> codecs.lib.asyncio.StreamReader:
+    reader = codecs.lib.asyncio.StreamReader()
+    reader.feed_data(__value)
+    reader.feed_eof()
+    return reader
+
+
+class AsyncWriter:
+    """Writer with a coroutine `write()` method."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    async def write(self, __value: bytes) -> None:
+        self.chunks.append(__value)
+
+
+class DrainWriter(AsyncWriter):
+    """Writer with a `write()` method and a coroutine `drain()` method."""
+
+    def write(self, __value: bytes) -> None:  # type: ignore[override]
+        self.chunks.append(__value)
+
+    async def drain(self) -> None:
+        self.chunks.append(b'')
+
+
+class TestAsyncStreamDecoder(unittest.TestCase):
+    """Fixture for testing async stream decoding."""
+
+    def setUp(self) -> None:
+        self.objects = [
+            mocking.examples.Pet(
+                id_=str(i),
+                _alternate_id=str(-i),
+                name=f'é{i}',
+                type='dog',
+                in_='house'
+                )
+            for i
+            in range(25)
+            ]
+        self.array = codecs.utl.serialize(self.objects).encode()
+        self.ndjson = '\n\n'.join(
+            codecs.utl.serialize(o, compact=True)
+            for o
+            in self.objects
+            ).encode()
+        return super().setUp()
+
+    def decode(
+        self,
+        __source: lib.t.Callable[[], lib.t.Any],
+        tp: lib.t.Any = mocking.examples.Pet,
+        **kwargs: lib.t.Any
+        ) -> list[lib.t.Any]:
+        async def _decode() -> list[lib.t.Any]:
+            return [
+                value
+                async for value
+                in codecs.obj.AsyncStreamDecoder(__source(), tp, **kwargs)
+                ]
+        return codecs.lib.asyncio.run(_decode())
+
+    def test_01_array(self):
+        """Test JSON array is detected and decoded across chunks."""
+
+        self.assertEqual(
+            self.decode(lambda: _chunked(self.array, 3), batch_size=7),
+            self.objects
+            )
+
+    def test_02_ndjson(self):
+        """Test NDJSON is detected and decoded from a `StreamReader`."""
+
+        self.assertEqual(
+            self.decode(lambda: _reader(self.ndjson), chunk_size=5),
+            self.objects
+            )
+
+    def test_03_executor(self):
+        """Test batches are parsed in an executor."""
+
+        with codecs.lib.concurrent.futures.ThreadPoolExecutor(1) as pool:
+            self.assertEqual(
+                self.decode(
+                    lambda: _chunked(self.ndjson, 64),
+                    executor=pool,
+                    batch_size=4
+                    ),
+                self.objects
+                )
+
+    def test_04_large_value(self):
+        """Test values spanning many chunks are decoded."""
+
+        self.assertEqual(
+            self.decode(lambda: _chunked(self.array, 1)),
+            self.objects
+            )
+
+    def test_05_empty(self):
+        """Test empty array and empty input yield nothing."""
+
+        self.assertEqual(self.decode(lambda: _chunked(b' [ \n ] ', 1)), [])
+        self.assertEqual(self.decode(lambda: _chunked(b'', 1)), [])
+
+    def test_06_invalid_array(self):
+        """Test invalid JSON arrays end with a `ParseErrorRef`."""
+
+        for value in (b'', b'{"a": 1}', b'[1, 2', b'[1 2]', b'[1,', b'[{'):
+            with self.subTest(value=value):
+                values = self.decode(
+                    lambda: _chunked(value, 2),
+                    ndjson=False
+                    )
+                self.assertEqual(
+                    values[-1],
+                    codecs.enm.ParseErrorRef.invalid_json
+                    )
+
+    def test_07_invalid_ndjson(self):
+        """Test invalid NDJSON lines yield a `ParseErrorRef`."""
+
+        values = self.decode(
+            lambda: _chunked(b'{"a": \n{"name": "a"}\n', 4),
+            ndjson=True
+            )
+        self.assertEqual(values[0], codecs.enm.ParseErrorRef.invalid_json)
+        self.assertEqual(values[1].name, 'a')
+
+    def test_08_items(self):
+        """Test JSON array items of any kind are split across chunks."""
+
+        value = (
+            b'[ "a\\"],\\\\", -1.5e3, true ,null, [1, ["]"]], {"a": "}"},'
+            b' "\xc3\xa9", {"b": [{}]} ]'
+            )
+        for size in range(1, 6):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    self.decode(lambda: _chunked(value, size), object),
+                    lib.json.loads(value)
+                    )
+
+    def test_09_invalid_array(self):
+        """Test invalid JSON array items yield a `ParseErrorRef`."""
+
+        self.assertEqual(
+            self.decode(lambda: _chunked(b'[1, tru, 2,]', 2), int),
+            [
+                1,
+                codecs.enm.ParseErrorRef.invalid_json,
+                2,
+                codecs.enm.ParseErrorRef.invalid_json
+                ]
+            )
+
+    def test_10_trailing(self):
+        """Test anything but whitespace after a JSON array is invalid."""
+
+        for value, expected in (
+            (b'[1, 2] garbage', [1, 2, codecs.enm.ParseErrorRef.invalid_json]),
+            (b'[1]\n[2]\n', [1, codecs.enm.ParseErrorRef.invalid_json]),
+            (b'[1, 2] \n\t ', [1, 2]),
+            ):
+            with self.subTest(value=value):
+                self.assertEqual(
+                    self.decode(lambda: _chunked(value, 2), int),
+                    expected
+                    )
+
+    def test_11_backend(self):
+        """Test array items are decoded with the registered backend."""
+
+        decoded: list[bytes | str] = []
+
+        def _loads(value: bytes | str) -> lib.t.Any:
+            decoded.append(value)
+            return lib.json.loads(value)
+
+        codecs.utl.register_json_backend(
+            codecs.obj.JsonBackend('test', lib.json.dumps, _loads)
+            )
+        try:
+            self.assertEqual(
+                self.decode(lambda: _chunked(self.array, 64)),
+                self.objects
+                )
+        finally:
+            codecs.utl.register_json_backend(None)
+        self.assertEqual(len(decoded), len(self.objects))
+
+
+class TestAsyncStreamEncoder(unittest.TestCase):
+    """Fixture for testing async stream encoding."""
+
+    def setUp(self) -> None:
+        self.objects = [
+            mocking.TripDeriv(str_field=str(i), int_field=i)
+            for i
+            in range(3)
+            ]
+        return super().setUp()
+
+    def test_01_round_trip(self):
+        """Test `Objects` stream to a binary JSON array, with `drain()`."""
+
+        writer = DrainWriter()
+
+        async def _encode() -> None:
+            async with codecs.obj.AsyncStreamEncoder(
+                writer,
+                chunk_size=8
+                ) as encoder:
+                await encoder.write_all(self.objects)
+                await encoder.flush()
+            self.assertEqual(encoder.count, len(self.objects))
+
+        codecs.lib.asyncio.run(_encode())
+        self.assertIn(b'', writer.chunks)
+        self.assertEqual(
+            [
+                mocking.TripDeriv(value)
+                for value
+                in lib.json.loads(b''.join(writer.chunks))
+                ],
+            self.objects
+            )
+
+    def test_02_round_trip(self):
+        """Test async `Objects` stream to text NDJSON."""
+
+        writer = AsyncWriter()
+
+        async def _objects() -> lib.t.AsyncIterator[mocking.TripDeriv]:
+            for object_ in self.objects:
+                yield object_
+
+        async def _encode() -> None:
+            encoder = codecs.obj.AsyncStreamEncoder(
+                writer,
+                ndjson=True,
+                binary=False
+                )
+            await encoder.write_all(_objects())
+            self.assertEqual(writer.chunks, [])
+            await encoder.flush()
+            self.assertEqual(len(writer.chunks), 1)
+            await encoder.close()
+
+        codecs.lib.asyncio.run(_encode())
+        self.assertEqual(
+            [
+                mocking.TripDeriv(lib.json.loads(line))
+                for line
+                in ''.join(writer.chunks).splitlines()  # type: ignore
+                ],
+            self.objects
+            )
+
+    def test_03_exit(self):
+        """Test array is not terminated if the block raises."""
+
+        writer = AsyncWriter()
+
+        async def _encode() -> None:
+            encoder = codecs.obj.AsyncStreamEncoder(writer, chunk_size=1)
+            with self.assertRaises(ValueError):
+                async with encoder:
+                    await encoder.write_all(self.objects)
+                    raise ValueError
+            await encoder.close()
+
+        codecs.lib.asyncio.run(_encode())
+        self.assertFalse(b''.join(writer.chunks).endswith(b']'))
+
+    def test_04_close(self):
+        """Test `close()` is idempotent."""
+
+        writer = AsyncWriter()
+
+        async def _encode() -> None:
+            async with codecs.obj.AsyncStreamEncoder(writer) as encoder:
+                await encoder.close()
+
+        codecs.lib.asyncio.run(_encode())
+        self.assertEqual(b''.join(writer.chunks), b'[]')
+
+
+def strings_default(o: lib.t.Any) -> lib.t.Any:
+    return fqr.core.strings.utl.convert_for_repr(o)
+
+
+class TestJsonBackend(unittest.TestCase):
+    """Fixture for testing JSON backend conformance."""
+
+    def setUp(self) -> None:
+        self.values: list[lib.t.Any] = [
+            None,
+            True,
+            -42,
+            2 ** 70,
+            0.1,
+            1e16,
+            -3.5e-8,
+            'plain',
+            'unicode: é \u2028 \x7f \x00 "quoted" \\',
+            [1, [2, [3]], (4, 5)],
+            {'b': 1, 'a': {'d': [], 'c': {}}},
+            {2: 'int key', 1: 'other int key'},
+            {2, 1},
+            lib.datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+            lib.datetime.datetime.now(lib.datetime.timezone.utc),
+            lib.datetime.date(2024, 1, 2),
+            lib.datetime.time(3, 4, 5),
+            lib.datetime.timedelta(seconds=1.5),
+            lib.decimal.Decimal('1.25'),
+            Color.red,
+            codecs.lib.uuid.UUID(int=7),
+            codecs.lib.pathlib.Path('a/b'),
+            codecs.lib.ipaddress.IPv4Address('127.0.0.1'),
+            b'bytes',
+            mocking.TripDeriv(str_field='é'),
+            [mocking.TripDeriv(), mocking.NewDeriv()],
+            mocking.FrozenDeriv(),
+            ]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        codecs.utl.register_json_backend(None)
+        return super().tearDown()
+
+    def _dump(self, value: lib.t.Any) -> list[str]:
+        stream = codecs.lib.io.StringIO()
+        codecs.utl.dump_stream([value], stream)
+        return [
+            codecs.utl.serialize(value),
+            codecs.utl.serialize(value, compact=True),
+            codecs.utl.dumps_json(value, strings_default),
+            codecs.utl.dumps_json(value, strings_default, 4, True),
+            stream.getvalue(),
+            ]
+
+    def test_01_dumps(self):
+        """Test backends serialize identically to the stdlib."""
+
+        expected = [self._dump(value) for value in self.values]
+        for backend in backends.Backends:
+            codecs.utl.register_json_backend(backend)
+            for value, dumped in zip(self.values, expected):
+                with self.subTest(backend=backend, value=value):
+                    self.assertEqual(self._dump(value), dumped)
+
+    def test_02_loads(self):
+        """Test backends deserialize identically to the stdlib."""
+
+        serialized = [
+            codecs.utl.dumps_json(value, strings_default)
+            for value
+            in self.values
+            ]
+        serialized.append('{"nan": NaN, "big": 123456789012345678901234}')
+        for backend in backends.Backends:
+            codecs.utl.register_json_backend(backend)
+            for value in serialized:
+                with self.subTest(backend=backend, value=value):
+                    self.assertEqual(
+                        repr(codecs.utl.loads_json(value.encode())),
+                        repr(lib.json.loads(value))
+                        )
+
+    def test_03_binary(self):
+        """Test binary rows route JSON through registered backends."""
+
+        object_ = AnyDeriv(any_field={'a': [1, 2]})
+        for backend in backends.Backends:
+            codecs.utl.register_json_backend(backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(
+                    codecs.utl.decode_binary(
+                        AnyDeriv,
+                        codecs.utl.encode_binary(object_)
+                        ),
+                    object_
+                    )
+
+    def test_04_repr(self):
+        """Test backend repr."""
+
+        self.assertEqual(repr(backends.Backends[0]), 'JsonBackend[json]')
+
+    def test_05_benchmark(self):
+        """Test benchmark harness times each backend."""
+
+        self.assertEqual(
+            set(backends.benchmark(1)),
+            {'default', *(backend.name for backend in backends.Backends)}
+            )
@@ -2,11 +2,14 @@
 
 import unittest
 
+from unittest import mock
+
 import fqr
 
 from fqr . core import codecs
 from fqr . core import lib
 
+from . import benchmarks
 from . import cfg
 
 
@@ -25,6 +28,30 @@ class UnknownSerializable:
     """Class for testing with no known serialization."""
 
 
+class RegisteredSerializable:
+    """Class for testing with registered serialization."""
+
+
+class SubRegisteredSerializable(RegisteredSerializable):
+    """Subclass for testing with inherited registered serialization."""
+
+
+class SecretTypedObj:
+    """Typed object with a sensitive key for testing."""
+
+    api_key: str = 'abc'
+    name: str = 'test'
+
+
+class NestedSecretTypedObj:
+    """Typed object with nested sensitive values for testing."""
+
+    config: dict = {
+        'api_key': 'abc',
+        'note': 'ghp_' + 'a' * 36,
+        }
+
+
 class Constants(cfg.Constants):
     """Constant values specific to unit tests in this file."""
 
@@ -48,6 +75,31 @@ class Constants(cfg.Constants):
     DateTime = lib.datetime.datetime.now(lib.datetime.timezone.utc)
     Date = DateTime.date()
     SimpleObj = SimpleTypedObj(name='test', id_=1)
+    NumberStrs = (
+        '1',
+        '-1.5',
+        '.5',
+        '1.',
+        '1e5',
+        '1E5',
+        '1_000',
+        'inf',
+        ' 1',
+        '1+2j',
+        'abc',
+        '9' * 65,
+        '١٢',
+        )
+    DateTimeStrs = (
+        '2023-10-19',
+        '2023-10-19T01:02:03.123+01:00',
+        '2023-10-19 01:02',
+        '20231019',
+        '2023-W42-1',
+        '2023-13-01',
+        '20x3-10-19',
+        'abc',
+        )
 
 
 class TestUtils(unittest.TestCase):
@@ -461,3 +513,439 @@ class TestUtils(unittest.TestCase):
             repr(UnknownSerializable),
             codecs.utl.encode(UnknownSerializable)
             )
+
+    def test_42_str_decoder(self):
+        """Test `get_str_decoder` matches `parse` for scalar types."""
+
+        cases = (
+            ('abc', str),
+            ('True', bool),
+            ('12', int),
+            ('-1.5', float),
+            ('1.5', lib.decimal.Decimal),
+            ('2024-01-02T03:04:05', lib.datetime.datetime),
+            ('2024-01-02', lib.datetime.date),
+            )
+        self.assertListEqual(
+            [codecs.utl.get_str_decoder(tp)(value) for value, tp in cases],
+            [codecs.utl.parse(value, tp) for value, tp in cases]
+            )
+
+    def test_43_str_decoder(self):
+        """Test `get_str_decoder` matches `parse` for invalid values."""
+
+        cases = (
+            ('abc', bool),
+            ('abc', int),
+            ('1.5', int),
+            ('abc', lib.datetime.datetime),
+            ('2024-13-45', lib.datetime.datetime),
+            ('abc', lib.datetime.date),
+            )
+        self.assertListEqual(
+            [codecs.utl.get_str_decoder(tp)(value) for value, tp in cases],
+            [codecs.utl.parse(value, tp) for value, tp in cases]
+            )
+
+    def test_44_str_decoder(self):
+        """Test `get_str_decoder` matches `parse` for optional types."""
+
+        cases = (
+            ('12', lib.t.Optional[int]),
+            ('null', lib.t.Optional[int]),
+            ('null', None | int),
+            ('abc', lib.t.Optional[str]),
+            )
+        self.assertListEqual(
+            [codecs.utl.get_str_decoder(tp)(value) for value, tp in cases],
+            [codecs.utl.parse(value, tp) for value, tp in cases]
+            )
+
+    def test_45_str_decoder(self):
+        """Test `get_str_decoder` matches `parse` for other types."""
+
+        cases = (
+            ('[1, 2]', list[int]),
+            ('{"a": 1}', dict[str, int]),
+            ('a', lib.t.Literal['a', 'b']),
+            ('1', int | str),
+            )
+        self.assertListEqual(
+            [codecs.utl.get_str_decoder(tp)(value) for value, tp in cases],
+            [codecs.utl.parse(value, tp) for value, tp in cases]
+            )
+
+    def test_46_str_decoder(self):
+        """Test `get_str_decoder` is resolved once per type."""
+
+        self.assertIs(
+            codecs.utl.get_str_decoder(lib.t.Optional[int]),
+            codecs.utl.get_str_decoder(lib.t.Optional[int])
+            )
+
+    def test_47_str_decoder(self):
+        """Test `get_str_decoder` validates `Literal` values."""
+
+        self.assertIsInstance(
+            codecs.utl.get_str_decoder(lib.t.Literal['a', 'b'])('c'),
+            codecs.enm.ParseErrorRef
+            )
+
+    def test_48_register_encoder(self):
+        """Test `register_encoder` registers encoder for type."""
+
+        codecs.utl.register_encoder(RegisteredSerializable, lambda o: 'x')
+        self.addCleanup(
+            codecs.cfg.Constants.ENCODERS.pop,
+            RegisteredSerializable
+            )
+        self.assertEqual(codecs.utl.encode(RegisteredSerializable()), 'x')
+
+    def test_49_register_encoder(self):
+        """Test `register_encoder` invalidates resolved encoders."""
+
+        codecs.utl.encode(SubRegisteredSerializable())
+        codecs.utl.register_encoder(RegisteredSerializable, lambda o: 'y')
+        self.addCleanup(
+            codecs.cfg.Constants.ENCODERS.pop,
+            RegisteredSerializable
+            )
+        self.assertEqual(codecs.utl.encode(SubRegisteredSerializable()), 'y')
+
+    def test_50_get_encoder(self):
+        """Test `get_encoder` resolves encoders of bases."""
+
+        self.assertIs(
+            codecs.utl.get_encoder(codecs.lib.pathlib.PosixPath),
+            codecs.cfg.Constants.ENCODERS[codecs.lib.pathlib.Path]
+            )
+
+    def test_51_serialize_compact(self):
+        """Test `serialize` is neither indented nor sorted if compact."""
+
+        self.assertEqual(
+            codecs.utl.serialize(
+                {'b': 1, 'a': [lib.decimal.Decimal('2.5')]},
+                compact=True
+                ),
+            '{"b":1,"a":[2.5]}'
+            )
+
+    def test_52_serialize_compact(self):
+        """Test `serialize` defaults to `Constants.COMPACT_REPR`."""
+
+        with mock.patch.object(codecs.utl.Constants, 'COMPACT_REPR', True):
+            self.assertEqual(
+                codecs.utl.serialize(SecretTypedObj()),
+                codecs.utl.serialize(SecretTypedObj(), compact=True)
+                )
+
+    def test_53_serialize_compact(self):
+        """Test compact `serialize` redacts values of sensitive keys."""
+
+        self.assertEqual(
+            lib.json.loads(
+                codecs.utl.serialize(SecretTypedObj(), compact=True)
+                ),
+            {'api_key': '[ REDACTED :: API_KEY_TOKEN ]', 'name': 'test'}
+            )
+
+    def test_54_serialize_compact(self):
+        """Test compact `serialize` handles non-primitive keys."""
+
+        self.assertEqual(
+            codecs.utl.serialize(
+                {lib.decimal.Decimal(1.5): 1},
+                compact=True
+                ),
+            '{"1.5":1}'
+            )
+
+    def test_55_serialize_compact(self):
+        """Test compact `serialize` redacts nested keys and values."""
+
+        self.assertEqual(
+            lib.json.loads(
+                codecs.utl.serialize(NestedSecretTypedObj(), compact=True)
+                ),
+            {
+                'config': {
+                    'api_key': '[ REDACTED :: API_KEY_TOKEN ]',
+                    'note': '[ REDACTED :: GITHUB_PAT ]'
+                    }
+                }
+            )
+
+    def test_56_serialize_compact(self):
+        """Test compact `serialize` represents fields."""
+
+        class _Obj(fqr.Object):
+            name: fqr.Field[str] = 'x'
+
+        self.assertEqual(
+            lib.json.loads(codecs.utl.serialize(_Obj.name, compact=True)),
+            fqr.core.strings.utl.convert_for_repr(_Obj.name)
+            )
+
+    def test_57_decode_number(self):
+        """Test number decoding matches regex pre-validation."""
+
+        def _reference(value: str, tp: type) -> lib.t.Any:
+            if not fqr.core.strings.utl.is_valid_number_str(value):
+                return codecs.enm.ParseErrorRef.number_decode
+            try:
+                return tp(value)
+            except (ArithmeticError, ValueError):
+                return codecs.enm.ParseErrorRef.value_decode
+
+        cases = [
+            (value, tp)
+            for value
+            in Constants.NumberStrs
+            for tp
+            in (int, float, lib.decimal.Decimal)
+            ]
+        self.assertEqual(
+            [codecs.utl.try_decode(value, tp) for value, tp in cases],
+            [_reference(value, tp) for value, tp in cases]
+            )
+
+    def test_58_decode_datetime(self):
+        """Test `datetime` decoding matches regex pre-validation."""
+
+        def _reference(value: str) -> lib.t.Any:
+            if not fqr.core.strings.utl.is_valid_datetime_str(value):
+                return codecs.enm.ParseErrorRef.datetime_decode
+            try:
+                return lib.datetime.datetime.fromisoformat(value).replace(
+                    tzinfo=lib.datetime.timezone.utc
+                    )
+            except ValueError:
+                return codecs.enm.ParseErrorRef.value_decode
+
+        self.assertEqual(
+            [
+                codecs.utl.try_decode(value, lib.datetime.datetime)
+                for value
+                in Constants.DateTimeStrs
+                ],
+            [_reference(value) for value in Constants.DateTimeStrs]
+            )
+
+    def test_59_decode_str_batch(self):
+        """Test `decode_str_batch` matches decoding values individually."""
+
+        cases = [
+            (['1', '-2', '.5', '+3.25'], float),
+            (['1', '-2', '3'], int),
+            (['1', '1.'], float),
+            (['1', '9' * 65], int),
+            (['1', 'abc'], lib.t.Optional[int]),
+            (['1', 'null'], lib.t.Optional[int]),
+            (['2023-10-19', '2023-10-19T01:02:03'], lib.datetime.datetime),
+            (['2023-10-19', '2023-10-19T01:02:03'], lib.datetime.date),
+            (['2023-10-19', '20231019'], lib.datetime.datetime),
+            (['true', 'False'], bool),
+            (['a', 'b'], str),
+            ([], int),
+            ]
+        for values, tp in cases:
+            with self.subTest(values=values, tp=tp):
+                self.assertEqual(
+                    codecs.utl.decode_str_batch(values, tp),
+                    [codecs.utl.get_str_decoder(tp)(v) for v in values]
+                    )
+
+    def test_60_parse_union(self):
+        """Test union members matching value type are parsed first."""
+
+        cases = [
+            (None, int | str | None, None),
+            (1, int | str | None, 1),
+            ('1', int | str | None, '1'),
+            ('null', int | float | None, None),
+            ('1.5', int | float | None, 1.5),
+            (True, float | int | bool, True),
+            ('false', float | int | bool, False),
+            (1.5, float | int | bool, 1.5),
+            (2, float | str, 2.0),
+            ('[1]', list[int] | dict[str, int] | None, [1]),
+            ('{"a": 1}', list[int] | dict[str, int] | None, {'a': 1}),
+            (
+                codecs.lib.collections.deque([1]),
+                tuple[int, ...] | dict[str, int],
+                (1, )
+                ),
+            (
+                '2024-01-01',
+                lib.datetime.date | int,
+                lib.datetime.date(2024, 1, 1)
+                ),
+            (
+                lib.datetime.datetime(2024, 1, 1),
+                lib.datetime.date | str,
+                lib.datetime.datetime(2024, 1, 1)
+                ),
+            (b'abc', bytes | int, b'abc'),
+            (b'abc', str | int, "b'abc'"),
+            ]
+        for value, tp, expected in cases:
+            with self.subTest(value=value, tp=tp):
+                self.assertEqual(codecs.utl.parse(value, tp), expected)
+
+    def test_61_parse_union(self):
+        """Test typed union members are parsed from mappings."""
+
+        self.assertEqual(
+            codecs.utl.parse({'name': 'a', 'id_': 1}, SimpleTypedObj | int),
+            SimpleTypedObj(name='a', id_=1)
+            )
+
+    def test_62_parse_plan(self):
+        """Test key to field resolution is cached per key set."""
+
+        rows = [
+            {'name': 'a', 'id': 1},
+            {'id': 2, 'name': 'b'},
+            {'name': 'c', 'id': 3},
+            ]
+        memo = codecs.utl.get_memo(SimpleTypedObj)
+        memo.pop(codecs.utl.Constants.MEMO_PARSE_PLANS, None)
+        self.assertTrue(
+            [codecs.utl.parse(row, SimpleTypedObj) for row in rows] == [
+                SimpleTypedObj(name='a', id_=1),
+                SimpleTypedObj(name='b', id_=2),
+                SimpleTypedObj(name='c', id_=3),
+                ]
+            and len(memo[codecs.utl.Constants.MEMO_PARSE_PLANS]) == 2
+            )
+
+    def test_63_parse_plan(self):
+        """Test invalid keys are not parsed, with or without cache."""
+
+        memo = codecs.utl.get_memo(SimpleTypedObj)
+        memo.pop(codecs.utl.Constants.MEMO_PARSE_PLANS, None)
+        with mock.patch.object(codecs.utl.Constants, 'MAX_PARSE_PLANS', 0):
+            parsed = codecs.utl.parse(
+                {'name': 'a', 'nope': 1},
+                SimpleTypedObj
+                )
+        self.assertTrue(
+            parsed is codecs.enm.ParseErrorRef.invalid_keys_decode
+            and not memo[codecs.utl.Constants.MEMO_PARSE_PLANS]
+            )
+
+    def test_64_parse_plan(self):
+        """Test cached parse plans are cleared if a field is redefined."""
+
+        class _Obj(fqr.Object):
+            value: fqr.Field[int | str] = 0
+
+        codecs.utl.parse({'value': '1'}, _Obj)
+        _Obj['value'] = fqr.Field(name='value', type_=int, default=0)
+        self.assertNotIn(
+            codecs.utl.Constants.MEMO_PARSE_PLANS,
+            codecs.utl.get_memo(_Obj)
+            )
+
+    def test_65_type_cache(self):
+        """Test caches keyed by type hint are cleared once full."""
+
+        with mock.patch.object(
+            codecs.utl.Constants,
+            'CACHED_STR_DECODERS',
+            {}
+            ) as cache, mock.patch.object(
+                codecs.utl.Constants,
+                'MAX_CACHED_TYPES',
+                1
+                ):
+            codecs.utl.get_str_decoder(int)
+            codecs.utl.get_str_decoder(float)
+            self.assertListEqual(list(cache), [float])
+
+    def test_66_encoders(self):
+        """Test modifying `ENCODERS` directly invalidates resolved encoders."""
+
+        codecs.utl.encode(SubRegisteredSerializable())
+        codecs.cfg.Constants.ENCODERS[RegisteredSerializable] = lambda o: 'z'
+        self.addCleanup(
+            codecs.cfg.Constants.ENCODERS.pop,
+            RegisteredSerializable
+            )
+        self.assertEqual(codecs.utl.encode(SubRegisteredSerializable()), 'z')
+
+    def test_67_encoders(self):
+        """Test removing from `ENCODERS` invalidates resolved encoders."""
+
+        codecs.utl.register_encoder(RegisteredSerializable, lambda o: 'x')
+        codecs.utl.encode(SubRegisteredSerializable())
+        del codecs.cfg.Constants.ENCODERS[RegisteredSerializable]
+        self.assertIsNone(codecs.utl.get_encoder(SubRegisteredSerializable))
+
+    def test_68_encoders(self):
+        """Test updating `ENCODERS` in place invalidates resolved encoders."""
+
+        codecs.utl.encode(SubRegisteredSerializable())
+        codecs.cfg.Constants.ENCODERS |= {RegisteredSerializable: str}
+        self.addCleanup(
+            codecs.cfg.Constants.ENCODERS.pop,
+            RegisteredSerializable
+            )
+        self.assertIs(
+            codecs.utl.get_encoder(SubRegisteredSerializable),
+            str
+            )
+
+    def test_69_benchmark_encode(self):
+        """Test benchmark harness times serialization."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_encode(1)),
+            {'serialize', 'serialize_uncached'}
+            )
+
+    def test_70_serialize_compact(self):
+        """Test compact `serialize` redacts sensitive-looking strings."""
+
+        self.assertEqual(
+            codecs.utl.serialize({'note': 'ghp_' + 'a' * 36}, compact=True),
+            '{"note":"[ REDACTED :: GITHUB_PAT ]"}'
+            )
+
+    def test_71_benchmark_decode(self):
+        """Test benchmark harness times decoding from `str`."""
+
+        self.assertDictEqual(
+            {
+                tp: set(timings)
+                for tp, timings
+                in benchmarks.benchmark_decode(2).items()
+                },
+            {
+                tp: {'try_decode', 'get_str_decoder', 'decode_str_batch'}
+                for tp
+                in ('datetime', 'int', 'float')
+                }
+            )
+
+    def test_72_benchmark_union(self):
+        """Test benchmark harness times union decoding."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_union(1)),
+            {'parse', 'init'}
+            )
+
+    def test_73_benchmark_parse_plan(self):
+        """Test benchmark harness times parsing `list[Object]` payloads."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_parse_plan(2)),
+            {
+                'uniform_cached',
+                'mixed_cached',
+                'uniform_uncached',
+                'mixed_uncached'
+                }
+            )
@@ -2,6 +2,8 @@
 
 import unittest
 
+from unittest import mock
+
 import fqr
 
 from ... import mocking
@@ -143,6 +145,22 @@ class TestUtils(unittest.TestCase):
                 )
             )
 
+    def test_17_checkable_types_cache(self):
+        """Test checkable types cache is cleared once full."""
+
+        with mock.patch.object(
+            fqr.core.typ.utl.check.Constants,
+            'CACHED_CHECKABLE_TYPES',
+            {}
+            ) as cache, mock.patch.object(
+                fqr.core.typ.utl.check.Constants,
+                'MAX_CACHED_TYPES',
+                1
+                ):
+            fqr.core.typ.utl.check.get_checkable_types(list[int])
+            fqr.core.typ.utl.check.get_checkable_types(list[str])
+            self.assertListEqual(list(cache), [list[str]])
+
 
 class Mockery(fqr.core.lib.t.Generic[fqr.core.typ.AnyType]):
     """An as yet undefined generic class for testing."""
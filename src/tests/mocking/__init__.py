@@ -2,6 +2,7 @@ __all__ = (
     'examples',
     'Derivative',
     'DubDeriv',
+    'FrozenDeriv',
     'MixinDeriv',
     'NewDeriv',
     'TripDeriv',
@@ -101,3 +102,16 @@ class AntiTripDeriv(DubDeriv, MixinDeriv):
     new_deriv: fqr.Field[NewDeriv] = NewDeriv()
     dict_field: fqr.Field[dict] = {'record_id': 'Lauren'}
     generic_dict_field: fqr.Field[dict[str, float]] = {'record_id': 1.23}
+
+
+class FrozenDeriv(fqr.FrozenObject):
+    """Simple frozen test derivative."""
+
+    id_: fqr.Field[str]
+    int_field: fqr.Field[int] = 2
+    list_field: fqr.Field[list[str]] = []
+    dict_field: fqr.Field[dict[str, int]] = {}
+    set_field: fqr.Field[set[int]] = set()
+    any_field: fqr.Field[lib.t.Any] = None
+    new_deriv: fqr.Field[lib.t.Optional[NewDeriv]] = None
+    frozen_derivs: fqr.Field[list['FrozenDeriv']] = []
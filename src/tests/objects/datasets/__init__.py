@@ -0,0 +1,7 @@
+"""Datasets module unit tests."""
+
+__all__ = (
+    'cfg',
+    )
+
+from . import cfg
@@ -0,0 +1,269 @@
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import fqr
+
+from ... import mocking
+
+
+class TestObjectDataset(unittest.TestCase):
+    """Fixture for testing the object."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.Derivative
+        self.objects = [
+            self.cls(int_field=i, str_field=str(i % 3), bool_field=i % 2 == 0)
+            for i
+            in range(10)
+            ]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'rows.ndjson')
+        with open(self.path, 'w') as f:
+            fqr.core.codecs.utl.dump_stream(self.objects, f, ndjson=True)
+            f.write('\n  \n')
+        self.dataset = fqr.objects.ObjectDataset(
+            self.cls,
+            self.path,
+            block_size=4
+            )
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.dataset.close()
+        self.tmp.cleanup()
+        return super().tearDown()
+
+    def reopen(self, **kwargs) -> None:
+        self.dataset.close()
+        self.dataset = fqr.objects.ObjectDataset(
+            self.cls,
+            self.path,
+            **{'block_size': 4, **kwargs}
+            )
+
+    def test_01_len(self):
+        """Test `ObjectDataset` length ignores blank lines."""
+
+        self.assertEqual(len(self.dataset), len(self.objects))
+
+    def test_02_getitem(self):
+        """Test `ObjectDataset` indexing decodes a single row."""
+
+        self.assertTrue(
+            self.dataset[-1] == self.objects[-1]
+            and self.dataset[-1].int_field == 9
+            )
+
+    def test_03_getitem(self):
+        """Test `ObjectDataset` slicing returns a `list` of rows."""
+
+        self.assertListEqual(self.dataset[2:5], self.objects[2:5])
+
+    def test_04_iter(self):
+        """Test `ObjectDataset` iterates rows equal to source objects."""
+
+        self.assertListEqual(list(self.dataset), self.objects)
+
+    def test_05_index(self):
+        """Test `ObjectDataset` index is persisted and reused."""
+
+        self.dataset.offsets.append(0)
+        self.dataset._dump_index(
+            {
+                'fingerprint': self.dataset._get_fingerprint(),
+                'offsets': self.dataset.offsets,
+                'stats': self.dataset.stats
+                }
+            )
+        self.reopen()
+        self.assertTrue(
+            os.path.exists(self.path + '.idx')
+            and len(self.dataset) == len(self.objects) + 1
+            )
+
+    def test_06_index(self):
+        """Test `ObjectDataset` index is rebuilt once the file changes."""
+
+        with open(self.path, 'a') as f:
+            f.write('{"intField": 10}')
+        self.reopen()
+        self.assertEqual(self.dataset[-1].int_field, 10)
+
+    def test_07_index(self):
+        """Test `ObjectDataset` ignores failures to persist its index."""
+
+        with fqr.objects.ObjectDataset(
+            self.cls,
+            self.path,
+            index_path=os.path.join(self.path, 'rows.idx')
+            ) as dataset:
+            self.assertEqual(len(dataset), len(self.objects))
+
+    def test_08_stats(self):
+        """Test `ObjectDataset` stores numeric min / max per block."""
+
+        self.assertTupleEqual(
+            self.dataset.stats['int_field'],
+            ([0, 4, 8], [3, 7, 9])
+            )
+
+    def test_09_stats(self):
+        """Test `ObjectDataset` never skips blocks with other values."""
+
+        with open(self.path, 'a') as f:
+            f.write('{"intField": "10", "decimalField": null}\n[]\n{\n')
+        self.reopen()
+        self.assertTupleEqual(
+            self.dataset.stats['int_field'],
+            (
+                [0, 4, -float('inf'), -float('inf')],
+                [3, 7, float('inf'), float('inf')]
+                )
+            )
+
+    def test_10_stats(self):
+        """Test `ObjectDataset` without stats."""
+
+        self.reopen(stats=False, index_path=self.path + '.offsets')
+        self.assertTrue(
+            self.dataset.stats is None
+            and len(self.dataset.filter(self.cls.int_field > 7)) == 2
+            )
+
+    def test_11_filter(self):
+        """Test `ObjectDataset` filters rows with a `Query`."""
+
+        query = (
+            (
+                (self.cls.int_field >= 2)
+                & (self.cls.bool_field == True)  # noqa: E712
+                )
+            | (self.cls.str_field == '1')
+            | ~(self.cls.int_field != 9)
+            )
+        self.assertListEqual(
+            list(self.dataset.filter(query)),
+            list(fqr.objects.ObjectFrame(self.cls, self.objects).filter(query))
+            )
+
+    def test_12_filter(self):
+        """Test `ObjectDataset` skips blocks which cannot match."""
+
+        self.assertListEqual(
+            [
+                self.dataset._may_match(query, block)
+                for query
+                in (
+                    self.cls.int_field == 5,
+                    self.cls.int_field < 4,
+                    self.cls.int_field > 3,
+                    (self.cls.int_field <= 3) | (self.cls.int_field >= 8),
+                    self.cls.int_field != 3,
+                    fqr.objects.queries.EqQueryCondition(
+                        field='int_field',
+                        eq='5'
+                        ),
+                    )
+                for block
+                in range(3)
+                ],
+            [
+                False, True, False,
+                True, False, False,
+                False, True, True,
+                True, False, True,
+                True, True, True,
+                True, True, True,
+                ]
+            )
+
+    def test_13_filter(self):
+        """Test `ObjectDataset` applies `Query` sorting and limit."""
+
+        query = self.cls.int_field < 8
+        query.limit = 2
+        self.assertListEqual(
+            [obj.int_field for obj in self.dataset.filter(query)],
+            [0, 1]
+            )
+        query -= 'int_field'
+        self.assertListEqual(
+            [obj.int_field for obj in self.dataset.filter(query)],
+            [7, 6]
+            )
+
+    def test_14_empty(self):
+        """Test `ObjectDataset` of an empty file."""
+
+        open(self.path, 'w').close()
+        self.reopen()
+        self.assertTrue(
+            len(self.dataset) == 0
+            and not self.dataset.filter(self.cls.int_field > 3)
+            )
+
+    def test_15_repr(self):
+        """Test `ObjectDataset` repr."""
+
+        self.assertEqual(repr(self.dataset), 'ObjectDataset[Derivative](10)')
+
+    def test_16_index(self):
+        """Test `ObjectDataset` reuses offsets and stats of its index."""
+
+        stats = self.dataset.stats
+        with mock.patch.object(
+            fqr.objects.ObjectDataset,
+            '_build_index'
+            ) as build_index:
+            self.reopen()
+        build_index.assert_not_called()
+        self.assertTrue(
+            self.dataset.stats == stats
+            and list(self.dataset) == self.objects
+            )
+
+    def test_17_index(self):
+        """Test `ObjectDataset` index is rebuilt if truncated."""
+
+        with open(self.path + '.idx', 'r+b') as f:
+            f.truncate(os.path.getsize(self.path + '.idx') - 8)
+        self.reopen()
+        self.assertListEqual(list(self.dataset), self.objects)
+
+    def test_18_stats(self):
+        """Test `ObjectDataset` never skips blocks with other types."""
+
+        with open(self.path, 'a') as f:
+            f.write('{"intField": 10.5}\n')
+        self.reopen()
+        self.assertTupleEqual(
+            self.dataset.stats['int_field'],
+            ([0, 4, -float('inf')], [3, 7, float('inf')])
+            )
+
+    def test_19_close(self):
+        """Test `ObjectDataset` is closed if indexing fails."""
+
+        with (
+            mock.patch.object(
+                fqr.objects.ObjectDataset,
+                '_load_index',
+                side_effect=ValueError
+                ),
+            mock.patch.object(
+                fqr.objects.ObjectDataset,
+                'close',
+                autospec=True,
+                side_effect=fqr.objects.ObjectDataset.close
+                ) as close
+            ):
+            self.assertRaises(
+                ValueError,
+                fqr.objects.ObjectDataset,
+                self.cls,
+                self.path
+                )
+        close.assert_called_once()
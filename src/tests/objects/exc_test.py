@@ -76,3 +76,11 @@ class TestExceptions(unittest.TestCase):
         dump = pickle.dumps(exc)
         reloaded: fqr.core.typ.PackageExceptionType = pickle.loads(dump)
         self.assertTupleEqual(exc.args, reloaded.args)
+
+    def test_07_serialization(self):
+        """Test exc serializes correctly."""
+
+        exc = fqr.objects.exc.BinaryEncodingError('test', 1 << 70)
+        dump = pickle.dumps(exc)
+        reloaded: fqr.core.typ.PackageExceptionType = pickle.loads(dump)
+        self.assertTupleEqual(exc.args, reloaded.args)
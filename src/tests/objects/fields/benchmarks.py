@@ -0,0 +1,71 @@
+"""
+Benchmarks for setting `Field` values.
+
+---
+
+Run with:
+
+```sh
+cd src && python -m tests.objects.fields.benchmarks
+
+```
+
+"""
+
+import timeit
+
+import fqr
+
+from fqr . core import lib
+
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    Values: dict[str, str] = {
+        'str_field': 'abc',
+        'int_field': '123',
+        'opt_int_field': '123',
+        'datetime_field': '2024-01-01T12:30:00+00:00',
+        }
+    """`str` values set on each field of `Scalars`."""
+
+
+class Scalars(fqr.Object):
+    """`Object` with one field per scalar type benchmarked."""
+
+    str_field: fqr.Field[str] = 'a'
+    int_field: fqr.Field[int] = 0
+    opt_int_field: fqr.Field[lib.t.Optional[int]] = None
+    datetime_field: fqr.Field[lib.t.Optional[lib.datetime.datetime]] = None
+
+
+def benchmark(n: int = 10_000) -> dict[str, float]:
+    """
+    Return mean µs per set of each field of `Scalars` from a `str` \
+    value, parsed to the type of the field.
+
+    """
+
+    object_ = Scalars()
+    results: dict[str, float] = {}
+    for field, value in Constants.Values.items():
+        set_ = Scalars.__dataclass_fields__[field].__set__
+        results[field] = (
+            min(
+                timeit.repeat(
+                    lambda: set_(object_, value),
+                    number=n,
+                    repeat=5
+                    )
+                )
+            / n
+            * 1e6
+            )
+    return results
+
+
+if __name__ == '__main__':
+    fqr.log.info({'us_per_set': benchmark()})
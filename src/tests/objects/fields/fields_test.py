@@ -1,10 +1,14 @@
 import json
 import unittest
 
+from unittest import mock
+
 import fqr
 
 from ... import mocking
 
+from . import benchmarks
+
 
 class TestField(unittest.TestCase):
     """Fixture for testing the object."""
@@ -297,3 +301,58 @@ class TestFieldValidation(unittest.TestCase):
         self.assertTrue(
             self.cls.generic_dict_field == self.cls.generic_dict_field
             )
+
+    def test_21_set(self):
+        """Test assignment stores non-`str` values as is."""
+
+        obj = self.cls(int_field=5.7, generic_tuple_field=3)
+
+        self.assertEqual(
+            (obj.int_field, obj.generic_tuple_field),
+            (5.7, 3)
+            )
+
+    def test_22_set(self):
+        """Test assignment stores `str` values as is."""
+
+        obj = self.cls(int_field='12', secondary_key='x')
+
+        self.assertEqual((obj.int_field, obj.secondary_key), ('12', 'x'))
+
+    def test_23_set(self):
+        """
+        Test `Field__set__` parses `str` values of scalar types.
+
+        """
+
+        obj = mocking.Derivative()
+        mocking.Derivative.int_field.__set__(obj, '3')
+
+        self.assertEqual(obj.int_field, 3)
+
+    def test_24_parse(self):
+        """Test `str` values parsed by the `str` decoder of the type."""
+
+        with mock.patch.object(
+            fqr.core.codecs.utl,
+            'parse',
+            side_effect=AssertionError
+            ):
+            self.assertEqual(self.cls.int_field.parse('3'), 3)
+
+    def test_25_parse(self):
+        """Test invalid `str` values still raise on parse."""
+
+        self.assertRaises(
+            fqr.objects.exc.TypeValidationError,
+            self.cls.int_field.parse,
+            'abc'
+            )
+
+    def test_26_benchmark(self):
+        """Test benchmark harness times setting fields from `str`."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark(1)),
+            set(benchmarks.Constants.Values)
+            )
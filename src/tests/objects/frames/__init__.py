@@ -0,0 +1,7 @@
+"""Frames module unit tests."""
+
+__all__ = (
+    'cfg',
+    )
+
+from . import cfg
@@ -0,0 +1,105 @@
+"""
+Benchmarks for `ObjectFrame` memory and scans.
+
+---
+
+Run with:
+
+```sh
+cd src && python -m tests.objects.frames.benchmarks
+
+```
+
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+import fqr
+
+from fqr . core import lib
+
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    Species = ('cat', 'dog', 'fish')
+    """Values of `Pet.species`, repeated across rows."""
+
+
+class Pet(fqr.Object):
+    """Row of the frames benchmarked."""
+
+    name: fqr.Field[str]
+    species: fqr.Field[str] = 'cat'
+    age: fqr.Field[int] = 0
+    weight: fqr.Field[float] = 0.0
+    vaccinated: fqr.Field[bool] = False
+
+
+def _pets(n: int) -> lib.t.Iterator[Pet]:
+    for i in range(n):
+        yield Pet(
+            name=f'pet_{i}',
+            species=Constants.Species[i % len(Constants.Species)],
+            age=i % 20,
+            weight=i / 10,
+            vaccinated=i % 2 == 0
+            )
+
+
+def _traced_bytes(fn: lib.t.Callable[[], lib.t.Any]) -> tuple[int, lib.t.Any]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, result
+
+
+def benchmark(n: int = 100_000) -> dict[str, float]:
+    """
+    Return bytes per row held by an `ObjectFrame` and by a `list` of \
+    `Objects` of `n` rows, and mean ns per row to filter each.
+
+    """
+
+    frame_bytes, frame = _traced_bytes(
+        lambda: fqr.objects.ObjectFrame(Pet, _pets(n))
+        )
+    list_bytes, pets = _traced_bytes(lambda: list(_pets(n)))
+    query = (Pet.age >= 10) & (Pet.species == 'dog')
+    return {
+        'bytes_per_row_frame': frame_bytes / n,
+        'bytes_per_row_list': list_bytes / n,
+        'ns_per_row_filter_frame': (
+            min(timeit.repeat(lambda: frame.filter(query), number=1, repeat=5))
+            / n
+            * 1e9
+            ),
+        'ns_per_row_filter_list': (
+            min(
+                timeit.repeat(
+                    lambda: [
+                        pet
+                        for pet
+                        in pets
+                        if pet.age >= 10 and pet.species == 'dog'
+                        ],
+                    number=1,
+                    repeat=5
+                    )
+                )
+            / n
+            * 1e9
+            ),
+        }
+
+
+if __name__ == '__main__':
+    fqr.log.info({'rows': 100_000, 'results': benchmark()})
@@ -0,0 +1,11 @@
+"""Constant values specific to module unit tests."""
+
+__all__ = (
+    'Constants',
+    )
+
+from .. import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to unit tests in this module."""
@@ -0,0 +1,233 @@
+import pickle
+import unittest
+
+from unittest import mock
+
+import fqr
+
+from ... import mocking
+
+from . import benchmarks
+
+
+class TestObjectFrame(unittest.TestCase):
+    """Fixture for testing the object."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.Derivative
+        self.objects = [
+            self.cls(int_field=i, str_field=str(i % 3), bool_field=i % 2 == 0)
+            for i
+            in range(6)
+            ]
+        self.frame = fqr.objects.ObjectFrame(self.cls, self.objects)
+        return super().setUp()
+
+    def test_01_len(self):
+        """Test `ObjectFrame` length."""
+
+        self.assertEqual(len(self.frame), len(self.objects))
+
+    def test_02_iter(self):
+        """Test `ObjectFrame` materializes rows equal to source objects."""
+
+        self.assertListEqual(list(self.frame), self.objects)
+
+    def test_03_getitem(self):
+        """Test `ObjectFrame` indexing materializes a clean row."""
+
+        obj = self.frame[-1]
+        self.assertTrue(
+            obj == self.objects[-1]
+            and obj.bool_field is False
+            and not obj.changed_fields()
+            )
+
+    def test_04_getitem(self):
+        """Test `ObjectFrame` slicing returns a frame."""
+
+        self.assertListEqual(list(self.frame[1:3]), self.objects[1:3])
+
+    def test_05_append(self):
+        """Test `ObjectFrame` appends from `dict`."""
+
+        self.frame.append({'intField': 10})
+        self.assertEqual(self.frame[-1], self.cls(int_field=10))
+
+    def test_06_columns(self):
+        """Test `ObjectFrame` stores primitive fields in arrays."""
+
+        self.assertTrue(
+            self.frame.column('int_field').typecode == 'q'
+            and self.frame.column('boolField').typecode == 'b'
+            and self.frame.column('str_field')[0] is self.frame.column(
+                'str_field'
+                )[3]
+            )
+
+    def test_07_column_fallback(self):
+        """Test `ObjectFrame` array column falls back to `list`."""
+
+        self.frame.append({'int_field': 2 ** 70})
+        self.assertListEqual(
+            self.frame.project('int_field')['int_field'],
+            [*range(6), 2 ** 70]
+            )
+
+    def test_08_column(self):
+        """Test `ObjectFrame` raises for unknown column."""
+
+        self.assertRaises(KeyError, self.frame.column, 'not_a_field')
+
+    def test_09_filter(self):
+        """Test `ObjectFrame` filters rows with a `Query`."""
+
+        self.assertListEqual(
+            list(
+                self.frame.filter(
+                    (
+                        (self.cls.int_field >= 2)
+                        & (self.cls.bool_field == True)  # noqa: E712
+                        )
+                    | (self.cls.str_field == '1')
+                    )
+                ),
+            [
+                obj
+                for obj
+                in self.objects
+                if (obj.int_field >= 2 and obj.bool_field)
+                or obj.str_field == '1'
+                ]
+            )
+
+    def test_10_filter(self):
+        """Test `ObjectFrame` filters rows with inverted conditions."""
+
+        self.assertListEqual(
+            list(self.frame.filter(~(self.cls.str_field << '0'))),
+            [obj for obj in self.objects if '0' not in obj.str_field]
+            )
+
+    def test_11_filter(self):
+        """Test `ObjectFrame` applies `Query` sorting and limit."""
+
+        query = self.cls.int_field < 5
+        query -= 'int_field'
+        query.limit = 2
+        self.assertListEqual(
+            [obj.int_field for obj in self.frame.filter(query)],
+            [4, 3]
+            )
+
+    def test_12_filter(self):
+        """Test `ObjectFrame` ignores `None` for ordered comparisons."""
+
+        self.frame.append({'int_field': None})
+        self.assertEqual(len(self.frame.filter(self.cls.int_field > 3)), 2)
+
+    def test_13_filter(self):
+        """Test `ObjectFrame` filters rows with similarity."""
+
+        self.assertEqual(
+            len(self.frame.filter(self.cls.str_field % ('1', 0.9))),
+            2
+            )
+
+    def test_14_pickle(self):
+        """Test materialized rows can be pickled."""
+
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.frame[0])),
+            self.objects[0]
+            )
+
+    def test_15_filter(self):
+        """Test `ObjectFrame` matches all rows for a bare `Query`."""
+
+        self.assertEqual(
+            len(self.frame.filter(fqr.objects.queries.Query(limit=4))),
+            4
+            )
+
+    def test_16_repr(self):
+        """Test `ObjectFrame` repr."""
+
+        self.assertEqual(repr(self.frame), 'ObjectFrame[Derivative](6)')
+
+    def test_17_filter(self):
+        """Test `ObjectFrame` sorts `None` values last."""
+
+        self.frame.append({'int_field': None})
+        query = fqr.objects.queries.Query()
+        query += 'int_field'
+        self.assertListEqual(
+            [obj.int_field for obj in self.frame.filter(query)],
+            [0, 1, 2, 3, 4, 5, None]
+            )
+
+    def test_18_filter(self):
+        """Test `ObjectFrame` decodes lazy fields of rows."""
+
+        trips = [
+            mocking.TripDeriv(
+                int_field=i,
+                new_deriv=mocking.NewDeriv(anti_field_1=str(i)),
+                required_field=2
+                )
+            for i
+            in range(3)
+            ]
+        with mock.patch.object(
+            fqr.core.codecs.cfg.Constants,
+            'LAZY_DECODING',
+            True
+            ):
+            rows = [
+                fqr.core.codecs.utl.parse(
+                    fqr.core.codecs.utl.loads_json(
+                        fqr.core.codecs.utl.serialize(trip)
+                        ),
+                    mocking.TripDeriv
+                    )
+                for trip
+                in trips
+                ]
+        frame = fqr.objects.ObjectFrame(mocking.TripDeriv, rows)
+        self.assertTrue(
+            all(
+                isinstance(value, mocking.NewDeriv)
+                for value
+                in frame.column('new_deriv')
+                )
+            and list(frame.filter(mocking.TripDeriv.int_field >= 1))
+            == trips[1:]
+            )
+
+    def test_19_filter(self):
+        """Test `ObjectFrame` treats incomparable values as non-matching."""
+
+        class _Mixed(fqr.Object):
+            mixed_field: fqr.Field[fqr.core.lib.t.Union[int, str]] = 0
+
+        frame = fqr.objects.ObjectFrame(
+            _Mixed,
+            [_Mixed(mixed_field=v) for v in (1, 'abc', 5)]
+            )
+        self.assertListEqual(
+            [obj.mixed_field for obj in frame.filter(_Mixed.mixed_field > 2)],
+            [5]
+            )
+
+    def test_20_benchmark(self):
+        """Test benchmark harness measures memory and scans."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark(2)),
+            {
+                'bytes_per_row_frame',
+                'bytes_per_row_list',
+                'ns_per_row_filter_frame',
+                'ns_per_row_filter_list'
+                }
+            )
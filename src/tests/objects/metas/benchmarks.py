@@ -0,0 +1,154 @@
+"""
+Benchmarks for class creation, finalization and type checks.
+
+---
+
+Run with:
+
+```sh
+cd src && python -m tests.objects.metas.benchmarks
+
+```
+
+"""
+
+import timeit
+
+from unittest import mock
+
+import fqr
+
+from fqr . core import lib
+
+from ... import mocking
+
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    ModelTemplate = lib.textwrap.dedent(
+        """
+        class Model{i}(fqr.Object):
+            id_: fqr.Field[str]
+            str_field: fqr.Field[str] = 'abc'
+            int_field: fqr.Field[int] = {i}
+            float_field: fqr.Field[float] = 1.5
+            bool_field: fqr.Field[bool] = True
+            list_field: fqr.Field[list[str]] = []
+            opt_field: fqr.Field[lib.t.Optional[int]] = None
+        """
+        )
+    """Source of a seven-field model, formatted with its index."""
+
+    ModuleName = f'{__name__}.models'
+    """Name the generated module is imported as."""
+
+
+def _generate_module(n: int) -> lib.types.CodeType:
+    return compile(
+        ''.join(Constants.ModelTemplate.format(i=i) for i in range(n)),
+        '<models>',
+        'exec'
+        )
+
+
+def _exec_module(code: lib.types.CodeType) -> dict[str, lib.t.Any]:
+    module = lib.types.ModuleType(Constants.ModuleName)
+    module.__dict__.update(fqr=fqr, lib=lib)
+    lib.sys.modules[Constants.ModuleName] = module
+    exec(code, module.__dict__)
+    return module.__dict__
+
+
+def benchmark(n: int = 1000) -> dict[str, float]:
+    """
+    Return seconds to import a generated module of `n` models, \
+    eagerly and lazily finalized, and to then instantiate each model.
+
+    """
+
+    code = _generate_module(n)
+    results: dict[str, float] = {}
+    for mode, lazy in (('eager', False), ('lazy', True)):
+        with mock.patch.object(
+            fqr.objects.cfg.Constants,
+            'LAZY_FINALIZATION',
+            lazy
+            ):
+            namespaces: list[dict[str, lib.t.Any]] = []
+            results[f'import_{mode}'] = min(
+                timeit.repeat(
+                    lambda: namespaces.append(_exec_module(code)),
+                    number=1,
+                    repeat=3
+                    )
+                )
+            results[f'first_use_{mode}'] = min(
+                timeit.repeat(
+                    lambda: [
+                        model(id_='abc')
+                        for model
+                        in namespaces.pop().values()
+                        if isinstance(model, fqr.objects.metas.Meta)
+                        ],
+                    number=1,
+                    repeat=3
+                    )
+                )
+    lib.sys.modules.pop(Constants.ModuleName)
+    return results
+
+
+def benchmark_checks(n: int = 1000) -> dict[str, float]:
+    """
+    Return mean ns per type check over a mixed list of `Objects` \
+    and primitives.
+
+    """
+
+    values = [
+        mocking.Derivative(),
+        mocking.TripDeriv(),
+        mocking.NewDeriv(),
+        'abc',
+        1,
+        1.5,
+        None,
+        ['abc'],
+        {'abc': 1},
+        ]
+    return {
+        name: (
+            min(timeit.repeat(fn, number=n, repeat=5)) / n / len(values) * 1e9
+            )
+        for name, fn
+        in (
+            (
+                'isinstance_object',
+                lambda: [isinstance(v, fqr.Object) for v in values]
+                ),
+            (
+                'isinstance_derivative',
+                lambda: [isinstance(v, mocking.Derivative) for v in values]
+                ),
+            (
+                'issubclass_object',
+                lambda: [issubclass(type(v), fqr.Object) for v in values]
+                ),
+            (
+                'is_object',
+                lambda: [
+                    fqr.core.typ.utl.check.is_object(v)
+                    for v
+                    in values
+                    ]
+                ),
+            )
+        }
+
+
+if __name__ == '__main__':
+    fqr.log.info({'models': 1000, 'seconds': benchmark()})
+    fqr.log.info({'ns_per_check': benchmark_checks()})
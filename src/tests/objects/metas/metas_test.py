@@ -1,10 +1,14 @@
+import copy
+import gc
 import typing
 import unittest
+import weakref
 
 import fqr
 
 from ... import mocking
 
+from . import benchmarks
 from . import cfg
 
 
@@ -12,6 +16,25 @@ class Constants(cfg.Constants):
     """Constant values specific to unit tests in this file."""
 
 
+class LazyPet(fqr.Object, lazy=True):
+    """A lazy pet."""
+
+    id_: fqr.Field[str]
+    name: fqr.Field[str] = 'Fido'
+    type: fqr.Field[str] = fqr.Field(
+        default='dog',
+        enum=['cat', 'dog'],
+        )
+    parent: 'fqr.Field[typing.Optional[LazyPet]]' = None
+    species: typing.ClassVar[str] = 'pet'
+
+
+class LazierPet(LazyPet, lazy=True):
+    """A lazier pet."""
+
+    is_napping: fqr.Field[bool] = True
+
+
 class TestMeta(unittest.TestCase):
     """Fixture for testing Meta."""
 
@@ -217,6 +240,137 @@ class TestMeta(unittest.TestCase):
 
         self.assertRaises(fqr.objects.exc.IncorrectCasingError, _fn)
 
+    def test_19_rebase_cache(self):
+        """Test common base synthesized once per tuple of bases."""
+
+        class _TripDeriv(mocking.MixinDeriv, mocking.DubDeriv):
+            triple_field: fqr.Field[int] = 3
+
+        self.assertIs(_TripDeriv.__base__, mocking.TripDeriv.__base__)
+
+    def test_20_rebase_cache(self):
+        """Test common base synthesized per ordered tuple of bases."""
+
+        self.assertIsNot(
+            mocking.AntiTripDeriv.__base__,
+            mocking.TripDeriv.__base__
+            )
+
+    def test_21_rebase_cache(self):
+        """Test common base is released with classes deriving from it."""
+
+        class _Left(fqr.Object):
+            left_field: fqr.Field[int] = 1
+
+        class _Right(fqr.Object):
+            right_field: fqr.Field[int] = 2
+
+        class _Both(_Left, _Right):
+            both_field: fqr.Field[int] = 3
+
+        heritage = _Both.__heritage__
+        self.assertIn(heritage, fqr.objects.metas.obj.Constants.REBASES)
+        del _Both, _Left, _Right
+        gc.collect()
+        self.assertNotIn(heritage, fqr.objects.metas.obj.Constants.REBASES)
+
+    def test_22_field_descriptor(self):
+        """Test fields read from class, slot descriptors from layout."""
+
+        self.assertTupleEqual(
+            (
+                self.cls.str_field,
+                type(vars(self.cls)['str_field'])
+                ),
+            (
+                self.cls.__dataclass_fields__['str_field'],
+                fqr.core.lib.types.MemberDescriptorType
+                )
+            )
+
+    def test_23_field_descriptor(self):
+        """Test slot descriptors read and write instance values."""
+
+        obj = self.cls(str_field='abc')
+        obj.str_field = 'xyz'
+        self.assertEqual(obj.str_field, 'xyz')
+
+    def test_24_rebase_field_descriptor(self):
+        """Test fields of rebased class bound to rebased layout."""
+
+        self.assertTrue(
+            all(
+                getattr(mocking.TripDeriv, name)
+                is mocking.TripDeriv.__dataclass_fields__[name]
+                for name
+                in mocking.TripDeriv.fields
+                )
+            )
+
+    def test_25_lineage(self):
+        """Test lineage includes synthesized and inherited bases."""
+
+        self.assertTrue(
+            {
+                mocking.TripDeriv.__base__,
+                mocking.MixinDeriv,
+                mocking.DubDeriv,
+                mocking.Derivative,
+                fqr.Object,
+                } <= mocking.TripDeriv.__lineage__
+            )
+
+    def test_26_transitive_heritage_instancecheck(self):
+        """Test instance check considers transitive heritage."""
+
+        self.assertIsInstance(mocking.TripDeriv(), mocking.Derivative)
+
+    def test_27_transitive_heritage_subclasscheck(self):
+        """Test subclass check considers transitive heritage."""
+
+        self.assertTrue(
+            issubclass(mocking.TripDeriv, mocking.Derivative)
+            and not issubclass(mocking.Derivative, mocking.TripDeriv)
+            and not issubclass(int, fqr.Object)
+            )
+
+    def test_28_memo_released(self):
+        """Test values memoized per class are released with the class."""
+
+        class _MemoObj(fqr.Object):
+            int_field: fqr.Field[int] = 1
+            new_deriv: fqr.Field[typing.Optional[mocking.NewDeriv]] = None
+
+        object_ = _MemoObj(new_deriv=mocking.NewDeriv())
+        fqr.core.codecs.utl.encode_binary(object_)
+        fqr.core.codecs.utl.serialize(object_)
+        object_ << _MemoObj(int_field=2)
+        self.assertEqual(copy.deepcopy(object_), object_)
+        ref = weakref.ref(_MemoObj)
+        del _MemoObj, object_
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_29_memo_cleared(self):
+        """Test memos of rebased classes cleared if field redefined."""
+
+        class _Left(fqr.Object):
+            left_field: fqr.Field[int] = 1
+
+        class _Right(fqr.Object):
+            right_field: fqr.Field[int] = 2
+
+        class _Both(_Left, _Right):
+            both_field: fqr.Field[int] = 3
+
+        _Both._get_defaults()
+        _Left['left_field'] = fqr.Field(
+            name='left_field',
+            type_=int,
+            default=4
+            )
+        self.assertTupleEqual(_Both._get_defaults(), (3, 4, 2))
+
 
 class TestExceptions(unittest.TestCase):
     """Fixture for testing exceptions."""
@@ -331,3 +485,169 @@ class TestExceptions(unittest.TestCase):
                     }
                 ),
             )
+
+
+class TestLazyMeta(unittest.TestCase):
+    """Fixture for testing lazily finalized Meta."""
+
+    def setUp(self) -> None:
+        self.mcs = fqr.objects.metas.Meta
+
+        self.cls = LazyPet
+        self.sub = LazierPet
+        return super().setUp()
+
+    def test_01_deferred(self):
+        """Test class attributes are deferred until first access."""
+
+        cls = self.mcs(
+            'LazyTest',
+            (fqr.Object, ),
+            {
+                '__annotations__': {'string_field': fqr.Field[str]},
+                '__module__': self.__module__
+                },
+            lazy=True
+            )
+        self.assertIsInstance(
+            type.__getattribute__(cls, '__dict__')['__dataclass_fields__'],
+            fqr.objects.metas.obj.Deferred
+            )
+
+    def test_02_slots(self):
+        """Test slots are reserved on creation, excluding wrappers."""
+
+        self.assertTupleEqual(
+            self.cls.__slots__,
+            ('id_', 'name', 'type', 'parent')
+            )
+
+    def test_03_finalized_on_field_access(self):
+        """Test class finalized on first field access."""
+
+        self.assertIsInstance(self.cls.name, fqr.Field)
+        self.assertIsInstance(
+            type.__getattribute__(self.cls, '__dict__')['fields'],
+            tuple
+            )
+
+    def test_04_finalized_on_instantiation(self):
+        """Test class finalized on first instantiation."""
+
+        pet = self.cls(id_='abc')
+        self.assertEqual(
+            (pet.id_, pet.name, pet.type, pet.species),
+            ('abc', 'Fido', 'dog', 'pet')
+            )
+
+    def test_05_class_attributes(self):
+        """Test derived class attributes match eager definition."""
+
+        self.assertTupleEqual(
+            (
+                self.cls.fields,
+                self.cls.hash_fields,
+                self.cls.enumerations,
+                ),
+            (
+                ('id_', 'name', 'parent', 'type'),
+                ('id_', ),
+                {'type': ('cat', 'dog')},
+                )
+            )
+
+    def test_06_self_reference(self):
+        """Test self-referencing annotation resolves on finalization."""
+
+        self.assertEqual(
+            self.cls.parent.type_,
+            typing.Optional[self.cls]
+            )
+
+    def test_07_subclass(self):
+        """Test lazy subclass inherits fields from lazy base."""
+
+        self.assertTupleEqual(
+            self.sub(id_='abc', is_napping=False).fields,
+            ('id_', 'is_napping', 'name', 'parent', 'type')
+            )
+
+    def test_08_deferred_exception(self):
+        """Test invalid definition raises on every access."""
+
+        cls = self.mcs(
+            'ExcTest',
+            (fqr.Object, ),
+            {
+                '__annotations__': {
+                    'string_field': fqr.Field[str],
+                    'stringField': fqr.Field[str],
+                    },
+                '__module__': self.__module__
+                },
+            lazy=True
+            )
+        for _ in range(2):
+            self.assertRaises(
+                fqr.objects.exc.IncorrectCasingError,
+                lambda: cls.fields
+                )
+
+    def test_09_deferred_field(self):
+        """Test field of lazy class read after finalization."""
+
+        cls = self.mcs(
+            'LazyFieldTest',
+            (fqr.Object, ),
+            {
+                '__annotations__': {'string_field': fqr.Field[str]},
+                '__module__': self.__module__
+                },
+            lazy=True
+            )
+        self.assertIs(
+            cls.string_field,
+            cls.__dataclass_fields__['string_field']
+            )
+
+    def test_10_stale_placeholder(self):
+        """Test placeholder resolves once its owner is finalized."""
+
+        cls = self.mcs(
+            'LazyStaleTest',
+            (fqr.Object, ),
+            {
+                '__annotations__': {'string_field': fqr.Field[str]},
+                '__module__': self.__module__
+                },
+            lazy=True
+            )
+        placeholder = type.__getattribute__(cls, '__dict__')['fields']
+        self.assertTupleEqual(cls.fields, ('string_field', ))
+        self.assertIs(placeholder.__get__(None, cls), cls.fields)
+
+    def test_11_benchmark(self):
+        """Test benchmark harness times eager and lazy imports."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark(2)),
+            {
+                'import_eager',
+                'import_lazy',
+                'first_use_eager',
+                'first_use_lazy'
+                }
+            )
+
+    def test_12_benchmark_checks(self):
+        """Test benchmark harness times type checks."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_checks(1)),
+            {
+                'isinstance_object',
+                'isinstance_derivative',
+                'issubclass_object',
+                'is_object'
+                }
+            )
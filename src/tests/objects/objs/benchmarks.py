@@ -0,0 +1,170 @@
+"""
+Benchmarks for `Object` operations.
+
+---
+
+Run with:
+
+```sh
+cd src && python -m tests.objects.objs.benchmarks
+
+```
+
+"""
+
+import copy
+import pickle
+import timeit
+
+import fqr
+
+from fqr . core import lib
+
+from . import cfg
+
+
+class Constants(cfg.Constants):
+    """Constant values specific to this file."""
+
+    WideFields = 50
+    """Number of fields of `Wide`."""
+
+    NestedDepth = 8
+    """Depth of the binary tree of `Node` objects benchmarked."""
+
+
+Wide = fqr.objects.metas.Meta(
+    'Wide',
+    (fqr.Object, ),
+    {
+        '__annotations__': {
+            f'field_{i}': fqr.Field[str] if i % 2 else fqr.Field[int]
+            for i
+            in range(Constants.WideFields)
+            },
+        '__module__': __name__,
+        **{
+            f'field_{i}': str(i) if i % 2 else i
+            for i
+            in range(Constants.WideFields)
+            }
+        }
+    )
+
+
+class Node(fqr.Object):
+    """Node of a tree of nested `Objects`."""
+
+    value: fqr.Field[int] = 0
+    children: fqr.Field[list['Node']] = []
+
+
+def _tree(depth: int) -> Node:
+    return Node(
+        value=depth,
+        children=[_tree(depth - 1), _tree(depth - 1)] if depth else []
+        )
+
+
+def _time(fn: lib.t.Callable[[], lib.t.Any], n: int) -> float:
+    return min(timeit.repeat(fn, number=n, repeat=5)) / n * 1e6
+
+
+def benchmark_copy(n: int = 1000) -> dict[str, float]:
+    """
+    Return mean µs per copy of a wide and a deeply nested `Object`, \
+    alongside re-instantiation from `dict()` for reference.
+
+    """
+
+    wide = Wide()
+    tree = _tree(Constants.NestedDepth)
+    return {
+        'copy_wide': _time(lambda: copy.copy(wide), n),
+        'deepcopy_wide': _time(lambda: copy.deepcopy(wide), n),
+        'init_wide': _time(lambda: Wide(dict(wide)), n),
+        'copy_nested': _time(lambda: copy.copy(tree), n),
+        'deepcopy_nested': _time(lambda: copy.deepcopy(tree), n),
+        }
+
+
+def benchmark_pickle(n: int = 1000) -> dict[str, float]:
+    """
+    Return bytes and mean µs per pickle round trip of a wide and a \
+    deeply nested `Object`, alongside pickling `dict()` for reference.
+
+    """
+
+    results: dict[str, float] = {}
+    for name, object_ in (
+        ('wide', Wide()),
+        ('nested', _tree(Constants.NestedDepth))
+        ):
+        dumped = pickle.dumps(object_)
+        results[f'bytes_{name}'] = len(dumped)
+        results[f'bytes_dict_{name}'] = len(pickle.dumps(object_.to_dict()))
+        results[f'dumps_{name}'] = _time(lambda: pickle.dumps(object_), n)
+        results[f'loads_{name}'] = _time(lambda: pickle.loads(dumped), n)
+    return results
+
+
+def benchmark_merge(n: int = 1000) -> dict[str, float]:
+    """
+    Return mean µs per merge of a partial update into a wide `Object`, \
+    for each operator and for `merge()` of `n` aligned pairs, \
+    alongside re-instantiation from merged `dicts` for reference.
+
+    """
+
+    base = Wide()
+    update = Wide(field_0=1, field_1='a', field_2=2)
+    merged = {
+        **dict(base),
+        **{k: v for k, v in dict(update).items() if base[k] != v}
+        }
+    bases = [Wide() for _ in range(n)]
+    updates = [update] * n
+
+    def _ilshift() -> None:
+        object_ = base
+        object_ <<= update
+
+    def _irshift() -> None:
+        object_ = base
+        object_ >>= update
+
+    return {
+        'lshift': _time(lambda: base << update, n),
+        'rshift': _time(lambda: base >> update, n),
+        'ilshift': _time(_ilshift, n),
+        'irshift': _time(_irshift, n),
+        'merge': _time(lambda: Wide.merge(bases, updates), 1) / n,
+        'merge_inplace': (
+            _time(lambda: Wide.merge(bases, updates, inplace=True), 1) / n
+            ),
+        'init_merged': _time(lambda: Wide(merged), n),
+        }
+
+
+def benchmark_trusted(n: int = 1000) -> dict[str, float]:
+    """
+    Return mean µs per instantiation of a wide `Object` from \
+    trusted values, alongside the validating constructor.
+
+    """
+
+    values = dict(Wide())
+    row = tuple(values.values())
+    return {
+        'init': _time(lambda: Wide(values), n),
+        'init_kwargs': _time(lambda: Wide(**values), n),
+        'from_trusted': _time(lambda: Wide.from_trusted(values), n),
+        'from_tuple': _time(lambda: Wide.from_tuple(row), n),
+        }
+
+
+if __name__ == '__main__':
+    fqr.log.info({'us_per_copy': benchmark_copy()})
+    fqr.log.info({'pickle': benchmark_pickle()})
+    fqr.log.info({'us_per_merge': benchmark_merge()})
+    fqr.log.info({'us_per_init': benchmark_trusted()})
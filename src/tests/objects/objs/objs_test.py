@@ -1,14 +1,18 @@
 """Module objs unit tests."""
 
+import copy
 import pickle
 import unittest
 
+from unittest import mock
+
 import fqr
 
 from fqr . core import lib
 
 from ... import mocking
 
+from . import benchmarks
 from . import cfg
 
 
@@ -16,6 +20,22 @@ class Constants(cfg.Constants):
     """Constant values specific to unit tests in this file."""
 
 
+class SlottedPet(fqr.Object):
+    """`Object` with a slot that is not a field."""
+
+    __slots__ = ('_extra', )
+
+    name: fqr.Field[str] = 'pet'
+
+
+class ImmutableDeriv(fqr.FrozenObject):
+    """`FrozenObject` with only immutable field values."""
+
+    int_field: fqr.Field[int] = 0
+    tuple_field: fqr.Field[tuple['ImmutableDeriv', ...]] = ()
+    any_field: fqr.Field[lib.t.Any] = None
+
+
 class TestObjectBase(unittest.TestCase):
     """Fixture for testing `Object` base functionality."""
 
@@ -271,6 +291,873 @@ class TestObject(unittest.TestCase):
             lambda: self.object_.pop('not_a_real_field')
             )
 
+    def test_16_bool(self):
+        """Test `Object.__bool__()` is `False` for default values."""
+
+        self.assertFalse(mocking.examples.Pet())
+
+    def test_17_bool(self):
+        """Test `Object.__bool__()` is `True` for non-default values."""
+
+        self.assertTrue(mocking.examples.Pet(name='Fido'))
+
+    def test_18_bool(self):
+        """Test `Object.__bool__()` reflects redefined default values."""
+
+        class _Pet(fqr.Object):
+            name: fqr.Field[str]
+
+        bool(_Pet())
+        _Pet['name'] = fqr.Field(name='name', type_=str, default='Fido')
+        self.assertFalse(_Pet(name='Fido'))
+
+    def test_19_sub(self):
+        """Test `Object.__sub__()` returns changed values of other."""
+
+        other = self.object_.copy()
+        other.str_field = 'abc'
+        self.assertDictEqual(self.object_ - other, {'str_field': 'abc'})
+
+    def test_20_changed_fields(self):
+        """Test no fields changed after instantiation."""
+
+        self.assertTupleEqual(self.cls(str_field='abc').changed_fields(), ())
+
+    def test_21_changed_fields(self):
+        """Test fields changed after instantiation tracked."""
+
+        self.object_.str_field = 'abc'
+        self.object_['int_field'] = 3
+        self.assertTupleEqual(
+            self.object_.changed_fields(),
+            ('int_field', 'str_field')
+            )
+
+    def test_22_changed_fields(self):
+        """Test fields changed for rebased class tracked."""
+
+        trip = mocking.TripDeriv()
+        trip.str_field = 'abc'
+        trip.bob = 'abc'
+        self.assertTupleEqual(
+            trip.changed_fields(),
+            ('bob', 'str_field')
+            )
+
+    def test_23_delta(self):
+        """Test `Object.delta()` only includes changed fields."""
+
+        pet = mocking.examples.Pet(id_='abc')
+        pet.in_ = 'timeout'
+        self.assertDictEqual(pet.delta(camel_case=True), {'in': 'timeout'})
+
+    def test_24_mark_clean(self):
+        """Test `Object.mark_clean()` resets changed fields."""
+
+        self.object_.str_field = 'abc'
+        self.object_.mark_clean()
+        self.assertDictEqual(self.object_.delta(), {})
+
+    def test_25_changed_fields(self):
+        """Test no fields changed after unpickling."""
+
+        self.object_.str_field = 'abc'
+        self.assertTupleEqual(
+            pickle.loads(pickle.dumps(self.object_)).changed_fields(),
+            ()
+            )
+
+    def test_26_copy(self):
+        """Test `Object.__copy__()` is shallow."""
+
+        trip = mocking.TripDeriv()
+        trip_copy = copy.copy(trip)
+        self.assertTrue(
+            trip_copy == trip
+            and trip_copy.new_deriv is trip.new_deriv
+            )
+
+    def test_27_copy(self):
+        """Test `Object.__copy__()` preserves changed fields."""
+
+        self.object_.str_field = 'abc'
+        self.assertTupleEqual(
+            self.object_.copy().changed_fields(),
+            ('str_field', )
+            )
+
+    def test_28_deepcopy(self):
+        """Test `Object.__deepcopy__()` clones nested objects."""
+
+        trip = mocking.TripDeriv()
+        trip_copy = copy.deepcopy(trip)
+        self.assertTrue(
+            trip_copy == trip
+            and trip_copy.new_deriv is not trip.new_deriv
+            and trip_copy.new_deriv == trip.new_deriv
+            and trip_copy.dict_field is not trip.dict_field
+            )
+
+    def test_29_deepcopy(self):
+        """Test `Object.__deepcopy__()` preserves shared references."""
+
+        obj = mocking.NewDeriv()
+        self.object_.forward_ref_field = [obj, obj]
+        copied = copy.deepcopy(self.object_).forward_ref_field
+        self.assertTrue(copied[0] is copied[1] and copied[0] is not obj)
+
+    def test_30_deepcopy(self):
+        """Test `Object.__deepcopy__()` without a memo."""
+
+        self.assertEqual(self.object_.__deepcopy__(), self.object_)
+
+    def test_31_pickle(self):
+        """Test `Object` pickles field values positionally."""
+
+        self.object_.forward_ref_field = [mocking.NewDeriv()]
+        unpickled = pickle.loads(pickle.dumps(self.object_))
+        self.assertTrue(
+            unpickled == self.object_
+            and not unpickled.changed_fields()
+            )
+
+    def test_32_pickle(self):
+        """Test compact pickle smaller than `dict` state pickle."""
+
+        self.assertLess(
+            len(pickle.dumps(self.object_)),
+            len(pickle.dumps((self.object_.__class__, dict(self.object_))))
+            )
+
+    def test_33_pickle(self):
+        """Test unpickling state of a different schema raises."""
+
+        func, args, (version, values) = self.object_.__reduce_ex__(
+            pickle.DEFAULT_PROTOCOL
+            )
+        self.assertRaises(
+            fqr.objects.exc.IncompatibleSchemaError,
+            func(*args).__setstate__,
+            (version + 1, values)
+            )
+
+    def test_34_setstate(self):
+        """Test `Object.__setstate__()` accepts legacy `dict` state."""
+
+        obj = object.__new__(self.cls)
+        obj.__setstate__(self.object_.__getstate__())
+        self.assertTrue(obj == self.object_ and not obj.changed_fields())
+
+    def test_35_ilshift(self):
+        """Test `<<=` interpolates in place, tracking changed fields."""
+
+        object_ = self.cls()
+        object_ <<= self.object_
+        self.assertTupleEqual(
+            (object_.str_field, object_.changed_fields()),
+            ('cba', ('str_field', ))
+            )
+
+    def test_36_irshift(self):
+        """Test `>>=` overwrites in place."""
+
+        object_ = self.object_
+        object_ >>= self.cls(int_field=3)
+        self.assertTupleEqual(
+            (object_.str_field, object_.int_field, object_ is self.object_),
+            ('cba', 3, True)
+            )
+
+    def test_37_lshift(self):
+        """Test `<<` tracks changed fields of self and other."""
+
+        self.object_.mark_clean()
+        object_ = self.object_ << self.cls(int_field=3)
+        self.assertTupleEqual(object_.changed_fields(), ('int_field', ))
+
+    def test_38_rshift(self):
+        """Test `>>` validates values of Objects of a different class."""
+
+        other = mocking.DubDeriv(str_field='xyz')
+        object_ = self.object_ >> other
+        self.assertTupleEqual(
+            (object_.str_field, object_.__class__),
+            ('xyz', self.cls)
+            )
+
+    def test_39_merge(self):
+        """Test `Object.merge()` merges aligned lists of Objects."""
+
+        objects = [self.cls(), self.cls(int_field=5)]
+        merged = self.cls.merge(objects, [self.object_, self.object_])
+        self.assertListEqual(
+            [(o.str_field, o.int_field) for o in merged],
+            [('cba', 2), ('cba', 5)]
+            )
+
+    def test_40_merge(self):
+        """Test `Object.merge()` overwrites in place if specified."""
+
+        objects = [self.cls(), self.cls(int_field=5)]
+        merged = self.cls.merge(
+            objects,
+            [self.object_, self.object_],
+            overwrite=True,
+            inplace=True
+            )
+        self.assertTrue(
+            all(a is b for a, b in zip(merged, objects))
+            and all(o.str_field == 'cba' for o in objects)
+            )
+
+    def test_41_merge(self):
+        """Test `Object.merge()` raises for lists of different length."""
+
+        self.assertRaises(
+            ValueError,
+            self.cls.merge,
+            [self.object_],
+            []
+            )
+
+    def test_42_copy(self):
+        """Test `Object.__copy__()` copies other slots after init."""
+
+        pet = SlottedPet()
+        pet._extra = {'a': 1}
+        with mock.patch.object(SlottedPet, '__post_init__') as post_init:
+            pet_copy = copy.copy(pet)
+        self.assertTrue(post_init.called and pet_copy._extra is pet._extra)
+
+    def test_43_deepcopy(self):
+        """Test `Object.__deepcopy__()` copies other slots after init."""
+
+        pet = SlottedPet()
+        pet._extra = {'a': 1}
+        with mock.patch.object(SlottedPet, '__post_init__') as post_init:
+            pet_copy = copy.deepcopy(pet)
+        self.assertTrue(
+            post_init.called
+            and pet_copy._extra == pet._extra
+            and pet_copy._extra is not pet._extra
+            )
+
+    def test_44_copy(self):
+        """Test unset slots are left unset by copies."""
+
+        pet = SlottedPet()
+        self.assertFalse(
+            hasattr(copy.copy(pet), '_extra')
+            or hasattr(copy.deepcopy(pet), '_extra')
+            )
+
+    def test_45_benchmark_copy(self):
+        """Test benchmark harness times copies."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_copy(1)),
+            {
+                'copy_wide',
+                'deepcopy_wide',
+                'init_wide',
+                'copy_nested',
+                'deepcopy_nested'
+                }
+            )
+
+    def test_46_pickle(self):
+        """Test `Object` pickles other slots set on the instance."""
+
+        pet = SlottedPet()
+        pet._extra = {'a': 1}
+        self.assertDictEqual(pickle.loads(pickle.dumps(pet))._extra, {'a': 1})
+
+    def test_47_pickle(self):
+        """Test unset slots are left unset on unpickling."""
+
+        self.assertFalse(
+            hasattr(pickle.loads(pickle.dumps(SlottedPet())), '_extra')
+            )
+
+    def test_48_benchmark_pickle(self):
+        """Test benchmark harness measures pickles."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_pickle(1)),
+            {
+                f'{metric}_{name}'
+                for metric
+                in ('bytes', 'bytes_dict', 'dumps', 'loads')
+                for name
+                in ('wide', 'nested')
+                }
+            )
+
+    def test_49_benchmark_merge(self):
+        """Test benchmark harness times merges."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_merge(2)),
+            {
+                'lshift',
+                'rshift',
+                'ilshift',
+                'irshift',
+                'merge',
+                'merge_inplace',
+                'init_merged'
+                }
+            )
+
+    def test_50_benchmark_trusted(self):
+        """Test benchmark harness times trusted instantiation."""
+
+        self.assertSetEqual(
+            set(benchmarks.benchmark_trusted(2)),
+            {'init', 'init_kwargs', 'from_trusted', 'from_tuple'}
+            )
+
+
+class TestTrustedObject(unittest.TestCase):
+    """Fixture for testing trusted `Object` constructors."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.Derivative
+        self.object_ = self.cls(str_field='cba', required_field=1)
+        self.values = {
+            field: getattr(self.object_, field)
+            for field
+            in self.cls.fields
+            }
+        fqr.objects.cfg.Constants.TRUSTED_ASSERTIONS = True
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        fqr.objects.cfg.Constants.TRUSTED_ASSERTIONS = False
+        return super().tearDown()
+
+    def test_01_from_trusted(self):
+        """Test `Object.from_trusted()` matches regular instantiation."""
+
+        object_ = self.cls.from_trusted(self.values)
+        self.assertTupleEqual(
+            (object_.to_dict(), object_.changed_fields()),
+            (self.object_.to_dict(), ())
+            )
+
+    def test_02_from_trusted(self):
+        """Test `Object.from_trusted()` sets defaults of missing fields."""
+
+        self.assertEqual(
+            self.cls.from_trusted({'str_field': 'cba'}).int_field,
+            self.cls.int_field.default
+            )
+
+    def test_03_from_tuple(self):
+        """Test `Object.from_tuple()` matches regular instantiation."""
+
+        self.assertDictEqual(
+            self.cls.from_tuple(tuple(self.values.values())).to_dict(),
+            self.object_.to_dict()
+            )
+
+    def test_04_from_trusted(self):
+        """Test `Object.from_trusted()` asserts fields are valid."""
+
+        self.assertRaises(
+            AssertionError,
+            self.cls.from_trusted,
+            {'strField': 'cba'}
+            )
+
+    def test_05_from_tuple(self):
+        """Test `Object.from_tuple()` asserts values are valid."""
+
+        self.assertRaises(
+            AssertionError,
+            self.cls.from_tuple,
+            tuple({**self.values, 'int_field': 'cba'}.values())
+            )
+
+    def test_06_from_tuple(self):
+        """Test `Object.from_tuple()` asserts count of values."""
+
+        self.assertRaises(
+            AssertionError,
+            self.cls.from_tuple,
+            tuple(self.values.values())[:-1]
+            )
+
+    def test_07_from_trusted(self):
+        """Test `FrozenObject.from_trusted()` runs `__post_init__()`."""
+
+        class PostInitDeriv(mocking.FrozenDeriv):
+            def __post_init__(self) -> None:
+                self.int_field = len(self.id_)
+
+        object_ = PostInitDeriv.from_trusted({'id_': 'abcd'})
+        self.assertEqual(object_.int_field, 4)
+
+
+class TestFrozenObject(unittest.TestCase):
+    """Fixture for testing `FrozenObject`."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.FrozenDeriv
+        self.object_ = self.cls(
+            id_='abc',
+            list_field=['a'],
+            dict_field={'a': 1},
+            set_field={1},
+            frozen_derivs=[self.cls(id_='xyz')]
+            )
+        return super().setUp()
+
+    def test_01_setattr(self):
+        """Test fields cannot be set after instantiation."""
+
+        self.assertRaises(
+            fqr.objects.exc.FrozenObjectError,
+            setattr,
+            self.object_,
+            'int_field',
+            3
+            )
+
+    def test_02_setitem(self):
+        """Test fields cannot be set dict style after instantiation."""
+
+        self.assertRaises(
+            fqr.objects.exc.FrozenObjectError,
+            self.object_.__setitem__,
+            'int_field',
+            3
+            )
+
+    def test_03_delattr(self):
+        """Test fields cannot be deleted."""
+
+        self.assertRaises(
+            fqr.objects.exc.FrozenObjectError,
+            delattr,
+            self.object_,
+            'int_field'
+            )
+
+    def test_04_post_init(self):
+        """Test fields can still be set during `__post_init__()`."""
+
+        class PostInitDeriv(self.cls):
+            def __post_init__(self) -> None:
+                self.int_field = len(self.id_)
+
+        self.assertEqual(PostInitDeriv(id_='abcd').int_field, 4)
+
+    def test_05_hash(self):
+        """Test cached `hash()` matches that of `Object`."""
+
+        self.assertTupleEqual(
+            (hash(self.object_), hash(self.object_)),
+            (fqr.Object.__hash__(self.object_), ) * 2
+            )
+
+    def test_06_to_dict(self):
+        """Test `to_dict()` output is cached."""
+
+        self.object_.to_dict()
+        self.assertIn((False, True), self.object_.__cache__)
+
+    def test_07_to_dict(self):
+        """Test cached `to_dict()` output cannot be modified by callers."""
+
+        self.object_.to_dict()['id'] = 'cba'
+        self.assertEqual(self.object_.to_dict()['id'], 'abc')
+
+    def test_08_copy(self):
+        """Test shallow copies share the instance itself."""
+
+        self.assertTrue(
+            copy.copy(self.object_)
+            is self.object_.copy()
+            is self.object_
+            )
+
+    def test_09_pickle(self):
+        """Test unpickled instances are still frozen."""
+
+        object_ = pickle.loads(pickle.dumps(self.object_))
+        self.assertRaises(
+            fqr.objects.exc.FrozenObjectError,
+            setattr,
+            object_,
+            'int_field',
+            3
+            )
+
+    def test_10_pickle(self):
+        """Test unpickled instances cache computed output."""
+
+        object_ = pickle.loads(pickle.dumps(self.object_))
+        self.assertDictEqual(object_.to_dict(), self.object_.to_dict())
+
+    def test_11_setstate(self):
+        """Test `__setstate__()` accepts legacy `dict` state."""
+
+        object_ = object.__new__(self.cls)
+        object_.__setstate__(self.object_.__getstate__())
+        self.assertEqual(object_.to_dict(), self.object_.to_dict())
+
+    def test_12_lshift(self):
+        """Test `<<` returns a new instance with interpolated values."""
+
+        object_ = self.object_ << self.cls(id_='cba', int_field=3)
+        self.assertTupleEqual(
+            (object_.id_, object_.int_field, self.object_.int_field),
+            ('abc', 3, 2)
+            )
+
+    def test_13_lshift(self):
+        """Test `<<` returns self if no values would change."""
+
+        self.assertIs(self.object_ << self.cls(id_='cba'), self.object_)
+
+    def test_14_lshift(self):
+        """Test `<<` raises for objects with different fields."""
+
+        self.assertRaises(
+            fqr.objects.exc.InvalidObjectComparisonError,
+            lambda: self.object_ << mocking.NewDeriv()
+            )
+
+    def test_15_rshift(self):
+        """Test `>>` returns a new instance with overwritten values."""
+
+        self.assertEqual(
+            (self.object_ >> self.cls(id_='cba')).id_,
+            'cba'
+            )
+
+    def test_16_rshift(self):
+        """Test `>>` returns self if no values would change."""
+
+        self.assertIs(self.object_ >> self.cls(id_='abc'), self.object_)
+
+    def test_17_intern(self):
+        """Test equal instances are interned to the same instance."""
+
+        self.assertIs(
+            self.object_.intern(),
+            pickle.loads(pickle.dumps(self.object_)).intern()
+            )
+
+    def test_18_intern(self):
+        """Test unequal instances are not interned to the same instance."""
+
+        self.assertIsNot(
+            self.object_.intern(),
+            (self.object_ >> self.cls(id_='cba')).intern()
+            )
+
+    def test_19_intern(self):
+        """Test instances with mutable `Objects` are interned by identity."""
+
+        new_deriv = mocking.NewDeriv()
+        self.assertTupleEqual(
+            (
+                self.cls(id_='abc', new_deriv=new_deriv).intern()
+                is self.cls(id_='abc', new_deriv=new_deriv).intern(),
+                self.cls(id_='abc', new_deriv=new_deriv).intern()
+                is self.cls(id_='abc', new_deriv=mocking.NewDeriv()).intern()
+                ),
+            (True, False)
+            )
+
+    def test_20_intern(self):
+        """Test instances with unhashable values are not interned."""
+
+        object_ = self.cls(id_='abc', any_field=bytearray())
+        self.assertIs(object_.intern(), object_)
+
+    def test_21_hash(self):
+        """Test `hash()` is not cached during `__post_init__()`."""
+
+        class PostInitDeriv(self.cls):
+            def __post_init__(self) -> None:
+                hash(self)
+                self.id_ = self.id_.upper()
+
+        self.assertEqual(
+            hash(PostInitDeriv(id_='abc')),
+            hash(self.cls(id_='ABC'))
+            )
+
+    def test_22_delta(self):
+        """Test `delta()` is empty, as fields never change."""
+
+        self.assertDictEqual(self.object_.delta(), {})
+
+    def test_23_frame(self):
+        """Test instances restored from an `ObjectFrame` cache output."""
+
+        frame = fqr.objects.ObjectFrame(self.cls)
+        frame.append(self.object_)
+        self.assertTupleEqual(
+            (hash(frame[0]), frame[0].to_dict()),
+            (hash(self.object_), self.object_.to_dict())
+            )
+
+    def test_24_ilshift(self):
+        """Test `<<=` returns a new instance, leaving self unchanged."""
+
+        object_ = self.object_
+        object_ <<= self.cls(id_='cba', int_field=3)
+        self.assertTupleEqual(
+            (object_.int_field, self.object_.int_field),
+            (3, 2)
+            )
+
+    def test_25_irshift(self):
+        """Test `>>=` returns a new, frozen instance."""
+
+        object_ = self.object_
+        object_ >>= self.cls(id_='cba')
+        self.assertRaises(
+            fqr.objects.exc.FrozenObjectError,
+            setattr,
+            object_,
+            'id_',
+            'abc'
+            )
+
+    def test_26_rshift(self):
+        """Test `>>` accepts values of Objects of a different class."""
+
+        class SubDeriv(self.cls):
+            sub_field: fqr.Field[int] = 1
+
+        self.assertEqual((self.object_ >> SubDeriv(id_='cba')).id_, 'cba')
+
+    def test_27_delattr(self):
+        """Test non-field attributes can still be deleted."""
+
+        hash(self.object_)
+        del self.object_.__cache__
+        self.assertEqual(hash(self.object_), fqr.Object.__hash__(self.object_))
+
+    def test_28_to_dict(self):
+        """Test nested cached `to_dict()` output cannot be modified."""
+
+        as_dict = self.object_.to_dict()
+        as_dict['list_field'].append('b')
+        as_dict['frozen_derivs'][0]['id'] = 'zyx'
+        self.assertDictEqual(
+            self.object_.to_dict(),
+            self.cls(
+                id_='abc',
+                list_field=['a'],
+                dict_field={'a': 1},
+                set_field={1},
+                frozen_derivs=[self.cls(id_='xyz')]
+                ).to_dict()
+            )
+
+    def test_29_deepcopy(self):
+        """Test deep copies do not share mutable values."""
+
+        object_ = copy.deepcopy(self.object_)
+        self.assertTrue(
+            object_ == self.object_
+            and object_ is not self.object_
+            and object_.list_field is not self.object_.list_field
+            )
+
+    def test_30_deepcopy(self):
+        """Test deep copies of wholly immutable instances share them."""
+
+        object_ = ImmutableDeriv(
+            int_field=1,
+            tuple_field=(ImmutableDeriv(), ),
+            )
+        self.assertIs(copy.deepcopy(object_), object_)
+
+    def test_31_deepcopy(self):
+        """Test deep copies are still frozen after `__post_init__()`."""
+
+        class PostInitDeriv(self.cls):
+            def __post_init__(self) -> None:
+                self.int_field = len(self.id_)
+
+        object_ = copy.deepcopy(PostInitDeriv(id_='abcd'))
+        self.assertRaises(
+            fqr.objects.exc.FrozenObjectError,
+            setattr,
+            object_,
+            'int_field',
+            3
+            )
+
+    def test_32_intern(self):
+        """Test values equal across types are interned apart."""
+
+        objects = [
+            ImmutableDeriv(any_field=value).intern()
+            for value
+            in (True, 1, 1.0, (True, ), (1, ), frozenset({True}))
+            ]
+        self.assertEqual(len({id(object_) for object_ in objects}), 6)
+
+
+class TestLazyDecoding(unittest.TestCase):
+    """Fixture for testing lazy decoding of nested `Object` fields."""
+
+    def setUp(self) -> None:
+        self.cls = mocking.FrozenDeriv
+        self.frozen = self.cls(
+            id_='abc',
+            list_field=['a'],
+            dict_field={'a': 1},
+            new_deriv=mocking.NewDeriv(anti_field_1='xyz')
+            )
+        self.raw = {
+            k: v
+            for k, v
+            in fqr.core.codecs.utl.loads_json(
+                fqr.core.codecs.utl.serialize(self.frozen)
+                ).items()
+            if v is not None
+            }
+        self.trip = mocking.TripDeriv(
+            new_deriv=mocking.NewDeriv(anti_field_1='xyz'),
+            generic_dict_field={'a': 1.5},
+            required_field=2
+            )
+        fqr.core.codecs.cfg.Constants.LAZY_DECODING = True
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        fqr.core.codecs.cfg.Constants.LAZY_DECODING = False
+        return super().tearDown()
+
+    def test_01_lazy(self):
+        """Test nested fields are left as raw values until accessed."""
+
+        object_ = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        self.assertIsInstance(
+            object_.__clean__[self.cls.fields.index('new_deriv')],
+            fqr.core.codecs.obj.LazyValue
+            )
+
+    def test_02_lazy_access(self):
+        """Test lazy fields are parsed on first access."""
+
+        object_ = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        self.assertIsInstance(object_.new_deriv, mocking.NewDeriv)
+        self.assertIsInstance(
+            object.__getattribute__(object_, 'new_deriv'),
+            mocking.NewDeriv
+            )
+
+    def test_03_lazy_to_dict(self):
+        """Test lazy fields are consistent with `to_dict()`."""
+
+        object_ = fqr.core.codecs.utl.parse(
+            fqr.core.codecs.utl.loads_json(
+                fqr.core.codecs.utl.serialize(self.trip)
+                ),
+            mocking.TripDeriv
+            )
+        self.assertDictEqual(object_.to_dict(), self.trip.to_dict())
+
+    def test_04_lazy_eq(self):
+        """Test lazy fields are consistent with `__eq__()`."""
+
+        object_ = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        self.assertEqual(object_, self.frozen)
+
+    def test_05_lazy_hash(self):
+        """Test lazy fields are consistent with `__hash__()`."""
+
+        object_ = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        self.assertEqual(hash(object_), hash(self.frozen))
+
+    def test_06_lazy_merge(self):
+        """Test lazy fields are parsed when merged."""
+
+        object_ = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        other = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        self.assertIs(object_ << other, object_)
+        self.assertEqual(
+            (self.cls(id_='abc') << object_).to_dict(),
+            self.frozen.to_dict()
+            )
+
+    def test_07_lazy_intern(self):
+        """Test lazy fields are parsed when interned."""
+
+        self.raw.pop('new_deriv')
+        object_ = fqr.core.codecs.utl.parse(self.raw, self.cls)
+        self.assertIs(
+            object_.intern(),
+            self.cls(id_='abc', list_field=['a'], dict_field={'a': 1}).intern()
+            )
+
+    def test_08_lazy_invalid(self):
+        """Test invalid lazy fields raise on first access."""
+
+        object_ = fqr.core.codecs.utl.parse(
+            {'id': 'abc', 'newDeriv': {'antiField2': 'abc'}},
+            self.cls
+            )
+        self.assertRaises(
+            fqr.objects.exc.IncorrectTypeError,
+            lambda: object_.new_deriv
+            )
+
+    def test_09_lazy_pickle(self):
+        """Test lazy fields are parsed when pickled."""
+
+        object_ = pickle.loads(
+            pickle.dumps(fqr.core.codecs.utl.parse(self.raw, self.cls))
+            )
+        self.assertIsInstance(
+            object.__getattribute__(object_, 'new_deriv'),
+            mocking.NewDeriv
+            )
+
+    def test_10_lazy_from_trusted(self):
+        """Test lazy values are parsed on access if trusted."""
+
+        new_deriv = mocking.NewDeriv(anti_field_1='a')
+        with mock.patch.object(
+            fqr.objects.objs.obj.Constants,
+            'TRUSTED_ASSERTIONS',
+            True
+            ):
+            object_ = mocking.TripDeriv.from_trusted(
+                {
+                    'new_deriv': fqr.core.codecs.obj.LazyValue(
+                        fqr.core.codecs.utl.loads_json(
+                            fqr.core.codecs.utl.serialize(new_deriv)
+                            )
+                        )
+                    }
+                )
+        self.assertEqual(object_.new_deriv, new_deriv)
+
+    def test_11_lazy_copy(self):
+        """Test lazy fields are copied undecoded."""
+
+        object_ = fqr.core.codecs.utl.parse(
+            fqr.core.codecs.utl.loads_json(
+                fqr.core.codecs.utl.serialize(self.trip)
+                ),
+            mocking.TripDeriv
+            )
+        self.assertTrue(
+            copy.copy(object_) == self.trip
+            and copy.deepcopy(object_) == self.trip
+            )
+
 
 class TestObjectDocumentationExamples(unittest.TestCase):
     """Test examples provided in Object __doc__."""
@@ -63,7 +63,7 @@ class TestReadMe(unittest.TestCase):
             assert pet.fleas[0] is not dog.fleas[0]
 
             # Automatic memory optimization.
-            assert Flea().__sizeof__() == (len(Flea.__slots__) * 8) + 16 == 24
+            assert Flea().__sizeof__() == (len(Flea.__slots__) * 8) + 24 == 32
 
             class Flet(Flea, Pet):
                 ...
@@ -71,8 +71,8 @@ class TestReadMe(unittest.TestCase):
             class Pea(Pet, Flea):
                 ...
 
-            assert Flet().__sizeof__() == (len(Flet.__base__.__slots__) * 8) + 16 == 72
-            assert Pea().__sizeof__() == (len(Pea.__base__.__slots__) * 8) + 16 == 72
+            assert Flet().__sizeof__() == (len(Flet.__base__.__slots__) * 8) + 24 == 80
+            assert Pea().__sizeof__() == (len(Pea.__base__.__slots__) * 8) + 24 == 80
             assert Flet().name == 'FLEA' != Pea().name
 
             # Intuitive, database agnostic query generation.